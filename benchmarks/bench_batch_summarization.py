@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Batch summarization benchmark — summarize_many against the per-document loop
+============================================================================
+
+Builds batches of synthetic articles (10 to 80 sentences each, from the
+summarization benchmark's generator) and times ``Summarizer.summarize_many``
+against calling ``Summarizer.summarize`` once per article, with the ranking
+cache disabled so that every call scores. Reports documents per second for
+each and checks that both produce the same summaries.
+
+Usage:
+    python -m benchmarks.bench_batch_summarization
+    python -m benchmarks.bench_batch_summarization --documents 10 100 1000 --method lexrank
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from benchmarks.bench_summarization import synthetic_sentences
+from modules.document import Document
+from modules.ranking_cache import RankingCache
+from modules.summarizer import Summarizer
+
+
+def synthetic_batch(count: int) -> list[dict]:
+    batch = []
+    for seed in range(count):
+        sentences = synthetic_sentences(10 + seed * 13 % 71, seed)
+        batch.append(
+            {
+                "sentences": sentences,
+                "language": "en",
+                "document": Document.from_sentences(sentences, "en"),
+            }
+        )
+    return batch
+
+
+def _best_of(repeats: int, func, *args) -> tuple[float, object]:
+    best, result = float("inf"), None
+    for _ in range(repeats):
+        started = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def _loop(summarizer: Summarizer, batch: list[dict], method: str, length: str) -> list[dict]:
+    return [summarizer.summarize(data, method, length) for data in batch]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--documents", type=int, nargs="*", default=[10, 100, 1000])
+    parser.add_argument("--method", default="extractive", choices=["extractive", "lexrank"])
+    parser.add_argument("--length", default="medium", choices=["short", "medium", "long"])
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    summarizer = Summarizer()
+    summarizer.rankings = RankingCache(max_entries=0)
+    print(f"{'documents':>10} {'loop doc/s':>11} {'batch doc/s':>12} {'speedup':>8} {'same':>5}")
+    for count in args.documents:
+        batch = synthetic_batch(count)
+        loop, expected = _best_of(args.repeats, _loop, summarizer, batch, args.method, args.length)
+        batched, results = _best_of(
+            args.repeats, summarizer.summarize_many, batch, args.method, args.length
+        )
+        same = all(a["summary"] == b["summary"] for a, b in zip(expected, results, strict=True))
+        print(
+            f"{count:>10} {count / loop:>11.0f} {count / batched:>12.0f} "
+            f"{loop / batched:>7.1f}x {'yes' if same else 'no':>5}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Extraction benchmark — HTML parsing and article extraction
+==========================================================
+
+Offline (default): builds synthetic "modern" pages of increasing size and
+times decode + parse + ``WebScraper._extract_content`` on them, with and
+without the byte-level ``<script>``/``<style>``/``<svg>`` pre-strip, and
+reports peak traced memory for each.
+
+Live (``--urls``): scrapes each URL twice — once as-is and once with
+``prefer_light_variant`` enabled — and reports bytes downloaded, wall time,
+word count and token overlap between the two extractions.
+
+Usage:
+    python -m benchmarks.bench_extraction
+    python -m benchmarks.bench_extraction --urls https://example.com/news/1 ...
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+import tracemalloc
+
+import requests
+from bs4 import BeautifulSoup
+
+from config import config
+from modules.web_scraper import WebScraper, _decode, _prestrip_html
+
+_PARAGRAPH = (
+    "<p>The committee published its findings on Tuesday, concluding that the "
+    "regional transport network needs sustained investment over the next decade "
+    "to keep pace with population growth and changing commuting patterns.</p>\n"
+)
+
+
+def synthetic_page(paragraphs: int = 30, script_kb: int = 512) -> str:
+    """Article HTML padded with inline scripts, styles and SVG like a modern news page."""
+    script = "<script>window.__STATE__=" + '{"k":"' + "x" * (script_kb * 1024) + '"};</script>\n'
+    style = "<style>" + ".c{color:#000}" * (script_kb * 16) + "</style>\n"
+    svg = '<svg viewBox="0 0 10 10">' + '<path d="M0 0L10 10"/>' * (script_kb * 8) + "</svg>\n"
+    return (
+        "<!DOCTYPE html><html><head><title>Transport report</title>"
+        f"{style}{script}</head><body><header>Site</header>{svg}"
+        f"<article><h1>Transport report</h1>{_PARAGRAPH * paragraphs}</article>"
+        f"{script}<footer>Footer</footer></body></html>"
+    )
+
+
+def _parse_and_extract(scraper: WebScraper, raw: bytes, prestrip: bool) -> dict:
+    if prestrip:
+        raw = _prestrip_html(raw, "utf-8")
+    soup = BeautifulSoup(_decode(raw, "utf-8"), "html.parser")
+    return scraper._extract_content(soup, "https://example.com/report")
+
+
+def bench_offline(repeats: int) -> None:
+    scraper = WebScraper()
+    print(f"{'page KiB':>10} {'prestrip':>9} {'ms':>9} {'peak MiB':>9} {'words':>7}")
+    for script_kb in (64, 256, 1024, 4096):
+        raw = synthetic_page(script_kb=script_kb).encode("utf-8")
+        for prestrip in (False, True):
+            best = float("inf")
+            words = 0
+            for _ in range(repeats):
+                started = time.perf_counter()
+                words = _parse_and_extract(scraper, raw, prestrip)["word_count"]
+                best = min(best, time.perf_counter() - started)
+
+            tracemalloc.start()
+            _parse_and_extract(scraper, raw, prestrip)
+            _current, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            print(
+                f"{len(raw) // 1024:>10} {'on' if prestrip else 'off':>9} "
+                f"{best * 1000:>9.1f} {peak / 2**20:>9.1f} {words:>7}"
+            )
+
+
+class _ByteCounter:
+    """Counts body bytes actually pulled off the wire via Response.iter_content."""
+
+    def __init__(self) -> None:
+        self.total = 0
+        self._original = requests.Response.iter_content
+
+    def __enter__(self) -> _ByteCounter:
+        counter = self
+        original = self._original
+
+        def counting(response, *args, **kwargs):
+            for chunk in original(response, *args, **kwargs):
+                counter.total += len(chunk)
+                yield chunk
+
+        requests.Response.iter_content = counting  # type: ignore[method-assign]
+        return self
+
+    def __exit__(self, *exc) -> None:
+        requests.Response.iter_content = self._original  # type: ignore[method-assign]
+
+
+def _scrape(url: str, prefer_light: bool) -> tuple[dict, int, float]:
+    config.scraping.prefer_light_variant = prefer_light
+    scraper = WebScraper()
+    with _ByteCounter() as counter:
+        started = time.perf_counter()
+        result = scraper.scrape_article(url)
+        elapsed = time.perf_counter() - started
+    return result, counter.total, elapsed
+
+
+def bench_live(urls: list[str]) -> None:
+    print(f"{'mode':<10} {'KiB':>8} {'seconds':>8} {'words':>7} {'overlap':>8}  url")
+    for url in urls:
+        try:
+            original, orig_bytes, orig_time = _scrape(url, prefer_light=False)
+            light, light_bytes, light_time = _scrape(url, prefer_light=True)
+        except Exception as exc:
+            print(f"{'error':<10} {url}: {exc}")
+            continue
+        a = set(original["content"].lower().split())
+        b = set(light["content"].lower().split())
+        overlap = len(a & b) / len(a | b) if a | b else 1.0
+        print(
+            f"{'original':<10} {orig_bytes / 1024:>8.0f} {orig_time:>8.2f} "
+            f"{original['word_count']:>7} {'':>8}  {url}"
+        )
+        print(
+            f"{light['extraction_method'].rsplit('+', 1)[-1]:<10} {light_bytes / 1024:>8.0f} "
+            f"{light_time:>8.2f} {light['word_count']:>7} {overlap:>8.2f}  "
+            f"{light.get('variant_url', url)}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--urls", nargs="*", help="Live URLs to compare original vs light variant")
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    if args.urls:
+        bench_live(args.urls)
+    else:
+        bench_offline(args.repeats)
+
+
+if __name__ == "__main__":
+    main()
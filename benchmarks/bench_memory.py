@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Memory benchmark — peak and retained memory of one processing task
+==================================================================
+
+Runs ``TextProcessor.process_text`` on synthetic documents of increasing size
+under ``tracemalloc`` and reports, per document:
+
+- ``peak``: the highest traced allocation while processing;
+- ``retained``: what the returned ``processed_data`` keeps alive;
+- ``as lists``: what it would keep alive with sentences and paragraphs
+  materialized as lists of strings (the representation before spans).
+
+Streaming: consumes ``TextProcessor.iter_sentences`` over the same documents,
+generated chunk by chunk so the input itself is never held in memory, and
+reports the peak — it should stay flat as the input grows.
+
+Usage:
+    python -m benchmarks.bench_memory
+    python -m benchmarks.bench_memory --sizes 1 10 --stream-sizes 10 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import tracemalloc
+from collections.abc import Iterator
+
+from benchmarks.bench_text_processing import synthetic_document
+from modules.text_processor import StreamingStatistics, TextProcessor
+
+_MB = 2**20
+
+
+def measure(processor: TextProcessor, text: str) -> tuple[float, float, float]:
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    tracemalloc.reset_peak()
+
+    processed = processor.process_text(text)
+    current, peak = tracemalloc.get_traced_memory()
+    retained = current - baseline
+
+    materialized = [list(processed["sentences"]), list(processed["paragraphs"])]
+    as_lists = tracemalloc.get_traced_memory()[0] - baseline
+    del materialized, processed
+    tracemalloc.stop()
+    return (peak - baseline) / _MB, retained / _MB, as_lists / _MB
+
+
+def synthetic_chunks(megabytes: float) -> Iterator[str]:
+    """``synthetic_document(megabytes)`` produced one 64 KiB block at a time."""
+    block = synthetic_document(1 / 16)
+    for _ in range(max(1, round(megabytes * 16))):
+        yield block
+
+
+def measure_stream(processor: TextProcessor, megabytes: float) -> tuple[float, int]:
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    tracemalloc.reset_peak()
+
+    statistics = StreamingStatistics()
+    for _ in processor.iter_sentences(synthetic_chunks(megabytes), statistics=statistics):
+        pass
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return (peak - baseline) / _MB, statistics.sentence_count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--sizes", type=float, nargs="*", default=[1, 4, 10])
+    parser.add_argument("--stream-sizes", type=float, nargs="*", default=[1, 10, 50])
+    args = parser.parse_args()
+
+    processor = TextProcessor()
+    processor.process_text(synthetic_document(0.01))  # load lazy resources untraced
+    print(f"{'MB':>6} {'peak MB':>8} {'retained MB':>12} {'as lists MB':>12}")
+    for size in args.sizes:
+        text = synthetic_document(size)
+        peak, retained, as_lists = measure(processor, text)
+        print(
+            f"{len(text.encode('utf-8')) / _MB:>6.1f} {peak:>8.1f} {retained:>12.1f} {as_lists:>12.1f}"
+        )
+
+    print()
+    print(f"{'MB':>6} {'stream peak MB':>15} {'sentences':>10}")
+    for size in args.stream_sizes:
+        peak, count = measure_stream(processor, size)
+        print(f"{size:>6.1f} {peak:>15.1f} {count:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Segmentation benchmark — regex segmenter against punkt
+======================================================
+
+For each language, builds a synthetic article (news-style paragraphs with
+abbreviations, initials, numbers, quotes and hard-wrapped lines), splits it
+with the punkt tokenizer and with ``modules.sentence_segmenter``, and reports:
+
+- throughput of each, in MB/s;
+- boundary agreement: precision / recall / F1 of the regex segmenter's
+  sentence end offsets, taking punkt's as the reference.
+
+Languages without a punkt model are split by English punkt, which is what
+the reference means there (it finds no boundary in Chinese at all). When the
+punkt models are not vendored, an untrained ``PunktSentenceTokenizer`` is
+used and labelled as such.
+
+Usage:
+    python -m benchmarks.bench_segmentation
+    python -m benchmarks.bench_segmentation --megabytes 4 --repeats 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from modules.nltk_resources import NLTKResourceError, sentence_tokenizer
+from modules.sentence_segmenter import sentence_segmenter
+
+SAMPLES: dict[str, str] = {
+    "en": (
+        "Mr. Carter, the committee chair, published the findings on Tuesday. "
+        "The report cites Dr. A. Wright of the Univ. of Leeds, e.g. on fares.\n"
+        "Ridership grew 4.5% in 2024. Costs rose too... Officials expect a new "
+        'timetable by Jan. 2026. "Is that enough?" asked Sen. Hill. It is not, '
+        "say critics at Smith & Co. in the U.S. and abroad.\n\n"
+    ),
+    "es": (
+        "El Sr. García presentó el informe el martes en Madrid. Según la Dra. "
+        "López, la red necesita inversión, p. ej. en cercanías.\nEl número de "
+        "viajeros creció un 4,5% en 2024. ¿Es suficiente? Los críticos dicen que "
+        "no. El plan, pág. 12, fija plazos hasta ene. de 2026.\n\n"
+    ),
+    "fr": (
+        "M. Dupont a présenté le rapport mardi à Paris. Selon Mme Martin, le "
+        "réseau a besoin d'investissements, cf. p. 12 du document.\nLa "
+        "fréquentation a augmenté de 4,5 % en 2024. Est-ce suffisant ? Les "
+        "critiques disent que non. Le calendrier est prévu pour janv. 2026.\n\n"
+    ),
+    "de": (
+        "Hr. Müller stellte den Bericht am 3. Oktober in Berlin vor. Laut Dr. "
+        "Schmidt braucht das Netz Investitionen, z.B. im Nahverkehr.\nDie "
+        "Fahrgastzahlen stiegen 2024 um 4,5 Prozent. Reicht das? Kritiker "
+        "sagen nein, vgl. S. 12 des Berichts. Der Fahrplan gilt ab Jan. 2026.\n\n"
+    ),
+    "it": (
+        "Il sig. Rossi ha presentato il rapporto martedì a Roma. Secondo il "
+        "dott. Bianchi la rete ha bisogno di investimenti, ecc. come a pag. 12.\n"
+        "I passeggeri sono cresciuti del 4,5% nel 2024. Basta? I critici dicono "
+        "di no. Il nuovo orario entrerà in vigore nel 2026.\n\n"
+    ),
+    "pt": (
+        "O Sr. Silva apresentou o relatório na terça-feira em Lisboa. Segundo a "
+        "Dra. Costa, a rede precisa de investimento, p. ex. nos subúrbios.\nO "
+        "número de passageiros cresceu 4,5% em 2024. É suficiente? Os críticos "
+        "dizem que não. O novo horário, pág. 12, entra em vigor em jan. 2026.\n\n"
+    ),
+    "ru": (
+        "Комитет опубликовал выводы во вторник. По словам проф. Иванова, сети "
+        "нужны инвестиции, т.е. новые поезда.\nПассажиропоток вырос на 4,5% в "
+        "2024 г. Этого достаточно? Критики говорят, что нет. Новое расписание "
+        "вступит в силу в янв. 2026 г. на ул. Ленина и в других местах.\n\n"
+    ),
+    "zh": (
+        "委员会周二公布了调查结果。报告称，区域交通网络需要持续投资！"
+        "客流量在二零二四年增长了百分之四点五。这够吗？"
+        "批评者说：“远远不够。”新的时刻表将于明年生效。\n\n"
+    ),
+}
+
+
+def _reference(language: str):
+    try:
+        return sentence_tokenizer(language), "punkt"
+    except NLTKResourceError:
+        from nltk.tokenize.punkt import PunktSentenceTokenizer  # noqa: PLC0415
+
+        return PunktSentenceTokenizer(), "punkt (untrained)"
+
+
+def _best_of(repeats: int, func, *args) -> tuple[float, list]:
+    best, result = float("inf"), []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = list(func(*args))
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def agreement(reference: list[tuple[int, int]], candidate: list[tuple[int, int]]):
+    """Precision, recall and F1 of *candidate* sentence ends against *reference*."""
+    expected = {end for _, end in reference}
+    found = {end for _, end in candidate}
+    hits = len(expected & found)
+    precision = hits / len(found) if found else 1.0
+    recall = hits / len(expected) if expected else 1.0
+    f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+    return precision, recall, f1
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--megabytes", type=float, default=1.0)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--languages", nargs="*", default=list(SAMPLES))
+    args = parser.parse_args()
+
+    print(
+        f"{'lang':<5} {'reference':<18} {'punkt MB/s':>10} {'regex MB/s':>10} "
+        f"{'speedup':>8} {'precision':>9} {'recall':>7} {'F1':>6}"
+    )
+    for language in args.languages:
+        sample = SAMPLES[language]
+        text = sample * max(1, int(args.megabytes * 2**20 / len(sample.encode("utf-8"))))
+        megabytes = len(text.encode("utf-8")) / 2**20
+        reference, label = _reference(language)
+        punkt_time, expected = _best_of(args.repeats, reference.span_tokenize, text)
+        regex_time, found = _best_of(args.repeats, sentence_segmenter(language).span_tokenize, text)
+        precision, recall, f1 = agreement(expected, found)
+        print(
+            f"{language:<5} {label:<18} {megabytes / punkt_time:>10.2f} "
+            f"{megabytes / regex_time:>10.2f} {punkt_time / regex_time:>7.1f}x "
+            f"{precision:>9.3f} {recall:>7.3f} {f1:>6.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
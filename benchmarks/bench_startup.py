@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Startup benchmark — TextProcessor cold start
+============================================
+
+Every gunicorn worker, Celery worker and CLI invocation constructs a
+``TextProcessor``. Each measurement runs in a fresh interpreter and reports
+wall time for:
+
+- ``import``: importing ``modules.text_processor`` (includes the
+  ``modules`` package and its eager imports);
+- ``init``: ``TextProcessor()``;
+- ``first``: the first ``process_text`` call on a short article, which is
+  where lazily loaded resources are paid for.
+
+Usage:
+    python -m benchmarks.bench_startup
+    python -m benchmarks.bench_startup --runs 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+_PROBE = """
+import json, time
+t0 = time.perf_counter()
+from modules.text_processor import TextProcessor
+t1 = time.perf_counter()
+processor = TextProcessor()
+t2 = time.perf_counter()
+try:
+    processor.process_text(
+        "The committee published its findings on Tuesday. It says the regional "
+        "transport network needs sustained investment over the next decade. "
+        "Ridership grew by four percent last year, and costs rose as well."
+    )
+    first = time.perf_counter() - t2
+except LookupError:  # NLTK data not installed
+    first = None
+print(json.dumps({"import": t1 - t0, "init": t2 - t1, "first": first}))
+"""
+
+
+def _probe() -> dict[str, float]:
+    out = subprocess.run(
+        [sys.executable, "-c", _PROBE], capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    samples = [_probe() for _ in range(args.runs)]
+    print(f"{'phase':<8} {'median ms':>10} {'min ms':>8}")
+    for phase in ("import", "init", "first"):
+        values = [s[phase] * 1000 for s in samples if s[phase] is not None]
+        if not values:
+            print(f"{phase:<8} {'failed':>10}")
+            continue
+        print(f"{phase:<8} {statistics.median(values):>10.1f} {min(values):>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Summarization benchmark — extractive scoring on growing sentence sets
+=====================================================================
+
+Builds synthetic articles of 100 to 10,000 sentences (a seeded random mix of
+topic words, shared filler and repeated boilerplate-like sentences) and times
+``ExtractiveSummarizer.summarize`` on the tokenized ``Document`` against the
+previous scorer, which fitted one TF-IDF model for term mass (bigrams,
+``max_features=1000``) and another for similarity to a pseudo-document row,
+built its position / length / combined scores as Python lists, sorted every
+sentence to rank them and checked redundancy by token-set overlap (the
+current one selects by MMR over the shared TF-IDF matrix). The LexRank
+mode (``method="lexrank"``: k-nearest-neighbour similarity graph plus power
+iteration over the same matrix) is timed alongside, to choose a ranking per
+document size, and so is the hierarchical ranking used for very long
+documents (sections scored separately, then a final selection over their
+best sentences), with the peak memory of the flat and hierarchical runs,
+and so is ``TFIDF_MODE=hashed`` (hashed unigrams weighted by a background
+IDF table, here built from differently seeded synthetic articles).
+
+Reports milliseconds per call for each and how many of the selected
+sentences the previous and current scorers have in common.
+
+The previous scorer is kept below as a reference implementation.
+
+Usage:
+    python -m benchmarks.bench_summarization
+    python -m benchmarks.bench_summarization --sentences 100 1000 --repeats 5
+    python -m benchmarks.bench_summarization --sentences 10000 30000 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+import tracemalloc
+
+import numpy as np
+from scipy.sparse import vstack
+from sklearn.feature_extraction.text import TfidfTransformer
+from sklearn.metrics.pairwise import cosine_similarity
+
+from config import config
+from modules.document import Document
+from modules.idf_table import build_idf_table, idf_tables
+from modules.summarizer import ExtractiveSummarizer
+
+_TOPICS = (
+    "rail network ridership timetable fares station commuters trains signalling depot",
+    "budget council taxes spending deficit revenue audit ministers treasury bonds",
+    "hospital patients doctors nurses clinic vaccine waiting surgery emergency care",
+    "climate emissions drought rainfall heatwave rivers farmers harvest wildfire coast",
+    "school teachers pupils exams curriculum classroom funding literacy tuition campus",
+)
+_FILLER = "the a of in on for with that this from after over by officials said report year"
+_REPEATED = (
+    "Officials said the review would continue over the coming year.",
+    "The report was published after a long review by the committee.",
+)
+
+
+def synthetic_sentences(count: int, seed: int = 7) -> list[str]:
+    rng = random.Random(seed)
+    topics = [t.split() for t in _TOPICS]
+    filler = _FILLER.split()
+    sentences = []
+    for i in range(count):
+        if i % 25 == 24:
+            sentences.append(_REPEATED[i % 2])
+            continue
+        words = rng.sample(topics[rng.randrange(len(topics))], 4) + rng.sample(filler, 8)
+        rng.shuffle(words)
+        sentences.append(" ".join(words).capitalize() + ".")
+    return sentences
+
+
+# ---------------------------------------------------------------------------
+# Previous scorer (two TF-IDF fits, Python-list scoring, token-set redundancy),
+# for comparison only
+# ---------------------------------------------------------------------------
+
+
+def _legacy_position_scores(n: int) -> list[float]:
+    scores = []
+    for i in range(n):
+        if i < n * 0.1:
+            scores.append(1.0)
+        elif i > n * 0.9:
+            scores.append(0.8)
+        else:
+            scores.append(0.5)
+    return scores
+
+
+def _legacy_length_scores(document: Document) -> list[float]:
+    scores = []
+    for wc in document.sentence_lengths().tolist():
+        if 10 <= wc <= 30:
+            scores.append(1.0)
+        elif wc < 5:
+            scores.append(0.3)
+        elif wc > 50:
+            scores.append(0.5)
+        else:
+            scores.append(0.7)
+    return scores
+
+
+def _legacy_is_diverse(candidate: frozenset[int], selected: list[frozenset[int]]) -> bool:
+    for sel in selected:
+        union = len(candidate | sel)
+        if union and len(candidate & sel) / union > 0.3:
+            return False
+    return True
+
+
+def _legacy_select(document: Document, scores: list[float], target: int) -> list[int]:
+    token_sets = document.token_sets()
+    ranked = sorted(enumerate(scores), key=lambda x: x[1], reverse=True)
+    selected_idx: list[int] = []
+    selected_sets: list[frozenset[int]] = []
+    for idx, _score in ranked:
+        if len(selected_idx) >= target:
+            break
+        if _legacy_is_diverse(token_sets[idx], selected_sets):
+            selected_idx.append(idx)
+            selected_sets.append(token_sets[idx])
+    return sorted(selected_idx)
+
+
+def _legacy_summarize(summarizer: ExtractiveSummarizer, sentences, processed, length):
+    document = summarizer._document(sentences, processed, "en")
+    exclude = summarizer._get_stop_words("en")
+
+    counts = document.term_matrix(exclude=exclude, ngram_range=(1, 2), max_features=1000)
+    tfidf = np.array(TfidfTransformer().fit_transform(counts).sum(axis=1)).flatten()
+    tfidf = (tfidf / tfidf.max()).tolist()
+
+    counts = document.term_matrix(exclude=exclude)
+    matrix = TfidfTransformer().fit_transform(vstack([counts, counts.sum(axis=0)], format="csr"))
+    similarity = cosine_similarity(matrix[:-1], matrix[-1:]).flatten().tolist()
+
+    position = _legacy_position_scores(len(sentences))
+    lengths = _legacy_length_scores(document)
+    combined = [
+        0.4 * tfidf[i] + 0.2 * position[i] + 0.2 * lengths[i] + 0.2 * similarity[i]
+        for i in range(len(tfidf))
+    ]
+    target = min(config.summarization.extractive_sentences.get(length, 5), len(document))
+    return _legacy_select(document, combined, target)
+
+
+def _best_of(repeats: int, func, *args) -> tuple[float, object]:
+    best, result = float("inf"), None
+    for _ in range(repeats):
+        started = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def _peak_mb(func, *args) -> float:
+    tracemalloc.start()
+    try:
+        func(*args)
+        return tracemalloc.get_traced_memory()[1] / 2**20
+    finally:
+        tracemalloc.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--sentences", type=int, nargs="*", default=[100, 1000, 3000, 10000])
+    parser.add_argument("--length", default="long", choices=["short", "medium", "long"])
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument(
+        "--lexrank-max", type=int, default=10000, help="skip LexRank above this many sentences"
+    )
+    args = parser.parse_args()
+
+    summarizer = ExtractiveSummarizer()
+    summarization = config.summarization
+    idf_tables.use(
+        build_idf_table(("en", synthetic_sentences(2000, seed)) for seed in range(100, 105))
+    )
+    print(
+        f"{'sentences':>10} {'legacy ms':>10} {'shared ms':>10} {'speedup':>8} "
+        f"{'overlap':>8} {'lexrank ms':>11} {'hier ms':>8} {'flat MB':>8} {'hier MB':>8} "
+        f"{'hashed ms':>10}"
+    )
+    for count in args.sentences:
+        sentences = synthetic_sentences(count)
+        processed = {"language": "en", "document": Document.from_sentences(sentences, "en")}
+        # Flat scoring for every column but the hierarchical ones
+        summarization.hierarchical_min_sentences = 0
+        legacy, legacy_idx = _best_of(
+            args.repeats, _legacy_summarize, summarizer, sentences, processed, args.length
+        )
+        shared, result = _best_of(
+            args.repeats, summarizer.summarize, sentences, processed, args.length
+        )
+        flat_mb = _peak_mb(summarizer.summarize, sentences, processed, args.length)
+        lexrank = "-"
+        if count <= args.lexrank_max:
+            seconds, _ = _best_of(
+                args.repeats, summarizer.summarize, sentences, processed, args.length, "lexrank"
+            )
+            lexrank = f"{seconds * 1000:.1f}"
+        summarization.hierarchical_min_sentences = 1
+        hierarchical, _ = _best_of(
+            args.repeats, summarizer.summarize, sentences, processed, args.length
+        )
+        hier_mb = _peak_mb(summarizer.summarize, sentences, processed, args.length)
+        summarization.hierarchical_min_sentences = 0
+        summarization.tfidf_mode = "hashed"
+        hashed, _ = _best_of(args.repeats, summarizer.summarize, sentences, processed, args.length)
+        summarization.tfidf_mode = "fit"
+        common = len(set(legacy_idx) & set(result["selection_indices"].tolist()))
+        print(
+            f"{count:>10} {legacy * 1000:>10.1f} {shared * 1000:>10.1f} "
+            f"{legacy / shared:>7.1f}x {common:>4}/{len(legacy_idx)} {lexrank:>11} "
+            f"{hierarchical * 1000:>8.1f} {flat_mb:>8.1f} {hier_mb:>8.1f} {hashed * 1000:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Text processing benchmark — cleaning, filtering and language identification
+===========================================================================
+
+Cleaning: builds synthetic scraped documents of increasing size (paragraphs
+with typographic quotes, URLs, e-mails, phone numbers, control characters and
+short navigation lines) and reports MB/s for ``TextProcessor._clean_text``
+next to the previous three-stage cleaner (basic → advanced → normalize).
+
+Filtering: times ``TextProcessor.filter_sentences`` on sentence lists of
+increasing length against the previous per-sentence ``re.search`` loop.
+
+Language identification: per-sample latency of ``modules.language_id``
+(uncached and cached) against ``langdetect.detect``, with agreement.
+
+The previous cleaner and filter are kept below as reference implementations.
+
+Usage:
+    python -m benchmarks.bench_text_processing
+    python -m benchmarks.bench_text_processing --sizes 1 8 32 --repeats 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import time
+import unicodedata
+
+from modules.text_processor import TextProcessor
+
+_PARAGRAPH = (
+    "The committee’s report — published on Tuesday — says the regional "
+    "transport network needs “sustained investment” over the next decade!! "
+    "Details at https://example.com/reports/2025?id=42 or press@example.com , "
+    "phone +5511987654321.\tRidership grew 4.5% ; costs rose too…\x07\n"
+    "A second wrapped line keeps the paragraph going for a while longer.\n"
+)
+_NAV = "Home\nShare\n12/03/2025\n"
+
+
+def synthetic_document(megabytes: float) -> str:
+    block = _PARAGRAPH + "\n" + _NAV + "\n"
+    return block * max(1, int(megabytes * 2**20 / len(block.encode("utf-8"))))
+
+
+# ---------------------------------------------------------------------------
+# Previous implementation (three sequential stages), for comparison only
+# ---------------------------------------------------------------------------
+
+
+def _legacy_clean(processor: TextProcessor, text: str) -> str:
+    text = re.sub(r"\s+", " ", text)
+    text = "".join(char for char in text if ord(char) >= 32 or char in "\n\t")
+    text = text.replace("–", "-").replace("—", "-").replace("…", "...")
+    text = re.sub(r"([.!?]){2,}", r"\1", text).strip()
+
+    text = re.sub(
+        r"http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+",
+        "",
+        text,
+    )
+    text = re.sub(r"\S+@\S+\.\S+", "", text)
+    text = re.sub(r"[\+]?[1-9]?[0-9]{7,15}", "", text)
+    text = re.sub(r"\n{3,}", "\n\n", text)
+    lines = [line.strip() for line in text.split("\n")]
+    text = "\n".join(line for line in lines if line and processor._is_content_line(line))
+
+    text = unicodedata.normalize("NFKC", text)
+    text = re.sub(r"\s*([.!?])\s*", r"\1 ", text)
+    text = re.sub(r"\s*,\s*", ", ", text)
+    text = re.sub(r"\s*;\s*", "; ", text)
+    text = re.sub(r"\s*:\s*", ": ", text)
+    text = re.sub(r"([.!?])([A-Z])", r"\1 \2", text)
+    return text.strip()
+
+
+_SENTENCES = (
+    "The committee published its findings on Tuesday after a long review.",
+    "Click here to subscribe to our newsletter and receive daily updates.",
+    "Ridership on the regional network grew by four percent last year alone.",
+    "Copyright 2025 Example Media Group. All rights reserved worldwide.",
+    "3) de 2025 do periódico Saúde e Sociedade, o dossiê reúne pesquisas.",
+    "Officials expect the new timetable to take effect early next spring.",
+)
+
+
+def _legacy_is_valid_sentence(sentence: str) -> bool:
+    if not 20 <= len(sentence) <= 500:
+        return False
+    if not re.search(r"[a-zA-Z]", sentence):
+        return False
+    alpha_count = sum(1 for char in sentence if char.isalpha())
+    if alpha_count / len(sentence) < 0.3:
+        return False
+    ui_patterns = [
+        r"^(click|select|choose|enter|submit|login|register|home|about|contact|menu)",
+        r"(copyright|©|\(c\))",
+        r"^(next|previous|back|forward|up|down)$",
+        r"^[0-9\s\-/]+$",
+        r"^\d+[\)\.]\s",
+        r"^(obter|comprar|encontrar|procure|ir para|ver todos|baixar)\b",
+        r"^(livraria|editora|publicado por|publicada por|sobre este|sobre o livro)\b",
+        r"(todos os vendedores|e-book dispon|livro impresso|google play|eBookstore)",
+        r"^(ouvir|assistir|denunciar|sinalizar)\b",
+    ]
+    return all(not re.search(pattern, sentence.lower()) for pattern in ui_patterns)
+
+
+def _legacy_filter(sentences: list[str]) -> list[str]:
+    return [s for s in sentences if _legacy_is_valid_sentence(s)]
+
+
+def _best_of(repeats: int, func, *args) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        started = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def bench_cleaning(sizes: list[float], repeats: int) -> None:
+    processor = TextProcessor()
+    print(f"{'MB':>6} {'legacy MB/s':>12} {'fused MB/s':>11} {'speedup':>8} {'lines kept':>11}")
+    for size in sizes:
+        text = synthetic_document(size)
+        megabytes = len(text.encode("utf-8")) / 2**20
+        legacy = _best_of(repeats, _legacy_clean, processor, text)
+        fused = _best_of(repeats, processor._clean_text, text)
+        kept = processor._clean_text(text).count("\n") + 1
+        print(
+            f"{megabytes:>6.1f} {megabytes / legacy:>12.1f} {megabytes / fused:>11.1f} "
+            f"{legacy / fused:>7.1f}x {kept:>11}"
+        )
+
+
+def bench_filtering(counts: list[int], repeats: int) -> None:
+    processor = TextProcessor()
+    print(
+        f"{'sentences':>10} {'legacy ms':>10} {'batch ms':>9} {'speedup':>8} "
+        f"{'kept':>7} {'agree':>6}"
+    )
+    for count in counts:
+        sentences = list(_SENTENCES * (count // len(_SENTENCES) + 1))[:count]
+        legacy = _best_of(repeats, _legacy_filter, sentences)
+        batch = _best_of(repeats, processor.filter_sentences, sentences, None)
+        kept = processor.filter_sentences(sentences)
+        agree = kept == _legacy_filter(sentences)
+        print(
+            f"{count:>10} {legacy * 1000:>10.1f} {batch * 1000:>9.1f} "
+            f"{legacy / batch:>7.1f}x {len(kept):>7} {'yes' if agree else 'no':>6}"
+        )
+
+
+_LANGID_SAMPLES = (
+    "The committee published its findings on Tuesday, saying the network needs investment.",
+    "O comitê publicou suas conclusões na terça-feira, dizendo que a rede precisa de verba.",
+    "El comité publicó sus conclusiones el martes, diciendo que la red necesita inversión.",
+    "Le comité a publié ses conclusions mardi, affirmant que le réseau a besoin d'argent.",
+    "Der Ausschuss veröffentlichte am Dienstag seine Ergebnisse zum regionalen Verkehrsnetz.",
+    "Комитет опубликовал свои выводы во вторник, заявив, что сеть нуждается в инвестициях.",
+)
+
+
+def bench_language_id(repeats: int) -> None:
+    from langdetect import DetectorFactory  # noqa: PLC0415
+    from langdetect import detect as langdetect_detect  # noqa: PLC0415
+
+    from modules.language_id import LanguageIdentifier, language_identifier  # noqa: PLC0415
+
+    DetectorFactory.seed = 0
+    identifier = LanguageIdentifier(cache_size=0)
+    identifier._model = language_identifier.model
+    cached = LanguageIdentifier()
+    cached._model = identifier.model
+    samples = [(s * 8)[:1000] for s in _LANGID_SAMPLES]
+
+    def run(detect) -> list[str | None]:
+        return [detect(sample) for sample in samples]
+
+    run(cached.detect)  # populate the cache
+    per_sample = 1e6 / len(samples)
+    legacy = _best_of(repeats, run, langdetect_detect) * per_sample
+    ngram = _best_of(repeats, run, identifier.detect) * per_sample
+    hit = _best_of(repeats, run, cached.detect) * per_sample
+    agree = sum(a == b for a, b in zip(run(langdetect_detect), run(identifier.detect), strict=True))
+    print(f"{'langdetect us':>14} {'n-gram us':>10} {'cached us':>10} {'speedup':>8} {'agree':>6}")
+    print(
+        f"{legacy:>14.0f} {ngram:>10.0f} {hit:>10.1f} {legacy / ngram:>7.0f}x "
+        f"{agree:>3}/{len(samples)}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--sizes", type=float, nargs="*", default=[0.25, 1, 4, 16])
+    parser.add_argument("--sentences", type=int, nargs="*", default=[1000, 10000, 50000])
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+    bench_cleaning(args.sizes, args.repeats)
+    print()
+    bench_filtering(args.sentences, args.repeats)
+    print()
+    bench_language_id(args.repeats)
+
+
+if __name__ == "__main__":
+    main()
@@ -56,6 +56,38 @@ class ScrapingConfig:
     # Seconds the circuit stays OPEN before allowing a probe request
     circuit_breaker_timeout: int = int(os.getenv("CIRCUIT_BREAKER_TIMEOUT", "120"))
 
+    # Adaptive per-host timeouts: deadlines derived from the learned p99
+    # time-to-first-byte of each hostname, clamped to [min, max] seconds.
+    # ``timeout`` above is used until a host has enough samples.
+    adaptive_timeouts: bool = os.getenv("ADAPTIVE_TIMEOUTS", "true").lower() == "true"
+    connect_timeout_min: float = float(os.getenv("CONNECT_TIMEOUT_MIN", "3"))
+    connect_timeout_max: float = float(os.getenv("CONNECT_TIMEOUT_MAX", "15"))
+    connect_timeout_factor: float = 2.0
+    read_timeout_min: float = float(os.getenv("READ_TIMEOUT_MIN", "5"))
+    read_timeout_max: float = float(os.getenv("READ_TIMEOUT_MAX", "60"))
+    read_timeout_factor: float = 3.0
+
+    # JSON-LD / microdata articleBody shorter than this is treated as a teaser
+    # and the DOM extraction cascade runs as usual.
+    structured_data_min_words: int = int(os.getenv("STRUCTURED_DATA_MIN_WORDS", "150"))
+
+    # Prefer <link rel="amphtml"> / print alternates of heavy pages. The first
+    # ``light_variant_sniff_bytes`` of the original are inspected for the link
+    # and per-domain URL rewrite rules are learned from each hit.
+    prefer_light_variant: bool = os.getenv("PREFER_LIGHT_VARIANT", "false").lower() == "true"
+    light_variant_sniff_bytes: int = 64 * 1024
+
+    # Strip <script>/<style>/<svg>/comments at byte level before parsing HTML
+    # (JSON-LD is preserved). Cuts parse time and peak memory on heavy pages.
+    prestrip_html: bool = os.getenv("PRESTRIP_HTML", "true").lower() == "true"
+
+    # Paginated articles (rel="next", ?page=2, /page/2): total pages stitched
+    # (1 disables) and how many of them are fetched concurrently per host.
+    max_pages: int = int(os.getenv("MAX_ARTICLE_PAGES", "5"))
+    pagination_concurrency: int = int(os.getenv("PAGINATION_CONCURRENCY", "3"))
+    # Extracted article pages kept in process (per page URL)
+    page_cache_size: int = int(os.getenv("PAGE_CACHE_SIZE", "256"))
+
     headers: dict[str, str] = field(default_factory=dict)
     user_agents: list[str] = field(default_factory=list)
 
@@ -110,14 +142,42 @@ class ProcessingConfig:
     remove_short_paragraphs: bool = True
     preserve_structure: bool = True
     language_detection: bool = True
+    # Vendored NLTK data (punkt, stopwords); populated at build time by
+    # `python -m modules.nltk_resources`, never downloaded at runtime; a relative
+    # path is resolved against the project root
+    nltk_data_dir: str = os.getenv("NLTK_DATA_DIR", "nltk_data")
+    # Character n-gram language identifier, built from langdetect's profiles by
+    # `python -m modules.language_id` at build time (in memory when missing);
+    # a relative path is resolved against the project root
+    langid_model_path: str = os.getenv("LANGID_MODEL_PATH", ".model_cache/langid.npz")
+    # Below this many characters, stopword overlap is tried before n-grams
+    langid_short_text_chars: int = 200
+    # Sentence boundaries: "punkt" (NLTK models; languages without one use the
+    # regex segmenter) or "regex" (modules.sentence_segmenter everywhere,
+    # several times faster for bulk jobs)
+    sentence_segmenter: Literal["punkt", "regex"] = os.getenv("SENTENCE_SEGMENTER", "punkt")  # type: ignore[assignment]
+    # Raw characters per window in streaming mode (TextProcessor.iter_sentences)
+    stream_window_chars: int = int(os.getenv("STREAM_WINDOW_CHARS", "65536"))
+    # Cross-page boilerplate (modules.boilerplate): a sentence seen on at least
+    # ``boilerplate_min_pages`` pages of a host, and on at least
+    # ``boilerplate_min_share`` of the host's pages, is dropped before scoring
+    boilerplate_filter: bool = os.getenv("BOILERPLATE_FILTER", "true").lower() == "true"
+    boilerplate_min_pages: int = int(os.getenv("BOILERPLATE_MIN_PAGES", "3"))
+    boilerplate_min_share: float = 0.3
+    boilerplate_ttl: int = 30 * 86400  # Redis index expiry (seconds)
+    # Worker processes for text processing, extractive scoring and HTML
+    # extraction in thread-dispatcher mode (no Celery); 0 runs them in-thread
+    cpu_pool_workers: int = int(os.getenv("CPU_POOL_WORKERS", "0"))
 
 
 @dataclass
 class SummarizationConfig:
     """Summary generation settings."""
 
-    # "extractive" always works offline; "generative" requires GEMINI_API_KEY.
-    method: Literal["extractive", "generative"] = os.getenv("SUMMARIZATION_METHOD", "extractive")  # type: ignore[assignment]
+    # "extractive" and "lexrank" always work offline; "generative" requires GEMINI_API_KEY.
+    method: Literal["extractive", "lexrank", "generative"] = os.getenv(
+        "SUMMARIZATION_METHOD", "extractive"
+    )  # type: ignore[assignment]
 
     summary_length: Literal["short", "medium", "long"] = os.getenv("SUMMARY_LENGTH", "medium")  # type: ignore[assignment]
 
@@ -126,6 +186,42 @@ class SummarizationConfig:
         default_factory=lambda: {"short": 3, "medium": 5, "long": 8}
     )
 
+    # Extractive selection (MMR): weight of relevance against redundancy, and
+    # the TF-IDF cosine to an already selected sentence above which a
+    # candidate is skipped outright
+    mmr_lambda: float = float(os.getenv("MMR_LAMBDA", "0.7"))
+    redundancy_threshold: float = float(os.getenv("REDUNDANCY_THRESHOLD", "0.5"))
+
+    # LexRank: neighbours kept per sentence in the similarity graph, damping
+    # factor, and the L1 change at which the power iteration stops
+    lexrank_neighbors: int = int(os.getenv("LEXRANK_NEIGHBORS", "10"))
+    lexrank_damping: float = float(os.getenv("LEXRANK_DAMPING", "0.85"))
+    lexrank_tolerance: float = float(os.getenv("LEXRANK_TOLERANCE", "1e-6"))
+    lexrank_max_iter: int = int(os.getenv("LEXRANK_MAX_ITER", "100"))
+
+    # Hierarchical extractive ranking for long documents, off by default (0):
+    # from this many sentences, sections of section_sentences are scored on
+    # their own by section_workers threads and keep section_candidates
+    # sentences each for a final selection. It bounds peak memory but was
+    # slower than flat ranking at every size measured on one core
+    # (benchmarks/bench_summarization.py); enable it for very long inputs
+    hierarchical_min_sentences: int = int(os.getenv("HIERARCHICAL_MIN_SENTENCES", "0"))
+    section_sentences: int = int(os.getenv("SECTION_SENTENCES", "2000"))
+    section_candidates: int = int(os.getenv("SECTION_CANDIDATES", "12"))
+    section_workers: int = int(os.getenv("SECTION_WORKERS", "4"))
+
+    # TF-IDF weighting: "fit" learns vocabulary and IDF from each article;
+    # "hashed" hashes terms into idf_features buckets and weights them by the
+    # background table at idf_table_path (relative to the project root;
+    # `python -m modules.idf_table` rebuilds it from stored summaries),
+    # falling back to "fit" for languages the table does not cover
+    tfidf_mode: Literal["fit", "hashed"] = os.getenv("TFIDF_MODE", "fit")  # type: ignore[assignment]
+    idf_table_path: str = os.getenv("IDF_TABLE_PATH", ".model_cache/idf.npz")
+    idf_features: int = int(os.getenv("IDF_FEATURES", str(1 << 18)))
+
+    # Extractive rankings kept in process (any length re-selects from one)
+    ranking_cache_size: int = int(os.getenv("RANKING_CACHE_SIZE", "256"))
+
     # Generative (Gemini): token budget
     max_tokens: int = 1024
     temperature: float = 0.7
@@ -175,6 +271,9 @@ class OutputConfig:
     cache_dir: str = ".cache"
     # Cache TTL in seconds (default 24 h)
     cache_ttl: int = int(os.getenv("CACHE_TTL", "86400"))
+    # Processed articles kept in process per URL, so a length switch skips
+    # scraping and text processing (0 disables)
+    processed_cache_size: int = int(os.getenv("PROCESSED_CACHE_SIZE", "32"))
 
 
 @dataclass
@@ -357,3 +456,12 @@ SUPPORTED_FORMATS: dict[str, str] = {
     "md": "text/markdown",
     "json": "application/json",
 }
+
+# Relative data paths (NLTK data, language model, IDF table) resolve against
+# the project root, so workers started from another directory find them
+PROJECT_ROOT: str = os.path.dirname(os.path.abspath(__file__))
+
+
+def project_path(path: str) -> str:
+    """*path* resolved against ``PROJECT_ROOT`` when relative."""
+    return os.path.join(PROJECT_ROOT, path)
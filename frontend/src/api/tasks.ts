@@ -1,8 +1,10 @@
 import { apiClient } from './client'
 
+export type SummaryMethod = 'extractive' | 'lexrank' | 'generative'
+
 export interface SubmitTaskParams {
   url: string
-  method?: 'extractive' | 'generative'
+  method?: SummaryMethod
   length?: 'short' | 'medium' | 'long'
   idempotencyKey?: string
 }
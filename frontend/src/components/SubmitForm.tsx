@@ -1,5 +1,5 @@
 import { useState, FormEvent } from 'react'
-import { submitTask } from '../api/tasks'
+import { submitTask, SummaryMethod } from '../api/tasks'
 
 interface Props {
   onTaskSubmitted: (taskId: string) => void
@@ -7,7 +7,7 @@ interface Props {
 
 export default function SubmitForm({ onTaskSubmitted }: Props) {
   const [url, setUrl] = useState('')
-  const [method, setMethod] = useState<'extractive' | 'generative'>('extractive')
+  const [method, setMethod] = useState<SummaryMethod>('extractive')
   const [length, setLength] = useState<'short' | 'medium' | 'long'>('medium')
   const [loading, setLoading] = useState(false)
   const [error, setError] = useState<string | null>(null)
@@ -73,10 +73,11 @@ export default function SubmitForm({ onTaskSubmitted }: Props) {
           <select
             id="method"
             value={method}
-            onChange={(e) => setMethod(e.target.value as 'extractive' | 'generative')}
+            onChange={(e) => setMethod(e.target.value as SummaryMethod)}
             className="w-full bg-background-light dark:bg-slate-900/60 border border-slate-200 dark:border-slate-700 rounded-lg px-3 py-2.5 text-sm text-slate-900 dark:text-slate-100 focus:outline-none focus:ring-2 focus:ring-primary/40 transition"
           >
             <option value="extractive">Extractivo (TF-IDF)</option>
+            <option value="lexrank">LexRank (grafo)</option>
             <option value="generative">Generativo (Gemini)</option>
           </select>
         </div>
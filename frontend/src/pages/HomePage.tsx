@@ -1,6 +1,6 @@
 import { useState, FormEvent } from 'react'
 import { Link } from 'react-router-dom'
-import { submitTask } from '../api/tasks'
+import { submitTask, SummaryMethod } from '../api/tasks'
 import { usePolling } from '../hooks/usePolling'
 
 // ─── Helper ────────────────────────────────────────────────────────────────
@@ -168,7 +168,7 @@ interface LandingProps {
 
 function LandingView({ onTaskSubmitted }: LandingProps) {
   const [url, setUrl] = useState('')
-  const [method, setMethod] = useState<'extractive' | 'generative'>('extractive')
+  const [method, setMethod] = useState<SummaryMethod>('extractive')
   const [length, setLength] = useState<'short' | 'medium' | 'long'>('medium')
   const [loading, setLoading] = useState(false)
   const [error, setError] = useState<string | null>(null)
@@ -239,10 +239,11 @@ function LandingView({ onTaskSubmitted }: LandingProps) {
                     </label>
                     <select
                       value={method}
-                      onChange={(e) => setMethod(e.target.value as 'extractive' | 'generative')}
+                      onChange={(e) => setMethod(e.target.value as SummaryMethod)}
                       className="w-full bg-background-light dark:bg-slate-900/60 border border-slate-200 dark:border-slate-700 rounded-lg px-3 py-2.5 text-sm text-slate-900 dark:text-slate-100 focus:outline-none focus:ring-2 focus:ring-primary/40 transition"
                     >
                       <option value="extractive">Extractivo (TF-IDF)</option>
+                      <option value="lexrank">LexRank (grafo)</option>
                       <option value="generative">Generativo (Gemini)</option>
                     </select>
                   </div>
@@ -94,6 +94,12 @@ function SettingRow({
 
 // ─── Method toggle ────────────────────────────────────────────────────────────
 
+const METHOD_LABELS: Record<string, string> = {
+  extractive: 'Extractivo (TF-IDF)',
+  lexrank: 'LexRank (grafo)',
+  generative: 'Generativo (Gemini)',
+}
+
 function MethodToggle({
   current,
   onChange,
@@ -105,7 +111,7 @@ function MethodToggle({
 }) {
   return (
     <div className="flex gap-2 mt-1">
-      {['extractive', 'generative'].map((val) => (
+      {['extractive', 'lexrank', 'generative'].map((val) => (
         <button
           key={val}
           onClick={() => onChange(val)}
@@ -116,7 +122,7 @@ function MethodToggle({
               : 'bg-white dark:bg-slate-800 text-slate-600 dark:text-slate-300 border-slate-200 dark:border-slate-700 hover:border-primary/40'
           } disabled:opacity-50 disabled:cursor-not-allowed`}
         >
-          {val === 'extractive' ? 'Extractivo (TF-IDF)' : 'Generativo (Gemini)'}
+          {METHOD_LABELS[val]}
         </button>
       ))}
     </div>
@@ -40,6 +40,7 @@ from infrastructure.repositories import (
 )
 from infrastructure.runtime_settings import RuntimeSettingsApplier
 from modules.cache import create_cache_backend
+from modules.cpu_pool import cpu_pool
 from modules.rate_limiter import create_rate_limiter
 from modules.secrets_manager import secrets_manager
 
@@ -83,6 +84,10 @@ class AsyncTaskDispatcher:
         except Exception as exc:
             logger.warning("Celery not available (%s) — using thread dispatcher.", exc)
 
+    @property
+    def uses_celery(self) -> bool:
+        return self._celery_available
+
     def dispatch(self, task_id: str, url: str, method: str, length: str) -> None:
         if self._celery_available:
             from tasks.summarization_task import summarize_article  # noqa: PLC0415
@@ -126,6 +131,8 @@ def _build_default_settings() -> dict[str, Any]:
         "scraping.max_content_bytes": config.scraping.max_content_bytes,
         "summarization.default_method": config.summarization.method,
         "summarization.default_length": config.summarization.summary_length,
+        "summarization.mmr_lambda": config.summarization.mmr_lambda,
+        "summarization.redundancy_threshold": config.summarization.redundancy_threshold,
         "summarization.gemini_model_id": config.gemini.model_id,
         "output.cache_enabled": config.output.cache_enabled,
         "output.cache_ttl": config.output.cache_ttl,
@@ -167,6 +174,9 @@ def build_runtime_container() -> RuntimeContainer:
     )
     process_task_handler = ProcessTaskHandler(task_repository, pipeline_runner, event_bus)
     dispatcher = AsyncTaskDispatcher(process_task_handler)
+    if not dispatcher.uses_celery and config.processing.cpu_pool_workers > 0:
+        # Tasks run in threads of this process: move the CPU-bound stages out
+        cpu_pool.enable(config.processing.cpu_pool_workers)
 
     event_bus.subscribe(
         TaskSubmitted,
@@ -3,12 +3,16 @@
 from __future__ import annotations
 
 import logging
+import threading
 import time
+from collections import OrderedDict
 from typing import Any
 
 from config import config
 from modules import FileManager, Summarizer, TextProcessor, WebScraper
+from modules.boilerplate import BoilerplateIndex, create_boilerplate_index, remove_boilerplate
 from modules.cache import CacheBackend, create_cache_backend
+from modules.cpu_pool import cpu_pool
 
 logger = logging.getLogger(__name__)
 
@@ -16,12 +20,24 @@ logger = logging.getLogger(__name__)
 class ArticlePipelineRunner:
     """Clean application-facing pipeline runner."""
 
-    def __init__(self, cache_backend: CacheBackend | None = None) -> None:
+    def __init__(
+        self,
+        cache_backend: CacheBackend | None = None,
+        boilerplate_index: BoilerplateIndex | None = None,
+    ) -> None:
         self.cache_backend = cache_backend or create_cache_backend(ttl=config.output.cache_ttl)
-        self.web_scraper = WebScraper()
+        self.boilerplate_index = boilerplate_index or (
+            create_boilerplate_index() if config.processing.boilerplate_filter else None
+        )
+        self.web_scraper = WebScraper(cache_backend=self.cache_backend)
         self.text_processor = TextProcessor()
-        self.summarizer = Summarizer()
+        self.summarizer = Summarizer(cache_backend=self.cache_backend)
         self.file_manager = FileManager(cache_backend=self.cache_backend)
+        # Scraped and processed article per URL, whatever the method and length:
+        # a length switch skips scraping and TextProcessor and re-selects from
+        # the summarizer's cached ranking
+        self._prepared: OrderedDict[str, tuple[dict, dict]] = OrderedDict()
+        self._prepared_lock = threading.Lock()
 
     def run(
         self,
@@ -33,19 +49,14 @@ class ArticlePipelineRunner:
         effective_length = length or config.summarization.summary_length
         start = time.time()
 
-        cached = self.file_manager.load_cached_result(url)
+        # Results are cached per method and length; switching length reuses the
+        # processed article and re-selects from the summarizer's cached ranking
+        cached = self.file_manager.load_cached_result(url, effective_method, effective_length)
         if cached:
             return cached
 
         try:
-            scraped = self.web_scraper.scrape_article(url)
-            if not scraped.get("content") or len(scraped["content"].strip()) < 100:
-                raise ValueError("Insufficient content extracted.")
-
-            processed = self.text_processor.process_text(scraped["content"])
-            if len(processed.get("sentences", [])) < 1:
-                raise ValueError("Insufficient sentences after processing.")
-
+            scraped, processed = self._prepare(url)
             summary = self.summarizer.summarize(
                 processed,
                 method=effective_method,
@@ -65,7 +76,7 @@ class ArticlePipelineRunner:
                 "statistics": files["summary_stats"],
                 "timestamp": time.time(),
             }
-            self.file_manager.save_to_cache(url, result)
+            self.file_manager.save_to_cache(url, result, effective_method, effective_length)
             return result
         except Exception as exc:
             logger.error("Pipeline failed for %s: %s", url, exc)
@@ -77,9 +88,44 @@ class ArticlePipelineRunner:
                 "timestamp": time.time(),
             }
 
+    def _prepare(self, url: str) -> tuple[dict, dict]:
+        """Scraped and processed article at *url*, from the in-process LRU if present."""
+        with self._prepared_lock:
+            prepared = self._prepared.get(url)
+            if prepared is not None:
+                self._prepared.move_to_end(url)
+                return prepared
+
+        scraped = self.web_scraper.scrape_article(url)
+        if not scraped.get("content") or len(scraped["content"].strip()) < 100:
+            raise ValueError("Insufficient content extracted.")
+
+        processed = (
+            cpu_pool.process_text(scraped["content"])
+            if cpu_pool.enabled
+            else self.text_processor.process_text(scraped["content"])
+        )
+        if self.boilerplate_index is not None and remove_boilerplate(
+            self.boilerplate_index, url, processed
+        ):
+            self.text_processor.refresh_statistics(processed)
+        if len(processed.get("sentences", [])) < 1:
+            raise ValueError("Insufficient sentences after processing.")
+
+        if config.output.processed_cache_size > 0:
+            with self._prepared_lock:
+                self._prepared[url] = (scraped, processed)
+                self._prepared.move_to_end(url)
+                while len(self._prepared) > config.output.processed_cache_size:
+                    self._prepared.popitem(last=False)
+        return scraped, processed
+
     def clear_cache(self) -> None:
         self.file_manager.clear_cache()
+        with self._prepared_lock:
+            self._prepared.clear()
         self.web_scraper.clear_cache()
+        self.summarizer.rankings.clear()
 
     def get_status(self) -> dict[str, Any]:
         return {
@@ -92,6 +138,7 @@ class ArticlePipelineRunner:
                 "gemini_model": config.gemini.model_id,
             },
             "storage_info": self.file_manager.get_storage_info(),
+            "host_timeouts": self.web_scraper.get_host_timeouts(),
             "modules_loaded": {
                 "web_scraper": True,
                 "text_processor": True,
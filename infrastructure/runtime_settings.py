@@ -36,6 +36,10 @@ class RuntimeSettingsApplier:
                 rebuild_summarizer = True
             elif key == "summarization.default_length":
                 config.summarization.summary_length = str(value)
+            elif key == "summarization.mmr_lambda":
+                config.summarization.mmr_lambda = float(value)
+            elif key == "summarization.redundancy_threshold":
+                config.summarization.redundancy_threshold = float(value)
             elif key == "summarization.gemini_model_id":
                 config.gemini.model_id = str(value)
                 rebuild_summarizer = True
@@ -76,12 +80,16 @@ class RuntimeSettingsApplier:
             )
 
         if rebuild_summarizer:
-            self._pipeline_runner.summarizer = Summarizer()
+            self._pipeline_runner.summarizer = Summarizer(
+                cache_backend=self._pipeline_runner.cache_backend
+            )
 
         if rebuild_cache_backend:
             cache_backend = create_cache_backend(ttl=config.output.cache_ttl)
             self._pipeline_runner.cache_backend = cache_backend
             self._pipeline_runner.file_manager.cache_backend = cache_backend
+            self._pipeline_runner.web_scraper.cache_backend = cache_backend
+            self._pipeline_runner.summarizer.cache_backend = cache_backend
 
         if rebuild_rate_limiters:
             self._rate_limiters.clear()
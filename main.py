@@ -27,7 +27,7 @@ def _build_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "--method",
         "-m",
-        choices=["extractive", "generative"],
+        choices=["extractive", "lexrank", "generative"],
         help="Summarisation method",
     )
     parser.add_argument(
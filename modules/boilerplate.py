@@ -0,0 +1,228 @@
+"""
+Boilerplate Index — cross-page sentence fingerprints per hostname
+=================================================================
+
+Articles from one publisher repeat the same footer, newsletter and
+disclaimer sentences; they pass the per-sentence filters and then compete
+with the article text for the summary. This module remembers, per hostname,
+on how many distinct pages each sentence fingerprint was seen:
+
+- ``sentence_fingerprint`` hashes the normalized sentence (lower-cased word
+  tokens, digits folded to ``0`` so "© 2024" and "© 2025" match);
+- ``BoilerplateIndex.observe`` records one page and returns the host's page
+  count and the page count of each fingerprint. A URL is only counted once;
+- ``remove_boilerplate`` drops, before summarization, the sentences seen on
+  at least ``boilerplate_min_pages`` pages that make up at least
+  ``boilerplate_min_share`` of the host's pages.
+
+Redis keeps the index shared across workers when ``REDIS_URL`` is set;
+otherwise a bounded in-process index is used.
+
+Usage::
+
+    from modules.boilerplate import create_boilerplate_index, remove_boilerplate
+
+    index = create_boilerplate_index()
+    removed = remove_boilerplate(index, url, processed)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import re
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Sequence
+from urllib.parse import urlparse
+
+from config import config
+from modules.document import Document, tokenize
+
+logger = logging.getLogger(__name__)
+
+_DIGIT_RE = re.compile(r"\d")
+
+
+def sentence_fingerprint(sentence: str) -> str:
+    """Hash of *sentence* that ignores case, punctuation, spacing and digit values."""
+    normalized = _DIGIT_RE.sub("0", " ".join(tokenize(sentence)))
+    return hashlib.blake2b(normalized.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def _document_fingerprints(document: Document) -> list[str]:
+    """``sentence_fingerprint`` of each sentence, from the stored token ids."""
+    terms = document.terms
+    ids = document.token_ids.tolist()
+    bounds = document.offsets.tolist()
+    return [
+        hashlib.blake2b(
+            _DIGIT_RE.sub("0", " ".join([terms[i] for i in ids[lo:hi]])).encode("utf-8"),
+            digest_size=8,
+        ).hexdigest()
+        for lo, hi in zip(bounds, bounds[1:], strict=False)
+    ]
+
+
+def _page_key(url: str) -> str:
+    return hashlib.blake2b(url.encode("utf-8"), digest_size=8).hexdigest()
+
+
+class BoilerplateIndex(ABC):
+    @abstractmethod
+    def observe(self, host: str, url: str, fingerprints: Sequence[str]) -> tuple[int, list[int]]:
+        """Record the page *url* of *host* (once per URL).
+
+        Returns the number of pages seen for *host* and, for each of
+        *fingerprints*, the number of those pages that contained it.
+        """
+
+    @abstractmethod
+    def clear(self) -> None: ...
+
+
+class RedisBoilerplateIndex(BoilerplateIndex):
+    """Per-host hash of fingerprint → page count, plus a set of counted pages."""
+
+    def __init__(self, redis_url: str, ttl: int) -> None:
+        import redis as redis_lib
+
+        self._r = redis_lib.from_url(redis_url, decode_responses=True)
+        self._ttl = ttl
+
+    def observe(self, host: str, url: str, fingerprints: Sequence[str]) -> tuple[int, list[int]]:
+        counts_key, pages_key = f"boilerplate:{host}", f"boilerplate:{host}:pages"
+        try:
+            if self._r.sadd(pages_key, _page_key(url)):
+                pipe = self._r.pipeline()
+                for fingerprint in set(fingerprints):
+                    pipe.hincrby(counts_key, fingerprint, 1)
+                pipe.expire(counts_key, self._ttl)
+                pipe.expire(pages_key, self._ttl)
+                pipe.execute()
+            pipe = self._r.pipeline()
+            pipe.scard(pages_key)
+            pipe.hmget(counts_key, list(fingerprints))
+            pages, counts = pipe.execute()
+            return int(pages), [int(count or 0) for count in counts]
+        except Exception as exc:
+            logger.warning("Redis boilerplate index error: %s", exc)
+            return 0, [0] * len(fingerprints)
+
+    def clear(self) -> None:
+        try:
+            keys = self._r.keys("boilerplate:*")
+            if keys:
+                self._r.delete(*keys)
+        except Exception as exc:
+            logger.warning("Redis boilerplate clear error: %s", exc)
+
+
+class _HostFingerprints:
+    __slots__ = ("pages", "counts")
+
+    def __init__(self) -> None:
+        self.pages: OrderedDict[str, None] = OrderedDict()
+        self.counts: dict[str, int] = {}
+
+
+class InMemoryBoilerplateIndex(BoilerplateIndex):
+    """Bounded, thread-safe index for a single process.
+
+    At most *max_hosts* hosts are kept (least recently observed evicted).
+    A host's fingerprints seen on a single page are pruned once it holds
+    more than *max_fingerprints*, and only its latest *max_pages* URLs are
+    remembered for de-duplication.
+    """
+
+    def __init__(
+        self, max_hosts: int = 1024, max_fingerprints: int = 50_000, max_pages: int = 10_000
+    ) -> None:
+        self._hosts: OrderedDict[str, _HostFingerprints] = OrderedDict()
+        self._max_hosts = max_hosts
+        self._max_fingerprints = max_fingerprints
+        self._max_pages = max_pages
+        self._page_counts: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, host: str, url: str, fingerprints: Sequence[str]) -> tuple[int, list[int]]:
+        key = _page_key(url)
+        with self._lock:
+            state = self._hosts.get(host)
+            if state is None:
+                if len(self._hosts) >= self._max_hosts:
+                    evicted, _ = self._hosts.popitem(last=False)
+                    self._page_counts.pop(evicted, None)
+                state = self._hosts[host] = _HostFingerprints()
+            self._hosts.move_to_end(host)
+
+            counts = state.counts
+            if key not in state.pages:
+                state.pages[key] = None
+                if len(state.pages) > self._max_pages:
+                    state.pages.popitem(last=False)
+                self._page_counts[host] = self._page_counts.get(host, 0) + 1
+                for fingerprint in set(fingerprints):
+                    counts[fingerprint] = counts.get(fingerprint, 0) + 1
+                if len(counts) > self._max_fingerprints:
+                    state.counts = counts = {f: n for f, n in counts.items() if n > 1}
+            return self._page_counts[host], [counts.get(f, 0) for f in fingerprints]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._hosts.clear()
+            self._page_counts.clear()
+
+
+def create_boilerplate_index() -> BoilerplateIndex:
+    """Factory: Redis if REDIS_URL is set, else in-process."""
+    redis_url = os.getenv("REDIS_URL", "")
+    if redis_url:
+        try:
+            index = RedisBoilerplateIndex(redis_url, ttl=config.processing.boilerplate_ttl)
+            index._r.ping()
+            logger.info("Boilerplate index: Redis")
+            return index
+        except Exception as exc:
+            logger.warning("Redis unavailable for boilerplate index (%s) — using in-memory.", exc)
+    logger.info("Boilerplate index: in-memory")
+    return InMemoryBoilerplateIndex()
+
+
+def remove_boilerplate(index: BoilerplateIndex, url: str, processed: dict) -> int:
+    """Record *processed*'s sentences for *url*'s host and drop its boilerplate.
+
+    Updates ``processed["sentences"]`` and ``processed["document"]`` in place
+    and returns how many sentences were dropped. When every sentence would
+    go, nothing is dropped.
+    """
+    host = urlparse(url).hostname
+    sentences = processed.get("sentences")
+    if not host or not sentences:
+        return 0
+    document = processed.get("document")
+    if document is not None and len(document) == len(sentences):
+        fingerprints = _document_fingerprints(document)
+    else:
+        document = None
+        fingerprints = [sentence_fingerprint(s) for s in sentences]
+
+    pages, counts = index.observe(host, url, fingerprints)
+    threshold = max(
+        config.processing.boilerplate_min_pages, config.processing.boilerplate_min_share * pages
+    )
+    kept = [i for i, count in enumerate(counts) if count < threshold]
+    removed = len(counts) - len(kept)
+    if not removed or not kept:
+        return 0
+
+    if document is not None:
+        document = document.select(kept)
+        processed["document"] = document
+        processed["sentences"] = document.sentences
+    else:
+        processed["sentences"] = [sentences[i] for i in kept]
+    logger.info("Dropped %d boilerplate sentences seen across %d pages of %s", removed, pages, host)
+    return removed
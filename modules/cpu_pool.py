@@ -0,0 +1,208 @@
+"""
+CPU Pool — warm process pool for the CPU-bound pipeline stages
+==============================================================
+
+In thread-dispatcher mode (no Celery) every task runs in a thread of the web
+process, so text processing, extractive scoring and HTML extraction contend
+for the GIL with request handling. Once enabled, ``cpu_pool`` runs those
+stages in a ``ProcessPoolExecutor`` instead; fetching stays in the calling
+thread.
+
+- Workers are spawned (never forked from a threaded server) on first use and
+  warmed by their initializer: NLTK punkt and stopwords, sklearn, the
+  language model and the processor / summarizer / extractor instances.
+- Payloads stay compact: raw HTML goes in as bytes, ``process_text`` results
+  come back without the raw text the caller already holds, and span-backed
+  sentences pickle only the text they reference (``TextSpans.__reduce__``).
+- A broken pool (a worker was killed) is discarded and the stage runs inline;
+  the next call starts a fresh pool.
+
+Usage::
+
+    from modules.cpu_pool import cpu_pool
+
+    cpu_pool.enable(workers=2)  # spawns and warms the workers in the background
+    processed = cpu_pool.process_text(raw_text)
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import multiprocessing
+import threading
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from modules.ranking_cache import RankingSettings
+
+logger = logging.getLogger(__name__)
+
+
+# ---------------------------------------------------------------------------
+# Worker side (module-level so the functions pickle by reference)
+# ---------------------------------------------------------------------------
+
+_workers: dict[str, Any] = {}
+
+
+def _worker(name: str) -> Any:
+    """Per-process stage instance, created on first use (or by ``_warm_worker``)."""
+    instance = _workers.get(name)
+    if instance is None:
+        if name == "processor":
+            from modules.text_processor import TextProcessor  # noqa: PLC0415
+
+            instance = TextProcessor()
+        elif name == "summarizer":
+            from modules.summarizer import ExtractiveSummarizer  # noqa: PLC0415
+
+            instance = ExtractiveSummarizer()
+        else:
+            from modules.web_scraper import WebScraper  # noqa: PLC0415
+
+            instance = WebScraper()
+        _workers[name] = instance
+    return instance
+
+
+def _warm_worker() -> None:
+    """Pool initializer: pay every import and lazy load before the first task."""
+    from modules.language_id import language_identifier  # noqa: PLC0415
+    from modules.nltk_resources import NLTKResourceError, sentence_tokenizer  # noqa: PLC0415
+    from modules.stopwords import stopword_registry  # noqa: PLC0415
+
+    for name in ("processor", "summarizer", "extractor"):
+        _worker(name)
+    for language in stopword_registry:
+        try:
+            stopword_registry[language]
+            sentence_tokenizer(language)
+        except NLTKResourceError:
+            pass
+    language_identifier.model  # noqa: B018 — loads (or builds) the model
+
+
+def _process_text(raw_text: str) -> dict:
+    processed = _worker("processor").process_text(raw_text)
+    del processed["original_text"]  # the caller already holds it
+    return processed
+
+
+def _rank_extractive(
+    sentences, processed_data: dict, method: str, settings: RankingSettings
+) -> dict:
+    return _worker("summarizer").rank(sentences, processed_data, method, settings)
+
+
+def _rank_extractive_many(batch, method: str, settings: RankingSettings) -> list[dict]:
+    return _worker("summarizer").rank_many(batch, method, settings)
+
+
+def _extract_html(
+    raw: bytes, encoding: str, url: str, base_url: str, find_pages: bool
+) -> tuple[dict, list[str]]:
+    return _worker("extractor")._parse_html(raw, encoding, url, base_url, find_pages)
+
+
+# ---------------------------------------------------------------------------
+# Caller side
+# ---------------------------------------------------------------------------
+
+
+class CPUPool:
+    """Lazily started, process-wide pool for the CPU-bound stages."""
+
+    def __init__(self) -> None:
+        self.workers = 0
+        self._executor: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+        atexit.register(self.shutdown)
+
+    @property
+    def enabled(self) -> bool:
+        return self.workers > 0
+
+    def enable(self, workers: int, prestart: bool = True) -> None:
+        """Route the CPU-bound stages through *workers* processes (0 disables).
+
+        With *prestart*, the workers are spawned and warmed in the background
+        now rather than on the first task.
+        """
+        with self._lock:
+            if workers != self.workers:
+                self._shutdown_locked()
+            self.workers = max(0, workers)
+        if prestart and self.enabled:
+            executor = self._get_executor()
+            for _ in range(self.workers):
+                executor.submit(int)
+
+    def process_text(self, raw_text: str) -> dict:
+        processed = self._run(_process_text, raw_text)
+        processed["original_text"] = raw_text
+        return processed
+
+    def rank_extractive(
+        self, sentences, processed_data: dict, method: str, settings: RankingSettings
+    ) -> dict:
+        """``ExtractiveSummarizer.rank`` in a worker.
+
+        *settings* travel with the task: workers only hold the env-default
+        config, not settings changed at runtime in this process.
+        """
+        # The processor output minus what scoring does not read
+        payload = {
+            key: processed_data[key] for key in ("language", "document") if key in processed_data
+        }
+        return self._run(_rank_extractive, sentences, payload, method, settings)
+
+    def rank_extractive_many(self, batch, method: str, settings: RankingSettings) -> list[dict]:
+        payload = [
+            (sentences, {k: data[k] for k in ("language", "document") if k in data})
+            for sentences, data in batch
+        ]
+        return self._run(_rank_extractive_many, payload, method, settings)
+
+    def extract_html(
+        self, raw: bytes, encoding: str, url: str, base_url: str, find_pages: bool
+    ) -> tuple[dict, list[str]]:
+        return self._run(_extract_html, raw, encoding, url, base_url, find_pages)
+
+    def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        if not self.enabled:
+            return func(*args)
+        try:
+            return self._get_executor().submit(func, *args).result()
+        except BrokenProcessPool as exc:
+            logger.warning("CPU pool broken (%s); running %s inline.", exc, func.__name__)
+            with self._lock:
+                self._shutdown_locked()
+            return func(*args)
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_warm_worker,
+                )
+                logger.info("Started CPU pool with %d worker processes.", self.workers)
+            return self._executor
+
+    def shutdown(self) -> None:
+        with self._lock:
+            self._shutdown_locked()
+
+    def _shutdown_locked(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+# Module-level singleton (disabled until the container enables it)
+cpu_pool = CPUPool()
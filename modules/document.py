@@ -0,0 +1,293 @@
+"""
+Document — tokenized text shared by the processing stages
+=========================================================
+
+``TextProcessor.process_text`` tokenizes its sentences once into a
+``Document``:
+
+- ``vocabulary`` maps each distinct term to an integer id (``terms`` is the
+  reverse mapping);
+- ``token_ids`` holds the ids of every sentence's tokens back to back, and
+  ``offsets[i]:offsets[i + 1]`` is sentence *i*'s slice of it.
+
+Statistics, the extractive summarizer and the file manager read word counts,
+per-sentence token sets and sparse term matrices from the document instead of
+re-tokenizing the text. Tokens are lower-cased ``\\w+`` runs.
+
+Sentences and paragraphs are ``TextSpans``: one backing string (the cleaned
+text) plus ``array``-backed start/end offsets. A span is only turned into a
+``str`` when it is indexed, so a task holds one copy of the text rather than
+one per representation.
+
+Usage::
+
+    from modules.document import Document, TextSpans
+
+    sentences = TextSpans(clean_text, join_lines=True)
+    sentences.append(0, 42)
+    doc = Document.from_sentences(sentences, language="en")
+    counts = doc.term_matrix(exclude=stop_words, ngram_range=(1, 2))
+"""
+
+from __future__ import annotations
+
+import re
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from itertools import accumulate
+
+import numpy as np
+from scipy.sparse import csr_matrix
+
+from config import DEFAULT_LANGUAGE
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> list[str]:
+    """The document tokens of *text*: lower-cased ``\\w+`` runs."""
+    return _TOKEN_RE.findall(text.lower())
+
+
+class TextSpans(Sequence[str]):
+    """Read-only sequence of substrings of *text*, stored as offsets.
+
+    With *join_lines*, a span that crosses line breaks reads back with its
+    whitespace collapsed (sentences wrap across lines; paragraphs keep them).
+    """
+
+    __slots__ = ("text", "starts", "ends", "join_lines")
+
+    def __init__(
+        self,
+        text: str,
+        starts: array | None = None,
+        ends: array | None = None,
+        join_lines: bool = False,
+    ) -> None:
+        self.text = text
+        self.starts = starts if starts is not None else array("q")
+        self.ends = ends if ends is not None else array("q")
+        self.join_lines = join_lines
+
+    def append(self, start: int, end: int) -> None:
+        self.starts.append(start)
+        self.ends.append(end)
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __getitem__(self, index):  # type: ignore[override]
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        piece = self.text[self.starts[index] : self.ends[index]]
+        if self.join_lines and "\n" in piece:
+            piece = " ".join(piece.split())
+        return piece
+
+    def __iter__(self) -> Iterator[str]:
+        return map(self.__getitem__, range(len(self)))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, TextSpans) and other.text is self.text:
+            return (self.starts, self.ends, self.join_lines) == (
+                other.starts,
+                other.ends,
+                other.join_lines,
+            )
+        return isinstance(other, Sequence) and len(self) == len(other) and list(self) == list(other)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"TextSpans({len(self)} spans over {len(self.text)} chars)"
+
+    def __reduce__(self):
+        lengths = self.span_lengths()
+        if 2 * sum(lengths) >= len(self.text):
+            return (TextSpans, (self.text, self.starts, self.ends, self.join_lines))
+        # Mostly unreferenced text (e.g. a filtered subset): pickle only the
+        # spanned pieces, re-based onto their concatenation
+        text = self.text
+        pieces = [text[start:end] for start, end in zip(self.starts, self.ends, strict=True)]
+        ends = array("q", accumulate(lengths))
+        starts = array("q", [end - length for end, length in zip(ends, lengths, strict=True)])
+        return (TextSpans, ("".join(pieces), starts, ends, self.join_lines))
+
+    def span_lengths(self) -> list[int]:
+        """Length of each span in the backing text (no strings materialized)."""
+        return [end - start for start, end in zip(self.starts, self.ends, strict=True)]
+
+    def select(self, indices: Iterable[int]) -> TextSpans:
+        """Spans at *indices*, over the same backing text."""
+        starts, ends = self.starts, self.ends
+        indices = list(indices)
+        return TextSpans(
+            self.text,
+            array("q", [starts[i] for i in indices]),
+            array("q", [ends[i] for i in indices]),
+            self.join_lines,
+        )
+
+
+class Document:
+    """Sentences plus their token ids, vocabulary and sentence boundaries."""
+
+    __slots__ = ("sentences", "language", "vocabulary", "terms", "token_ids", "offsets")
+
+    def __init__(
+        self,
+        sentences: Sequence[str],
+        language: str,
+        vocabulary: dict[str, int],
+        terms: list[str],
+        token_ids: np.ndarray,
+        offsets: np.ndarray,
+    ) -> None:
+        self.sentences = sentences
+        self.language = language
+        self.vocabulary = vocabulary
+        self.terms = terms
+        self.token_ids = token_ids  # int32, all sentences' tokens in order
+        self.offsets = offsets  # int64, len(sentences) + 1 boundaries into token_ids
+
+    @classmethod
+    def from_sentences(cls, sentences: Iterable[str], language: str = DEFAULT_LANGUAGE) -> Document:
+        """Tokenize *sentences* once, assigning term ids in first-seen order.
+
+        A sequence (e.g. ``TextSpans``) is kept as is, not copied into a list.
+        """
+        if not isinstance(sentences, Sequence):
+            sentences = list(sentences)
+        vocabulary: dict[str, int] = {}
+        intern = vocabulary.setdefault
+        ids: list[int] = []
+        offsets = [0]
+        for sentence in sentences:
+            ids.extend([intern(token, len(vocabulary)) for token in tokenize(sentence)])
+            offsets.append(len(ids))
+        return cls(
+            sentences=sentences,
+            language=language,
+            vocabulary=vocabulary,
+            terms=list(vocabulary),
+            token_ids=np.array(ids, dtype=np.int32),
+            offsets=np.array(offsets, dtype=np.int64),
+        )
+
+    def __len__(self) -> int:
+        return len(self.sentences)
+
+    @property
+    def word_count(self) -> int:
+        return int(self.token_ids.size)
+
+    def sentence_lengths(self) -> np.ndarray:
+        """Token count of each sentence."""
+        return np.diff(self.offsets)
+
+    def sentence_ids(self, index: int) -> np.ndarray:
+        return self.token_ids[self.offsets[index] : self.offsets[index + 1]]
+
+    def token_sets(self) -> list[frozenset[int]]:
+        """Distinct term ids of each sentence (for overlap / redundancy checks)."""
+        ids = self.token_ids.tolist()
+        bounds = self.offsets.tolist()
+        return [frozenset(ids[lo:hi]) for lo, hi in zip(bounds, bounds[1:], strict=False)]
+
+    def term_ids(self, words: Iterable[str]) -> np.ndarray:
+        """Ids of those *words* that occur in the document."""
+        vocabulary = self.vocabulary
+        return np.array([vocabulary[w] for w in words if w in vocabulary], dtype=np.int32)
+
+    def select(self, indices: Sequence[int]) -> Document:
+        """Document over the sentences at *indices*, sharing this vocabulary."""
+        bounds = self.offsets
+        parts = [self.token_ids[bounds[i] : bounds[i + 1]] for i in indices]
+        lengths = np.array([p.size for p in parts], dtype=np.int64)
+        return Document(
+            sentences=(
+                self.sentences.select(indices)
+                if isinstance(self.sentences, TextSpans)
+                else [self.sentences[i] for i in indices]
+            ),
+            language=self.language,
+            vocabulary=self.vocabulary,
+            terms=self.terms,
+            token_ids=np.concatenate(parts) if parts else self.token_ids[:0],
+            offsets=np.concatenate(([0], np.cumsum(lengths))),
+        )
+
+    def section(self, start: int, stop: int) -> Document:
+        """Document over sentences ``start:stop``, sharing this vocabulary (no copies)."""
+        sentences = self.sentences
+        if isinstance(sentences, TextSpans):
+            sentences = TextSpans(
+                sentences.text,
+                sentences.starts[start:stop],
+                sentences.ends[start:stop],
+                sentences.join_lines,
+            )
+        else:
+            sentences = sentences[start:stop]
+        bounds = self.offsets[start : stop + 1]
+        return Document(
+            sentences=sentences,
+            language=self.language,
+            vocabulary=self.vocabulary,
+            terms=self.terms,
+            token_ids=self.token_ids[bounds[0] : bounds[-1]],
+            offsets=bounds - bounds[0],
+        )
+
+    def term_matrix(
+        self,
+        exclude: Iterable[str] = (),
+        ngram_range: tuple[int, int] = (1, 1),
+        max_features: int | None = None,
+        min_chars: int = 2,
+    ) -> csr_matrix:
+        """Sentence × term count matrix, built from the stored token ids.
+
+        Mirrors ``CountVectorizer`` defaults: terms shorter than *min_chars*
+        and those in *exclude* are dropped before bigrams are formed, and
+        *max_features* keeps the most frequent columns. Column order is
+        unspecified. Only unigrams and bigrams are supported.
+
+        Raises:
+            ValueError: if no term survives the filtering (empty vocabulary).
+        """
+        low, high = ngram_range
+        if not 1 <= low <= high <= 2:
+            raise ValueError(f"Unsupported ngram_range {ngram_range!r}")
+        n_terms = len(self.terms)
+        allowed = np.fromiter((len(t) >= min_chars for t in self.terms), bool, n_terms)
+        allowed[self.term_ids(exclude)] = False
+
+        rows = np.repeat(np.arange(len(self.sentences)), self.sentence_lengths())
+        keep = allowed[self.token_ids]
+        ids = self.token_ids[keep].astype(np.int64)
+        rows = rows[keep]
+
+        row_parts, key_parts = [], []
+        if low == 1:
+            row_parts.append(rows)
+            key_parts.append(ids)
+        if high == 2:
+            same = rows[:-1] == rows[1:]
+            row_parts.append(rows[:-1][same])
+            key_parts.append(n_terms + ids[:-1][same] * n_terms + ids[1:][same])
+        keys = np.concatenate(key_parts)
+        if not keys.size:
+            raise ValueError("empty vocabulary; the sentences only contain excluded terms")
+
+        _, columns = np.unique(keys, return_inverse=True)
+        matrix = csr_matrix(
+            (np.ones(keys.size, dtype=np.int64), (np.concatenate(row_parts), columns)),
+            shape=(len(self.sentences), int(columns.max()) + 1),
+        )
+        if max_features is not None and matrix.shape[1] > max_features:
+            totals = np.asarray(matrix.sum(axis=0)).ravel()
+            top = np.sort(np.argsort(-totals, kind="stable")[:max_features])
+            matrix = matrix[:, top]
+        return matrix
@@ -10,8 +10,20 @@ import re
 from datetime import datetime
 from pathlib import Path
 
+import numpy as np
+
 from config import SUPPORTED_FORMATS, config
 from modules.cache import CacheBackend, create_cache_backend
+from modules.document import TextSpans, tokenize
+
+
+def _json_default(value):
+    """Materialize span-backed sentences and score arrays only when writing JSON."""
+    if isinstance(value, TextSpans):
+        return list(value)
+    if isinstance(value, np.ndarray | np.generic):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
 
 
 class FileManager:
@@ -114,7 +126,7 @@ class FileManager:
         }
 
         # Add additional data based on summarization method
-        if summary_data.get("method_used") == "extractive":
+        if summary_data.get("method_used") in ("extractive", "lexrank"):
             result_data["extractive_data"] = {
                 "sentence_scores": summary_data.get("sentence_scores", []),
                 "selection_indices": summary_data.get("selection_indices", []),
@@ -134,23 +146,26 @@ class FileManager:
         """Calculate comprehensive processing statistics"""
 
         original_text = scraped_data.get("content", "")
-        processed_data.get("clean_text", "")
         summary_text = summary_data.get("summary", "")
 
-        # Text statistics
+        # Words are document tokens on both sides of the compression ratio, the
+        # same definition the processor's statistics use
         original_stats = processed_data.get("statistics", {})
+        original_words = original_stats.get("word_count")
+        if original_words is None:
+            original_words = len(tokenize(original_text))
 
         stats = {
             "original": {
                 "character_count": len(original_text),
-                "word_count": len(original_text.split()) if original_text else 0,
+                "word_count": original_words,
                 "sentence_count": len(processed_data.get("sentences", [])),
                 "paragraph_count": len(processed_data.get("paragraphs", [])),
             },
             "processed": original_stats,
             "summary": {
                 "character_count": len(summary_text),
-                "word_count": len(summary_text.split()) if summary_text else 0,
+                "word_count": len(tokenize(summary_text)),
                 "sentence_count": len(summary_data.get("selected_sentences", [])),
                 "compression_ratio": 0.0,
             },
@@ -295,25 +310,29 @@ class FileManager:
     def _save_json(self, result_data: dict, file_path: Path):
         """Save as JSON file"""
         with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(result_data, f, indent=2, ensure_ascii=False)
+            json.dump(result_data, f, indent=2, ensure_ascii=False, default=_json_default)
 
-    def load_cached_result(self, url: str) -> dict | None:
-        """Load cached result if available"""
+    def load_cached_result(
+        self, url: str, method: str | None = None, length: str | None = None
+    ) -> dict | None:
+        """Load cached result (for this method and length, when given) if available"""
         if not config.output.cache_enabled:
             return None
 
-        cache_key = self._get_cache_key(url)
+        cache_key = self._get_cache_key(url, method, length)
         cached_data = self.cache_backend.get(cache_key)
         if cached_data:
             self.logger.info("Using cached result")
         return cached_data
 
-    def save_to_cache(self, url: str, result_data: dict):
+    def save_to_cache(
+        self, url: str, result_data: dict, method: str | None = None, length: str | None = None
+    ):
         """Save result to cache"""
         if not config.output.cache_enabled:
             return
 
-        cache_key = self._get_cache_key(url)
+        cache_key = self._get_cache_key(url, method, length)
         try:
             cache_data = result_data.copy()
             cache_data["cached_at"] = datetime.now().isoformat()
@@ -323,9 +342,10 @@ class FileManager:
         except Exception as e:
             self.logger.warning(f"Failed to cache result: {str(e)}")
 
-    def _get_cache_key(self, url: str) -> str:
-        """Generate cache key for URL"""
-        return hashlib.md5(url.encode()).hexdigest()
+    def _get_cache_key(self, url: str, method: str | None = None, length: str | None = None) -> str:
+        """Generate cache key for URL (plus method and length, when given)"""
+        parts = [url] + [part for part in (method, length) if part]
+        return hashlib.md5("|".join(parts).encode()).hexdigest()
 
     def clear_cache(self):
         """Clear all cached files"""
@@ -12,9 +12,17 @@ Configuration (env vars):
                         Refer to the official model list:
                         https://ai.google.dev/gemini-api/docs/models
 
+Response cache:
+    With a cache backend and CACHE_ENABLED on, responses are stored under
+    ``response_key``, a hash of the model id, the length instruction, the
+    prompt version and the (truncated) article text. The same text reached
+    through another URL — a syndicated story — reuses the summary instead of
+    calling the API; the tokens it did not spend are counted in the
+    ``gemini_tokens_saved_total`` metric.
+
 Usage:
     from modules.gemini_summarizer import GeminiSummarizer
-    summarizer = GeminiSummarizer()
+    summarizer = GeminiSummarizer(cache_backend)
     result = summarizer.summarize(processed_data, length="medium")
 
 Note on preview models:
@@ -24,10 +32,12 @@ Note on preview models:
 
 from __future__ import annotations
 
+import hashlib
 import logging
 import textwrap
 
 from config import config
+from modules.cache import CacheBackend
 
 logger = logging.getLogger(__name__)
 
@@ -58,6 +68,10 @@ _SYSTEM_PROMPT = textwrap.dedent("""\
     - Write in the same language as the article.
 """)
 
+# Bump whenever _SYSTEM_PROMPT or the prompt layout changes: cached responses
+# were produced by the previous prompt
+_PROMPT_VERSION = 1
+
 _LENGTH_INSTRUCTIONS: dict[str, str] = {
     "short": "Write a concise summary in 2–3 sentences.",
     "medium": "Write a balanced summary in 4–6 sentences covering the main points.",
@@ -65,10 +79,32 @@ _LENGTH_INSTRUCTIONS: dict[str, str] = {
 }
 
 
+def response_key(model_id: str, length_instruction: str, text: str) -> str:
+    """Cache key of the Gemini response for *text* under one model and prompt."""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in (model_id, length_instruction, str(_PROMPT_VERSION), text):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return f"gemini_{digest.hexdigest()}"
+
+
+def _record_cache_lookup(result: str, usage: dict | None = None) -> None:
+    try:
+        from modules.metrics import GEMINI_CACHE_LOOKUPS, GEMINI_TOKENS_SAVED  # noqa: PLC0415
+
+        GEMINI_CACHE_LOOKUPS.labels(result=result).inc()
+        for kind in ("prompt", "candidates"):
+            tokens = (usage or {}).get(f"{kind}_tokens")
+            if tokens:
+                GEMINI_TOKENS_SAVED.labels(kind=kind).inc(tokens)
+    except Exception:
+        pass
+
+
 class GeminiSummarizer:
     """Summarise text using the Google Gemini API."""
 
-    def __init__(self) -> None:
+    def __init__(self, cache_backend: CacheBackend | None = None) -> None:
         if not _GENAI_AVAILABLE:
             raise ImportError(
                 "google-genai is required for Gemini summarisation. "
@@ -84,6 +120,8 @@ class GeminiSummarizer:
 
         self._client = genai.Client(api_key=api_key)
         self._model_id = config.gemini.model_id
+        # Responses by content hash (see response_key); None disables the cache
+        self.cache_backend = cache_backend
         logger.info("GeminiSummarizer initialised with model %r", self._model_id)
 
     def summarize(self, processed_data: dict, length: str | None = None) -> dict:
@@ -95,7 +133,8 @@ class GeminiSummarizer:
 
         Returns:
             Dict with keys: summary, method_used, model_name, input_chars,
-            output_chars, usage.
+            output_chars, usage, cached (True when served from the
+            response cache; usage is then the original call's).
         """
         summary_length = length or config.summarization.summary_length
         length_instruction = _LENGTH_INSTRUCTIONS.get(
@@ -104,7 +143,7 @@ class GeminiSummarizer:
 
         # Prefer filtered sentences over raw clean_text so that
         # navigation noise, numbered reference fragments, and other
-        # artefacts caught by _is_valid_sentence are excluded from
+        # artefacts caught by filter_sentences are excluded from
         # the Gemini prompt.
         sentences: list[str] = processed_data.get("sentences", [])
         clean_text = " ".join(sentences) if sentences else processed_data.get("clean_text", "")
@@ -121,6 +160,24 @@ class GeminiSummarizer:
                 config.gemini.max_input_chars,
             )
 
+        key = response_key(self._model_id, length_instruction, truncated)
+        use_cache = self.cache_backend is not None and config.output.cache_enabled
+        if use_cache:
+            cached = self.cache_backend.get(key)  # type: ignore[union-attr]
+            if cached and cached.get("summary"):
+                _record_cache_lookup("hit", cached.get("usage"))
+                logger.info("Gemini summary served from the response cache (%s)", key)
+                return {
+                    "summary": cached["summary"],
+                    "method_used": "generative",
+                    "model_name": self._model_id,
+                    "input_chars": len(truncated),
+                    "output_chars": len(cached["summary"]),
+                    "usage": cached.get("usage", {}),
+                    "cached": True,
+                }
+            _record_cache_lookup("miss")
+
         prompt = f"{_SYSTEM_PROMPT}\n{length_instruction}\n\nArticle text:\n\n{truncated}"
 
         logger.info(
@@ -165,6 +222,11 @@ class GeminiSummarizer:
             usage,
         )
 
+        if use_cache:
+            self.cache_backend.set(  # type: ignore[union-attr]
+                key, {"summary": summary_text, "usage": usage}, ttl=config.output.cache_ttl
+            )
+
         return {
             "summary": summary_text,
             "method_used": "generative",
@@ -172,4 +234,5 @@ class GeminiSummarizer:
             "input_chars": len(truncated),
             "output_chars": len(summary_text),
             "usage": usage,
+            "cached": False,
         }
@@ -0,0 +1,151 @@
+"""
+Host Latency Tracker — adaptive per-hostname timeouts
+=====================================================
+
+Keeps a streaming latency sketch per hostname (EWMA of the mean and of the
+variance of time-to-first-byte) and derives connect / read deadlines from an
+approximate p99, clamped to configured bounds.
+
+Until a host has ``min_samples`` observations the static
+``config.scraping.timeout`` is used, so cold hosts behave exactly as before.
+
+Usage::
+
+    from modules.host_latency import host_latency
+
+    connect, read = host_latency.get_timeouts("example.com")
+    start = time.monotonic()
+    response = session.get(url, timeout=(connect, read))
+    host_latency.record(hostname, time.monotonic() - start)
+
+Timeouts are recorded as censored observations (the deadline that expired),
+which pushes the estimate upwards for slow-but-healthy hosts.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from dataclasses import dataclass
+
+from config import config
+
+# z-score of the 99th percentile of a normal distribution
+_P99_Z = 2.326
+
+
+@dataclass
+class _HostLatency:
+    mean: float = 0.0
+    variance: float = 0.0
+    samples: int = 0
+    timeouts: int = 0
+    last_seen: float = 0.0
+
+    @property
+    def p99(self) -> float:
+        return self.mean + _P99_Z * math.sqrt(max(self.variance, 0.0))
+
+
+class HostLatencyTracker:
+    """Thread-safe EWMA latency sketch keyed by hostname."""
+
+    def __init__(self, alpha: float = 0.2, min_samples: int = 3, max_hosts: int = 1024) -> None:
+        self._alpha = alpha
+        self._min_samples = min_samples
+        self._max_hosts = max_hosts
+        self._hosts: dict[str, _HostLatency] = {}
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def record(self, hostname: str, seconds: float) -> None:
+        """Feed one successful latency observation (seconds) for *hostname*."""
+        with self._lock:
+            self._observe(self._get_state(hostname), seconds)
+
+    def record_timeout(self, hostname: str, deadline: float) -> None:
+        """Record that a request to *hostname* hit *deadline* without answering."""
+        with self._lock:
+            s = self._get_state(hostname)
+            s.timeouts += 1
+            self._observe(s, deadline)
+
+    def get_timeouts(self, hostname: str) -> tuple[float, float]:
+        """Return ``(connect_timeout, read_timeout)`` in seconds for *hostname*."""
+        cfg = config.scraping
+        with self._lock:
+            s = self._hosts.get(hostname)
+            if not cfg.adaptive_timeouts or s is None or s.samples < self._min_samples:
+                return float(cfg.timeout), float(cfg.timeout)
+            p99 = s.p99
+
+        connect = _clamp(
+            p99 * cfg.connect_timeout_factor, cfg.connect_timeout_min, cfg.connect_timeout_max
+        )
+        read = _clamp(p99 * cfg.read_timeout_factor, cfg.read_timeout_min, cfg.read_timeout_max)
+        return round(connect, 3), round(read, 3)
+
+    def get_status(self, hostname: str) -> dict:
+        """Return the learned latency and derived deadlines for *hostname*."""
+        connect, read = self.get_timeouts(hostname)
+        with self._lock:
+            s = self._hosts.get(hostname) or _HostLatency()
+            return {
+                "hostname": hostname,
+                "samples": s.samples,
+                "timeouts": s.timeouts,
+                "ewma_seconds": round(s.mean, 4),
+                "p99_seconds": round(s.p99, 4),
+                "connect_timeout": connect,
+                "read_timeout": read,
+            }
+
+    def snapshot(self) -> dict[str, dict]:
+        """Return learned values for every tracked host (for status endpoints)."""
+        with self._lock:
+            hostnames = list(self._hosts)
+        return {hostname: self.get_status(hostname) for hostname in hostnames}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._hosts.clear()
+
+    # ------------------------------------------------------------------
+    # Internal
+    # ------------------------------------------------------------------
+
+    def _get_state(self, hostname: str) -> _HostLatency:
+        s = self._hosts.get(hostname)
+        if s is None:
+            if len(self._hosts) >= self._max_hosts:
+                # Evict the least recently seen host to keep memory bounded
+                stalest = min(self._hosts, key=lambda h: self._hosts[h].last_seen)
+                del self._hosts[stalest]
+            s = self._hosts[hostname] = _HostLatency()
+        return s
+
+    def _observe(self, s: _HostLatency, seconds: float) -> None:
+        seconds = max(0.0, float(seconds))
+        s.last_seen = time.monotonic()
+        if s.samples == 0:
+            s.mean = seconds
+            s.variance = 0.0
+        else:
+            # Exponentially weighted mean / variance (West, 1979)
+            diff = seconds - s.mean
+            incr = self._alpha * diff
+            s.mean += incr
+            s.variance = (1 - self._alpha) * (s.variance + diff * incr)
+        s.samples += 1
+
+
+def _clamp(value: float, lower: float, upper: float) -> float:
+    return max(lower, min(upper, value))
+
+
+# Module-level singleton (shared across all WebScraper instances)
+host_latency = HostLatencyTracker()
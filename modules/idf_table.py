@@ -0,0 +1,298 @@
+"""
+IDF Table — background inverse document frequencies per language
+================================================================
+
+The default extractive scorer fits its vocabulary and IDF on the sentences
+of one article, which costs a fit per request and gives noisy weights for
+short articles. With ``TFIDF_MODE=hashed`` it instead hashes terms into a
+fixed feature space (sklearn's ``HashingVectorizer``, so nothing is fitted)
+and weights them by a background IDF learned offline:
+
+- ``build_idf_table`` counts, per language, in how many sentences each
+  hashed feature occurs (sentences are the "documents", as in the
+  per-article fit) and stores ``log((1 + S) / (1 + df)) + 1`` as one
+  ``(languages × features)`` float32 array;
+- the table is read from ``config.summarization.idf_table_path`` (relative
+  to the project root) on first use; a language it does not cover keeps
+  the per-article fit;
+- ``python -m modules.idf_table`` rebuilds it from the summaries stored in
+  ``config.output.output_dir`` (the JSON result files), one entry per URL;
+- ``idf_tables.version`` is a digest of the table in use, part of the
+  ranking cache key in hashed mode so a rebuilt table is not served stale
+  rankings.
+
+Usage::
+
+    python -m modules.idf_table --source outputs --min-sentences 500
+
+    from modules.idf_table import feature_ids, idf_tables
+
+    idf = idf_tables.weights("pt")  # None when the language is not covered
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from functools import cached_property
+from pathlib import Path
+
+import numpy as np
+from scipy.sparse import csr_matrix
+
+from config import config, project_path
+from modules.document import Document
+
+logger = logging.getLogger(__name__)
+
+
+def _single_term(term: str) -> tuple[str]:
+    return (term,)
+
+
+def feature_ids(terms: Sequence[str], n_features: int) -> np.ndarray:
+    """Hashed feature index of each of *terms* (one ``HashingVectorizer`` pass)."""
+    from sklearn.feature_extraction.text import HashingVectorizer  # noqa: PLC0415
+
+    if not terms:
+        return np.zeros(0, dtype=np.int64)
+    hasher = HashingVectorizer(
+        n_features=n_features, analyzer=_single_term, alternate_sign=False, norm=None
+    )
+    # One term per row, so each row holds exactly one stored feature
+    return hasher.transform(terms).indices.astype(np.int64)
+
+
+def hashed_counts(
+    document: Document, n_features: int, exclude: Iterable[str] = ()
+) -> tuple[csr_matrix, np.ndarray] | None:
+    """Sentence × feature count matrix of *document*'s unigrams.
+
+    Only the features that occur get a column; the second item maps each
+    column to its hashed feature index. As in ``Document.term_matrix``,
+    terms shorter than two characters and those in *exclude* are dropped.
+    Returns None when no term is left.
+    """
+    allowed = np.zeros(len(document.terms), dtype=bool)
+    used = np.unique(document.token_ids)
+    allowed[used] = [len(document.terms[i]) >= 2 for i in used.tolist()]
+    allowed[document.term_ids(exclude)] = False
+    keep = allowed[document.token_ids]
+    if not keep.any():
+        return None
+
+    ids = document.token_ids[keep]
+    terms = np.unique(ids)
+    # Hash only the terms this document (or section) uses, not the shared vocabulary
+    hashed = np.zeros(len(document.terms), dtype=np.int64)
+    hashed[terms] = feature_ids([document.terms[i] for i in terms.tolist()], n_features)
+    features, columns = np.unique(hashed[ids], return_inverse=True)
+    rows = np.repeat(np.arange(len(document)), document.sentence_lengths())[keep]
+    counts = csr_matrix(
+        (np.ones(ids.size, dtype=np.float32), (rows, columns)),
+        shape=(len(document), features.size),
+    )
+    counts.sum_duplicates()
+    return counts, features
+
+
+@dataclass(frozen=True)
+class IdfTable:
+    """Background IDF per language over ``n_features`` hashed features."""
+
+    languages: tuple[str, ...]
+    idf: np.ndarray  # (len(languages), n_features) float32
+    sentences: np.ndarray  # (len(languages),) int64: sentences counted per language
+
+    @property
+    def n_features(self) -> int:
+        return int(self.idf.shape[1])
+
+    @cached_property
+    def digest(self) -> str:
+        """Content hash of the languages and weights."""
+        digest = hashlib.blake2b(repr(self.languages).encode("utf-8"), digest_size=8)
+        digest.update(np.ascontiguousarray(self.idf).tobytes())
+        return digest.hexdigest()
+
+    def weights(self, language: str) -> np.ndarray | None:
+        try:
+            return self.idf[self.languages.index(language)]
+        except ValueError:
+            return None
+
+    def save(self, path: str) -> None:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "wb") as fh:
+            np.savez_compressed(
+                fh,
+                languages=np.array(self.languages),
+                idf=self.idf,
+                sentences=self.sentences,
+            )
+
+    @classmethod
+    def load(cls, path: str) -> IdfTable:
+        with np.load(path) as data:
+            return cls(
+                languages=tuple(str(lang) for lang in data["languages"]),
+                idf=data["idf"],
+                sentences=data["sentences"],
+            )
+
+
+# ---------------------------------------------------------------------------
+# Building
+# ---------------------------------------------------------------------------
+
+
+def build_idf_table(
+    documents: Iterable[tuple[str, Sequence[str]]],
+    n_features: int | None = None,
+    min_sentences: int = 1,
+) -> IdfTable:
+    """Background IDF from ``(language, sentences)`` pairs.
+
+    Languages with fewer than *min_sentences* sentences are left out.
+    """
+    n_features = n_features or config.summarization.idf_features
+    frequencies: dict[str, np.ndarray] = {}
+    counts: dict[str, int] = {}
+    for language, sentences in documents:
+        if not sentences:
+            continue
+        document = Document.from_sentences(sentences, language)
+        hashed = hashed_counts(document, n_features)
+        if hashed is not None:
+            # One stored entry per (sentence, feature): the sentence frequency
+            matrix, features = hashed
+            df = frequencies.setdefault(language, np.zeros(n_features, dtype=np.int64))
+            df += np.bincount(features[matrix.indices], minlength=n_features)
+        counts[language] = counts.get(language, 0) + len(document)
+
+    languages = tuple(sorted(lang for lang, n in counts.items() if n >= min_sentences))
+    idf = np.empty((len(languages), n_features), dtype=np.float32)
+    for row, language in enumerate(languages):
+        df = frequencies.get(language, 0)
+        idf[row] = np.log((1 + counts[language]) / (1 + df)) + 1
+    return IdfTable(
+        languages=languages,
+        idf=idf,
+        sentences=np.array([counts[lang] for lang in languages], dtype=np.int64),
+    )
+
+
+def stored_documents(output_dir: str) -> Iterator[tuple[str, list[str]]]:
+    """``(language, sentences)`` of each summarized article in *output_dir*.
+
+    Reads the JSON result files written by ``FileManager``; when one URL was
+    summarized several times, only its latest file is used.
+    """
+    latest: dict[str, tuple[float, Path]] = {}
+    for path in Path(output_dir).glob("*.json"):
+        try:
+            with open(path, encoding="utf-8") as fh:
+                data = json.load(fh)
+        except (OSError, ValueError) as exc:
+            logger.warning("Skipping unreadable result file %s: %s", path, exc)
+            continue
+        key = data.get("metadata", {}).get("url") or str(path)
+        mtime = path.stat().st_mtime
+        if key not in latest or latest[key][0] < mtime:
+            latest[key] = (mtime, path)
+
+    for _, path in latest.values():
+        with open(path, encoding="utf-8") as fh:
+            data = json.load(fh)
+        sentences = data.get("original_content", {}).get("sentences") or []
+        language = data.get("metadata", {}).get("language", "unknown")
+        if sentences and language != "unknown":
+            yield language, sentences
+
+
+# ---------------------------------------------------------------------------
+# Runtime access
+# ---------------------------------------------------------------------------
+
+
+class IdfTables:
+    """The table at ``config.summarization.idf_table_path``, loaded on first use."""
+
+    def __init__(self) -> None:
+        self._table: IdfTable | None = None
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    @property
+    def table(self) -> IdfTable | None:
+        if not self._loaded:
+            with self._lock:
+                if not self._loaded:
+                    self._table = self._load()
+                    self._loaded = True
+        return self._table
+
+    def weights(self, language: str) -> np.ndarray | None:
+        """IDF row for *language*, or None when there is no table for it."""
+        table = self.table
+        return table.weights(language) if table is not None else None
+
+    @property
+    def version(self) -> str | None:
+        """Digest of the table in use, or None when there is none."""
+        table = self.table
+        return table.digest if table is not None else None
+
+    def use(self, table: IdfTable | None) -> None:
+        """Serve *table* from now on (e.g. right after a rebuild)."""
+        with self._lock:
+            self._table = table
+            self._loaded = True
+
+    def reload(self) -> None:
+        with self._lock:
+            self._loaded = False
+
+    @staticmethod
+    def _load() -> IdfTable | None:
+        path = project_path(config.summarization.idf_table_path)
+        if not os.path.isfile(path):
+            logger.info("No IDF table at %s; hashed scoring falls back to per-article fits", path)
+            return None
+        try:
+            return IdfTable.load(path)
+        except Exception as exc:
+            logger.warning("Could not load IDF table %s: %s", path, exc)
+            return None
+
+
+# Module-level singleton (table loaded on first use)
+idf_tables = IdfTables()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Rebuild the background IDF table from stored summaries."
+    )
+    parser.add_argument("--source", default=config.output.output_dir)
+    parser.add_argument("--output", default=project_path(config.summarization.idf_table_path))
+    parser.add_argument("--features", type=int, default=config.summarization.idf_features)
+    parser.add_argument("--min-sentences", type=int, default=200)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    table = build_idf_table(stored_documents(args.source), args.features, args.min_sentences)
+    table.save(args.output)
+    for language, sentences in zip(table.languages, table.sentences.tolist(), strict=True):
+        logger.info("%s: %d sentences", language, sentences)
+    logger.info("Wrote %s (%d languages)", args.output, len(table.languages))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,299 @@
+"""
+Language Identification — hashed character n-gram model
+========================================================
+
+A compact naive-Bayes language identifier over character 1-3-grams, covering
+``SUPPORTED_LANGUAGES``:
+
+- the model is two NumPy arrays — a codepoint normalisation map and a
+  ``(languages × buckets)`` log-probability matrix indexed by a hash of each
+  n-gram — built once from the n-gram profiles shipped with ``langdetect``
+  and persisted to ``config.processing.langid_model_path`` at build time
+  (``python -m modules.language_id``); when the file is missing the model is
+  built in memory, never written from a request;
+- scoring a document is a vectorised hash of its n-grams followed by one
+  gather-and-sum over the matrix;
+- short texts are scored by stopword overlap first (n-gram evidence is thin
+  there), using the caller's stopword sets for the few languages the n-gram
+  scores rank highest, so only those stopword lists are loaded;
+- results are cached by a hash of the sample.
+
+Usage::
+
+    from modules.language_id import language_identifier
+
+    lang = language_identifier.detect(text[:1000], stopword_sets) or DEFAULT_LANGUAGE
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass
+
+import numpy as np
+
+from config import SUPPORTED_LANGUAGES, config, project_path
+
+logger = logging.getLogger(__name__)
+
+_BUCKETS = 1 << 16
+_SPACE = 0x20
+_MASK = (1 << 64) - 1
+# Odd 64-bit multipliers for the position 1..3 codepoints and the n-gram order
+_K1, _K2, _K3, _KN = (
+    0x9E3779B97F4A7C15,
+    0xC2B2AE3D27D4EB4F,
+    0x165667B19E3779F9,
+    0x27D4EB2F165667C5,
+)
+# Probability floor for n-grams a language's profile does not contain
+_FLOOR = 1e-5
+# langdetect profile names per ISO 639-1 code (Chinese has two profiles)
+_PROFILES: dict[str, tuple[str, ...]] = {"zh": ("zh-cn", "zh-tw")}
+
+# Languages only considered when their script occurs in the text: Korean
+# profiles are full of Hanja and would otherwise outscore Chinese on Han-only text
+_SCRIPT_GATES: dict[str, tuple[tuple[int, int], ...]] = {
+    "ko": ((0x1100, 0x11FF), (0x3130, 0x318F), (0xAC00, 0xD7A3)),
+    "ja": ((0x3040, 0x30FF),),
+}
+
+_WORD_RE = re.compile(r"\w+")
+# Languages (best n-gram scores first) whose stopwords vote on a short text
+_STOPWORD_CANDIDATES = 3
+
+
+@dataclass(frozen=True)
+class NgramModel:
+    """Arrays backing the identifier."""
+
+    languages: tuple[str, ...]
+    char_map: np.ndarray  # (0x10000,) uint32: lower-cased BMP codepoint → normalised codepoint
+    log_probs: np.ndarray  # (len(languages), _BUCKETS) float32
+
+    def save(self, path: str) -> None:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "wb") as fh:
+            np.savez_compressed(
+                fh,
+                languages=np.array(self.languages),
+                char_map=self.char_map,
+                log_probs=self.log_probs,
+            )
+
+    @classmethod
+    def load(cls, path: str) -> NgramModel:
+        with np.load(path) as data:
+            return cls(
+                languages=tuple(str(lang) for lang in data["languages"]),
+                char_map=data["char_map"],
+                log_probs=data["log_probs"],
+            )
+
+
+# ---------------------------------------------------------------------------
+# Hashing (shared by model building and scoring)
+# ---------------------------------------------------------------------------
+
+
+def _bucket(gram: str) -> int:
+    """Bucket of a single normalised n-gram — scalar twin of ``_buckets``."""
+    cps = [ord(c) for c in gram] + [0, 0]
+    h = (cps[0] * _K1 + cps[1] * _K2 + cps[2] * _K3 + len(gram) * _KN) & _MASK
+    return (h >> 48) & (_BUCKETS - 1)
+
+
+def _buckets(codepoints: np.ndarray) -> np.ndarray:
+    """Buckets of every 1-3-gram in a normalised codepoint sequence.
+
+    Follows langdetect's n-gram rules: runs of spaces collapse, the text is
+    padded with a leading space, no n-gram is a lone space and no trigram has
+    a space in the middle.
+    """
+    if codepoints.size:
+        keep = np.ones(codepoints.size, dtype=bool)
+        keep[1:] = ~((codepoints[1:] == _SPACE) & (codepoints[:-1] == _SPACE))
+        codepoints = codepoints[keep]
+    c = np.concatenate((np.array([_SPACE], dtype=np.uint64), codepoints.astype(np.uint64)))
+    k1, k2, k3 = np.uint64(_K1), np.uint64(_K2), np.uint64(_K3)
+
+    uni = c[c != _SPACE] * k1 + np.uint64(_KN)
+    bi = c[:-1] * k1 + c[1:] * k2 + np.uint64((2 * _KN) & _MASK)
+    mid_ok = c[1:-1] != _SPACE
+    tri = (
+        c[:-2][mid_ok] * k1
+        + c[1:-1][mid_ok] * k2
+        + c[2:][mid_ok] * k3
+        + np.uint64((3 * _KN) & _MASK)
+    )
+    hashes = np.concatenate((uni, bi, tri))
+    return ((hashes >> np.uint64(48)) & np.uint64(_BUCKETS - 1)).astype(np.intp)
+
+
+# ---------------------------------------------------------------------------
+# Model building
+# ---------------------------------------------------------------------------
+
+
+def build_model(languages: tuple[str, ...] = tuple(SUPPORTED_LANGUAGES)) -> NgramModel:
+    """Build the model from langdetect's bundled n-gram profiles."""
+    import langdetect  # noqa: PLC0415 — only needed to (re)build the model
+    from langdetect.utils.ngram import NGram  # noqa: PLC0415
+
+    profile_dir = os.path.join(os.path.dirname(langdetect.__file__), "profiles")
+    char_map = np.array(
+        [
+            ord(NGram.normalize(chr(cp))) if cp < 0xD800 or cp > 0xDFFF else _SPACE
+            for cp in range(0x10000)
+        ],
+        dtype=np.uint32,
+    )
+
+    log_probs = np.empty((len(languages), _BUCKETS), dtype=np.float32)
+    for row, lang in enumerate(languages):
+        freq: dict[str, int] = {}
+        n_words = [0, 0, 0]
+        for profile in _PROFILES.get(lang, (lang,)):
+            with open(os.path.join(profile_dir, profile), encoding="utf-8") as fh:
+                data = json.load(fh)
+            n_words = [a + b for a, b in zip(n_words, data["n_words"], strict=True)]
+            for gram, count in data["freq"].items():
+                gram = gram.lower()
+                if 1 <= len(gram) <= 3 and max(map(ord, gram)) <= 0xFFFF:
+                    freq[gram] = freq.get(gram, 0) + count
+
+        probs = np.zeros(_BUCKETS, dtype=np.float64)
+        for gram, count in freq.items():
+            probs[_bucket(gram)] += count / n_words[len(gram) - 1]
+        log_probs[row] = np.log(probs + _FLOOR)
+    return NgramModel(languages=tuple(languages), char_map=char_map, log_probs=log_probs)
+
+
+# ---------------------------------------------------------------------------
+# Identifier
+# ---------------------------------------------------------------------------
+
+
+class LanguageIdentifier:
+    """Thread-safe identifier with a content-hash result cache."""
+
+    def __init__(self, cache_size: int = 4096) -> None:
+        self._model: NgramModel | None = None
+        self._cache: OrderedDict[bytes, str | None] = OrderedDict()
+        self._cache_size = cache_size
+        self._lock = threading.Lock()
+
+    @property
+    def model(self) -> NgramModel:
+        if self._model is None:
+            with self._lock:
+                if self._model is None:
+                    self._model = self._load_model()
+        return self._model
+
+    def detect(
+        self, text: str, stopword_sets: Mapping[str, frozenset[str]] | None = None
+    ) -> str | None:
+        """ISO 639-1 code of *text*'s language, or None when there is no evidence."""
+        key = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+
+        language = None
+        if stopword_sets and len(text) < config.processing.langid_short_text_chars:
+            candidates = self._ngram_candidates(text, _STOPWORD_CANDIDATES)
+            language = self._stopword_vote(text, stopword_sets, candidates)
+        if language is None:
+            language = self._ngram_vote(text)
+
+        with self._lock:
+            self._cache[key] = language
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return language
+
+    def _ngram_vote(self, text: str) -> str | None:
+        candidates = self._ngram_candidates(text, 1)
+        return candidates[0] if candidates else None
+
+    def _ngram_candidates(self, text: str, count: int) -> list[str]:
+        """The *count* languages with the best n-gram scores, best first."""
+        model = self.model
+        codepoints = np.frombuffer(text.lower().encode("utf-32-le", "replace"), dtype=np.uint32)
+        normalised = np.where(
+            codepoints <= 0xFFFF, model.char_map[np.minimum(codepoints, 0xFFFF)], _SPACE
+        )
+        buckets = _buckets(normalised)
+        if not buckets.size:
+            return []
+        scores = model.log_probs[:, buckets].sum(axis=1)
+        for row, lang in enumerate(model.languages):
+            ranges = _SCRIPT_GATES.get(lang)
+            if ranges and not any(
+                ((codepoints >= lo) & (codepoints <= hi)).any() for lo, hi in ranges
+            ):
+                scores[row] = -np.inf
+        order = np.argsort(-scores, kind="stable")[:count]
+        return [model.languages[row] for row in order.tolist() if np.isfinite(scores[row])]
+
+    @staticmethod
+    def _stopword_vote(
+        text: str, stopword_sets: Mapping[str, frozenset[str]], candidates: list[str]
+    ) -> str | None:
+        """Candidate whose stopwords cover the most tokens (at least two, no tie).
+
+        Only the candidates' sets are looked up, so a lazily loading mapping
+        (``stopword_registry``) reads just those languages.
+        """
+        tokens = _WORD_RE.findall(text.lower())
+        ranked = []
+        for lang in candidates:
+            if lang in stopword_sets:
+                words = stopword_sets[lang]
+                ranked.append((sum(1 for t in tokens if t in words), lang))
+        ranked.sort(reverse=True)
+        if not ranked or ranked[0][0] < 2 or (len(ranked) > 1 and ranked[1][0] == ranked[0][0]):
+            return None
+        return ranked[0][1]
+
+    @staticmethod
+    def _load_model() -> NgramModel:
+        path = project_path(config.processing.langid_model_path)
+        if os.path.isfile(path):
+            try:
+                model = NgramModel.load(path)
+                if model.languages == tuple(SUPPORTED_LANGUAGES):
+                    return model
+            except Exception as exc:
+                logger.warning("Could not load language model %s: %s", path, exc)
+        # Not written from here: requests must not race to create build artifacts
+        logger.warning(
+            "No language model at %s; building it in memory "
+            "(run `python -m modules.language_id` at build time)",
+            path,
+        )
+        return build_model()
+
+    def clear_cache(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+
+# Module-level singleton (model loaded on first use)
+language_identifier = LanguageIdentifier()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    path = project_path(config.processing.langid_model_path)
+    build_model().save(path)
+    logger.info("Wrote %s", path)
@@ -0,0 +1,164 @@
+"""
+Lightweight Variant Discovery — AMP and print versions of heavy pages
+=====================================================================
+
+Heavy news pages are often several megabytes of HTML while their
+``<link rel="amphtml">`` or print alternates carry the same article text in a
+fraction of the bytes. This module:
+
+- sniffs the first bytes of a document's ``<head>`` for such links
+  (``find_variant_link``), so the original download can be abandoned early;
+- learns a per-domain URL rewrite rule from each discovered pair
+  (``VariantRuleMap``), so later articles on the same host go straight to the
+  light variant without touching the heavy page at all.
+
+Usage::
+
+    from modules.light_variant import find_variant_link, variant_rules
+
+    variant = variant_rules.predict(url) or find_variant_link(head_bytes, url)
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from dataclasses import dataclass
+from html import unescape
+from urllib.parse import parse_qsl, urlencode, urljoin, urlparse, urlunparse
+
+_LINK_TAG_RE = re.compile(rb"<link\b[^>]*>", re.IGNORECASE)
+_ATTR_RE = re.compile(rb"""([a-zA-Z:-]+)\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+))""")
+_HEAD_END_RE = re.compile(rb"</head\s*>|<body\b", re.IGNORECASE)
+
+
+def head_complete(head: bytes) -> bool:
+    """True once *head* contains the end of the ``<head>`` section."""
+    return _HEAD_END_RE.search(head) is not None
+
+
+def find_variant_link(head: bytes, base_url: str) -> tuple[str, str] | None:
+    """Return ``(variant_url, kind)`` from ``<link>`` tags in *head*, or None.
+
+    ``kind`` is ``"amp"`` for ``rel="amphtml"`` and ``"print"`` for a
+    ``rel="alternate" media="print"`` link. AMP wins when both exist.
+    """
+    end = _HEAD_END_RE.search(head)
+    if end is not None:
+        head = head[: end.start()]
+
+    print_url: str | None = None
+    for tag in _LINK_TAG_RE.findall(head):
+        attrs = {
+            name.decode("ascii").lower(): (a or b or c).decode("utf-8", "replace")
+            for name, a, b, c in _ATTR_RE.findall(tag)
+        }
+        rel = attrs.get("rel", "").lower().split()
+        href = unescape(attrs.get("href", "")).strip()
+        if not href:
+            continue
+        if "amphtml" in rel:
+            return _absolute(href, base_url), "amp"
+        if print_url is None and "alternate" in rel and attrs.get("media", "").lower() == "print":
+            print_url = _absolute(href, base_url)
+    return (print_url, "print") if print_url else None
+
+
+def _absolute(href: str, base_url: str) -> str:
+    return urljoin(base_url, href)
+
+
+# ---------------------------------------------------------------------------
+# Learned per-domain rewrite rules
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class _Rule:
+    """How a host's article URLs map onto their light variant."""
+
+    kind: str  # "amp" | "print"
+    mode: str  # "suffix" | "prefix" | "host" | "query"
+    value: str
+
+    def apply(self, url: str) -> str:
+        parsed = urlparse(url)
+        if self.mode == "suffix":
+            return urlunparse(parsed._replace(path=parsed.path.rstrip("/") + self.value))
+        if self.mode == "prefix":
+            return urlunparse(parsed._replace(path=self.value + parsed.path))
+        if self.mode == "host":
+            return urlunparse(parsed._replace(netloc=self.value))
+        # query
+        query = parse_qsl(parsed.query, keep_blank_values=True)
+        query.extend(parse_qsl(self.value, keep_blank_values=True))
+        return urlunparse(parsed._replace(query=urlencode(query)))
+
+
+def derive_rule(url: str, variant_url: str, kind: str) -> _Rule | None:
+    """Infer a rewrite rule that maps *url* onto *variant_url*, if one is obvious."""
+    src, dst = urlparse(url), urlparse(variant_url)
+    if src.netloc != dst.netloc:
+        if src.path == dst.path and src.query == dst.query:
+            return _Rule(kind, "host", dst.netloc)
+        return None
+    if src.query != dst.query:
+        if src.path != dst.path:
+            return None
+        src_q = parse_qsl(src.query, keep_blank_values=True)
+        dst_q = parse_qsl(dst.query, keep_blank_values=True)
+        if dst_q[: len(src_q)] != src_q:
+            return None
+        return _Rule(kind, "query", urlencode(dst_q[len(src_q) :]))
+    base = src.path.rstrip("/")
+    if base and dst.path.startswith(base) and dst.path != src.path:
+        return _Rule(kind, "suffix", dst.path[len(base) :])
+    if src.path and dst.path.endswith(src.path) and dst.path != src.path:
+        return _Rule(kind, "prefix", dst.path[: -len(src.path)])
+    return None
+
+
+class VariantRuleMap:
+    """Thread-safe map of hostname → learned light-variant rewrite rule."""
+
+    def __init__(self, max_hosts: int = 1024) -> None:
+        self._rules: dict[str, _Rule] = {}
+        self._max_hosts = max_hosts
+        self._lock = threading.Lock()
+
+    def learn(self, url: str, variant_url: str, kind: str) -> None:
+        """Remember how *url* maps to *variant_url* for its hostname."""
+        rule = derive_rule(url, variant_url, kind)
+        host = urlparse(url).hostname
+        if rule is None or not host:
+            return
+        with self._lock:
+            if host not in self._rules and len(self._rules) >= self._max_hosts:
+                self._rules.pop(next(iter(self._rules)))
+            self._rules[host] = rule
+
+    def predict(self, url: str) -> tuple[str, str] | None:
+        """Return ``(variant_url, kind)`` for *url* from its host's rule, if any."""
+        host = urlparse(url).hostname
+        with self._lock:
+            rule = self._rules.get(host or "")
+        if rule is None:
+            return None
+        variant = rule.apply(url)
+        return (variant, rule.kind) if variant != url else None
+
+    def forget(self, url: str) -> None:
+        """Drop the rule for *url*'s hostname (e.g. after a failed prediction)."""
+        with self._lock:
+            self._rules.pop(urlparse(url).hostname or "", None)
+
+    def snapshot(self) -> dict[str, dict]:
+        with self._lock:
+            return {
+                host: {"kind": r.kind, "mode": r.mode, "value": r.value}
+                for host, r in self._rules.items()
+            }
+
+
+# Module-level singleton (shared across all WebScraper instances)
+variant_rules = VariantRuleMap()
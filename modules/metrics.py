@@ -32,3 +32,17 @@ SUMMARIZATION_DURATION = Histogram(
     buckets=[1, 5, 10, 30, 60, 120, 300],
     registry=REGISTRY,
 )
+
+GEMINI_CACHE_LOOKUPS = Counter(
+    "gemini_response_cache_lookups_total",
+    "Gemini response cache lookups",
+    ["result"],
+    registry=REGISTRY,
+)
+
+GEMINI_TOKENS_SAVED = Counter(
+    "gemini_tokens_saved_total",
+    "Gemini tokens not spent because the response cache answered",
+    ["kind"],
+    registry=REGISTRY,
+)
@@ -0,0 +1,205 @@
+"""
+NLTK Resources — lazy, offline loading of punkt and stopword data
+=================================================================
+
+NLTK data is vendored at build time into ``config.processing.nltk_data_dir``
+(``python -m modules.nltk_resources``, also ``make nltk-data``) and is never
+downloaded at runtime. A relative directory is resolved against the project
+root, not the working directory, so workers started elsewhere find it. Data
+installed the usual NLTK way (``NLTK_DATA``, ``~/nltk_data``,
+``/usr/share/nltk_data``, ... — ``nltk.data.path``) is used when nothing is
+vendored. Resources are loaded on first use, per language:
+
+- ``stopwords(lang)`` reads the plain-text stopword list straight from the
+  data directory — no ``import nltk`` (which pulls in scipy.stats) is needed;
+- ``sentence_tokenizer(lang)`` returns the punkt tokenizer for a language
+  (``tokenize`` for strings, ``span_tokenize`` for offsets).
+
+A missing resource raises ``NLTKResourceError`` naming the resource and the
+command that vendors it.
+
+Usage::
+
+    from modules.nltk_resources import NLTKResourceError, sentence_tokenizer, stopwords
+
+    words = stopwords("pt")
+    spans = sentence_tokenizer("pt").span_tokenize(text)
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import zipfile
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from config import config, project_path
+
+if TYPE_CHECKING:
+    from nltk.tokenize.punkt import PunktSentenceTokenizer
+
+logger = logging.getLogger(__name__)
+
+# ISO 639-1 code → NLTK stopword corpus file name
+NLTK_LANGUAGES: dict[str, str] = {
+    "en": "english",
+    "es": "spanish",
+    "fr": "french",
+    "de": "german",
+    "it": "italian",
+    "pt": "portuguese",
+    "ru": "russian",
+}
+
+# Languages with a dedicated punkt model; TextProcessor segments the others with
+# modules.sentence_segmenter (sentence_tokenizer falls back to the English model)
+PUNKT_LANGUAGES: frozenset[str] = frozenset({"en", "es", "fr", "de", "it", "pt"})
+
+# Packages vendored by the build step (punkt_tab for NLTK >= 3.9, punkt before)
+VENDORED_PACKAGES: tuple[str, ...] = ("punkt_tab", "punkt", "stopwords")
+
+_VENDOR_HINT = "run `python -m modules.nltk_resources` (or `make nltk-data`) at build time"
+
+
+class NLTKResourceError(LookupError):
+    """A required NLTK resource is not installed (it is never downloaded at runtime)."""
+
+    def __init__(self, resource: str) -> None:
+        super().__init__(
+            f"NLTK resource {resource!r} not found in {_search_dirs()} "
+            f"or nltk.data.path — {_VENDOR_HINT}"
+        )
+        self.resource = resource
+
+
+def vendored_dir() -> str:
+    """Absolute path of ``config.processing.nltk_data_dir``."""
+    return project_path(config.processing.nltk_data_dir)
+
+
+def _search_dirs() -> list[str]:
+    """Vendored directory first, then NLTK_DATA (the standard NLTK override)."""
+    dirs = [vendored_dir()]
+    dirs += [d for d in os.environ.get("NLTK_DATA", "").split(os.pathsep) if d]
+    return dirs
+
+
+def _default_dirs() -> list[str]:
+    """NLTK's own search path (``~/nltk_data``, ``/usr/share/nltk_data``, ...), minus ours."""
+    ours = _search_dirs()
+    return [d for d in _nltk_data().path if d not in ours]
+
+
+# ---------------------------------------------------------------------------
+# Stopwords
+# ---------------------------------------------------------------------------
+
+
+@lru_cache(maxsize=16)
+def stopwords(language: str) -> frozenset[str]:
+    """Stopword set for an ISO 639-1 *language* code; loaded once per language.
+
+    Raises:
+        NLTKResourceError: if *language* has no NLTK list or it is not installed.
+    """
+    name = NLTK_LANGUAGES.get(language)
+    if name is None:
+        raise NLTKResourceError(f"corpora/stopwords/{language}")
+    for base in _search_dirs():
+        words = _read_stopwords(base, name)
+        if words is not None:
+            return words
+    # Not vendored: NLTK's default locations (this path imports nltk)
+    for base in _default_dirs():
+        words = _read_stopwords(base, name)
+        if words is not None:
+            return words
+    raise NLTKResourceError(f"corpora/stopwords/{name}")
+
+
+def _read_stopwords(base: str, name: str) -> frozenset[str] | None:
+    """Stopword list *name* from data directory *base* (plain file or zip), if present."""
+    path = os.path.join(base, "corpora", "stopwords", name)
+    if os.path.isfile(path):
+        with open(path, encoding="utf-8") as fh:
+            return _parse_wordlist(fh.read())
+    archive = os.path.join(base, "corpora", "stopwords.zip")
+    if os.path.isfile(archive):
+        with zipfile.ZipFile(archive) as zf:
+            try:
+                return _parse_wordlist(zf.read(f"stopwords/{name}").decode("utf-8"))
+            except KeyError:
+                pass
+    return None
+
+
+def _parse_wordlist(raw: str) -> frozenset[str]:
+    return frozenset(word for word in (line.strip() for line in raw.splitlines()) if word)
+
+
+# ---------------------------------------------------------------------------
+# Tokenizers
+# ---------------------------------------------------------------------------
+
+
+def _nltk_data():
+    """Import ``nltk.data`` with the vendored directory on its search path."""
+    import nltk.data  # noqa: PLC0415 — deferred: importing nltk costs over a second
+
+    for base in reversed(_search_dirs()):
+        if base not in nltk.data.path:
+            nltk.data.path.insert(0, base)
+    return nltk.data
+
+
+@lru_cache(maxsize=16)
+def sentence_tokenizer(language: str) -> PunktSentenceTokenizer:
+    """punkt sentence tokenizer for *language* (English model when none exists).
+
+    Raises:
+        NLTKResourceError: if neither punkt_tab nor punkt is installed.
+    """
+    name = NLTK_LANGUAGES[language] if language in PUNKT_LANGUAGES else "english"
+    data = _nltk_data()
+    try:
+        data.find(f"tokenizers/punkt_tab/{name}/")
+        from nltk.tokenize import PunktTokenizer  # noqa: PLC0415
+
+        return PunktTokenizer(name)
+    except (LookupError, ImportError):
+        pass
+    try:
+        return data.load(f"tokenizers/punkt/{name}.pickle")
+    except LookupError:
+        raise NLTKResourceError(f"tokenizers/punkt_tab/{name}") from None
+
+
+# ---------------------------------------------------------------------------
+# Build-time vendoring
+# ---------------------------------------------------------------------------
+
+
+def vendor(target_dir: str, packages: tuple[str, ...] = VENDORED_PACKAGES) -> None:
+    """Download *packages* into *target_dir*. Build step only — never called at runtime."""
+    import nltk  # noqa: PLC0415
+
+    os.makedirs(target_dir, exist_ok=True)
+    for package in packages:
+        if not nltk.download(package, download_dir=target_dir, quiet=True, raise_on_error=True):
+            raise RuntimeError(f"Could not download NLTK package {package!r}")
+        logger.info("Vendored NLTK %s into %s", package, target_dir)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Vendor NLTK data for offline use.")
+    parser.add_argument("--dir", default=vendored_dir())
+    parser.add_argument("--packages", nargs="*", default=list(VENDORED_PACKAGES))
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    vendor(args.dir, tuple(args.packages))
+
+
+if __name__ == "__main__":
+    main()
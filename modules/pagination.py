@@ -0,0 +1,106 @@
+"""
+Pagination Detection — multi-page article links
+===============================================
+
+Finds the remaining pages of a paginated article from its DOM:
+
+- ``<link rel="next">`` / ``<a rel="next">``, when it stays within the
+  article (same article key, or a path below the article's: ``/story/2/``
+  of ``/story/``). Blog themes also put ``rel="next"`` on the link to the
+  next *post*, which is a sibling path and is ignored;
+- anchors that point at a numbered variant of the same article, either via
+  a page query parameter (``?page=2``, ``?pg=2``, ``?paged=2``) or a
+  ``/page/N`` path segment. Bare trailing numbers (``/article/123``) are
+  ignored — they are usually article ids, not page numbers.
+
+Must run before ``WebScraper._remove_unwanted_elements`` because pagination
+controls usually live inside ``<nav>`` / ``<footer>``.
+
+Usage::
+
+    for page_url in find_pagination_links(soup, url):
+        ...
+"""
+
+from __future__ import annotations
+
+import re
+from urllib.parse import parse_qsl, urlencode, urljoin, urlparse, urlunparse
+
+from bs4 import BeautifulSoup
+
+# "p" is deliberately absent: WordPress uses ?p=<post id>
+_PAGE_PARAMS = frozenset({"page", "pg", "paged", "pagina", "seite"})
+_PATH_PAGE_RE = re.compile(r"^(?P<base>.*?)/page/(?P<num>\d{1,3})/?$")
+# Explicit short page segment (/story/p/2); a bare trailing number (/news/42)
+# is usually an article id and is never taken for a page
+_SHORT_PAGE_RE = re.compile(r"^(?P<base>.+)/p/\d{1,3}$")
+
+
+def find_pagination_links(soup: BeautifulSoup, url: str) -> list[str]:
+    """Return URLs of the *other* pages of the article at *url*, in page order.
+
+    Only same-host links are returned; page 1 / *url* itself are excluded.
+    """
+    host = urlparse(url).netloc
+    base = article_key(url)
+    current = page_number(url) or 1
+    numbered: dict[str, int] = {}
+    unnumbered: list[str] = []
+
+    for el in soup.find_all(["a", "link"], href=True):
+        href = urljoin(url, el["href"]).split("#", 1)[0]
+        if not href or urlparse(href).netloc != host:
+            continue
+        rel = [r.lower() for r in (el.get("rel") or [])]
+        num = page_number(href) if article_key(href) == base else None
+        if num is not None and num != current and num > 1:
+            numbered.setdefault(href, num)
+        elif "next" in rel and href != url and href not in unnumbered and same_article(href, url):
+            unnumbered.append(href)
+
+    ordered = sorted(numbered, key=numbered.__getitem__)
+    return ordered + [u for u in unnumbered if u not in numbered]
+
+
+def same_article(candidate: str, url: str) -> bool:
+    """Whether *candidate* can be another page of the article at *url*.
+
+    True for the same article key, or when *candidate*'s path lies below the
+    article's full path (``/story/2`` of ``/story``). Only an explicit page
+    segment of *url* is dropped first, so ``/story/p/3`` is still a page of
+    ``/story/p/2``; ``/news/other-story`` is never a page of ``/news/42``.
+    """
+    if article_key(candidate) == article_key(url):
+        return True
+    parsed, base = urlparse(candidate), urlparse(article_key(url))
+    if parsed.netloc != base.netloc:
+        return False
+    root = base.path
+    match = _SHORT_PAGE_RE.match(root)
+    if match:
+        root = match.group("base")
+    return bool(root.strip("/")) and parsed.path.startswith(root + "/")
+
+
+def page_number(url: str) -> int | None:
+    """Page number encoded in *url* (query parameter or trailing path segment)."""
+    parsed = urlparse(url)
+    for key, value in parse_qsl(parsed.query):
+        if key.lower() in _PAGE_PARAMS and value.isdigit():
+            return int(value)
+    match = _PATH_PAGE_RE.match(parsed.path)
+    if match and match.group("base"):
+        return int(match.group("num"))
+    return None
+
+
+def article_key(url: str) -> str:
+    """*url* with any page number removed — identical for every page of an article."""
+    parsed = urlparse(url)
+    query = [(k, v) for k, v in parse_qsl(parsed.query) if k.lower() not in _PAGE_PARAMS]
+    path = parsed.path
+    match = _PATH_PAGE_RE.match(path)
+    if match and match.group("base"):
+        path = match.group("base")
+    return urlunparse(parsed._replace(path=path.rstrip("/"), query=urlencode(query), fragment=""))
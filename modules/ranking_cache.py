@@ -0,0 +1,181 @@
+"""
+Ranking Cache — length-independent extractive rankings by content hash
+======================================================================
+
+Only the final cut of an extractive summary depends on the requested
+length: the scores and the greedy MMR pick order are the same for "short",
+"medium" and "long", and each length takes a prefix of that order. The
+``Summarizer`` keeps that ranking (per-sentence scores plus the pick order
+up to the longest configured length) under ``ranking_key``, a hash of the
+processed sentences, the language, the method and the ``RankingSettings``
+that shape the order. A later request for another length re-selects from it
+without running the vectorizers again.
+
+``RankingSettings`` is read from ``config`` in the calling process and handed
+to ``rank`` along with the key: CPU pool workers only hold the env defaults,
+so settings changed at runtime (e.g. ``mmr_lambda``) would otherwise be
+ignored there while the key already reflects them.
+
+Rankings live in a bounded in-process LRU and, when ``CACHE_ENABLED`` is
+on, in the shared cache backend (Redis or filesystem), so every worker
+benefits.
+
+Usage::
+
+    from modules.ranking_cache import RankingCache, RankingSettings, ranking_key
+
+    rankings = RankingCache(cache_backend)
+    settings = RankingSettings.from_config()
+    key = ranking_key(sentences, "en", "extractive", settings)
+    ranking = rankings.get(key)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+import numpy as np
+
+from config import config
+from modules.cache import CacheBackend
+from modules.idf_table import idf_tables
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RankingSettings:
+    """Every setting that shapes an extractive ranking (picklable snapshot)."""
+
+    mmr_lambda: float
+    redundancy_threshold: float
+    limit: int  # picks kept in the order: the longest configured summary
+    hierarchical_min_sentences: int
+    section_sentences: int
+    section_candidates: int
+    tfidf_mode: str
+    idf_version: str | None  # background IDF table digest (hashed mode only)
+    lexrank_neighbors: int
+    lexrank_damping: float
+    lexrank_tolerance: float
+    lexrank_max_iter: int
+
+    @classmethod
+    def from_config(cls) -> RankingSettings:
+        summarization = config.summarization
+        return cls(
+            mmr_lambda=summarization.mmr_lambda,
+            redundancy_threshold=summarization.redundancy_threshold,
+            limit=max(summarization.extractive_sentences.values()),
+            hierarchical_min_sentences=summarization.hierarchical_min_sentences,
+            section_sentences=summarization.section_sentences,
+            section_candidates=summarization.section_candidates,
+            tfidf_mode=summarization.tfidf_mode,
+            idf_version=idf_tables.version if summarization.tfidf_mode == "hashed" else None,
+            lexrank_neighbors=summarization.lexrank_neighbors,
+            lexrank_damping=summarization.lexrank_damping,
+            lexrank_tolerance=summarization.lexrank_tolerance,
+            lexrank_max_iter=summarization.lexrank_max_iter,
+        )
+
+
+def ranking_key(
+    sentences: Iterable[str],
+    language: str,
+    method: str,
+    settings: RankingSettings | None = None,
+) -> str:
+    """Cache key of the ranking of *sentences* under *settings* (default: current)."""
+    settings = settings or RankingSettings.from_config()
+    values = [
+        method,
+        language,
+        settings.mmr_lambda,
+        settings.redundancy_threshold,
+        settings.limit,
+        settings.hierarchical_min_sentences,
+        settings.section_sentences,
+        settings.section_candidates,
+        settings.tfidf_mode,
+    ]
+    if settings.tfidf_mode == "hashed":
+        values.append(settings.idf_version)
+    if method == "lexrank":
+        values += [
+            settings.lexrank_neighbors,
+            settings.lexrank_damping,
+            settings.lexrank_tolerance,
+            settings.lexrank_max_iter,
+        ]
+    digest = hashlib.blake2b(repr(values).encode("utf-8"), digest_size=16)
+    for sentence in sentences:
+        digest.update(sentence.encode("utf-8"))
+        digest.update(b"\0")
+    return f"ranking_{digest.hexdigest()}"
+
+
+class RankingCache:
+    """Bounded, thread-safe LRU of rankings in front of an optional cache backend.
+
+    A ranking is ``{"scores": float32 array, "order": int32 array}``.
+    """
+
+    def __init__(self, backend: CacheBackend | None = None, max_entries: int | None = None):
+        self.backend = backend
+        self._entries: OrderedDict[str, dict] = OrderedDict()
+        self._max_entries = (
+            config.summarization.ranking_cache_size if max_entries is None else max_entries
+        )
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> dict | None:
+        with self._lock:
+            ranking = self._entries.get(key)
+            if ranking is not None:
+                self._entries.move_to_end(key)
+                return ranking
+        if self.backend is None or not config.output.cache_enabled:
+            return None
+        stored = self.backend.get(key)
+        if not stored:
+            return None
+        try:
+            ranking = {
+                "scores": np.asarray(stored["scores"], dtype=np.float32),
+                "order": np.asarray(stored["order"], dtype=np.int32),
+            }
+        except (KeyError, TypeError, ValueError) as exc:
+            logger.warning("Ignoring malformed cached ranking %s: %s", key, exc)
+            return None
+        self._remember(key, ranking)
+        return ranking
+
+    def put(self, key: str, ranking: dict) -> None:
+        self._remember(key, ranking)
+        if self.backend is not None and config.output.cache_enabled:
+            self.backend.set(
+                key,
+                {"scores": ranking["scores"].tolist(), "order": ranking["order"].tolist()},
+                ttl=config.output.cache_ttl,
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remember(self, key: str, ranking: dict) -> None:
+        if self._max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = ranking
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
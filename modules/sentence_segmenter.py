@@ -0,0 +1,390 @@
+"""
+Sentence Segmenter — compiled-regex sentence boundaries
+=======================================================
+
+High-throughput alternative to punkt for bulk jobs
+(``SENTENCE_SEGMENTER=regex``), and the segmenter for the supported languages
+that have no punkt model (Russian, Chinese, Japanese, Korean).
+
+A boundary is placed after:
+
+- a CJK terminator (``。！？``), with any closing brackets or quotes — no
+  whitespace is needed after it;
+- ``!``, ``?`` or ellipsis runs followed by whitespace, unless the next word
+  starts in lower case (``"Why?" she asked``);
+- a period followed by whitespace, unless the next word starts in lower case
+  (an abbreviation missing from the table) or the word before it is a known
+  abbreviation for the language, an initial (``J.``), a dotted abbreviation
+  (``e.g.``, ``U.S.``, ``т.е.``) or a German ordinal (``3. Oktober``); none of
+  these apply when closing quotes or brackets follow the period. Words that
+  are also common sentence endings (``no``, ``est``) only count as
+  abbreviations before a digit (``No. 5``, ``est. 1890``).
+
+Spans are ``(start, end)`` offsets like punkt's ``span_tokenize``, so either
+segmenter can back ``TextSpans``. Agreement with punkt and throughput are
+measured by ``benchmarks/bench_segmentation.py``.
+
+Usage::
+
+    from modules.sentence_segmenter import sentence_segmenter
+
+    spans = sentence_segmenter("pt").span_tokenize(text)
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable, Iterator
+from functools import lru_cache
+
+from config import DEFAULT_LANGUAGE
+
+# Lower-cased, without the trailing period. Single letters (initials) and
+# dotted forms (``e.g.``) are recognised by shape and need no entry.
+ABBREVIATIONS: dict[str, frozenset[str]] = {
+    "en": frozenset(
+        [
+            "mr",
+            "mrs",
+            "ms",
+            "dr",
+            "prof",
+            "sr",
+            "jr",
+            "st",
+            "mt",
+            "ft",
+            "vs",
+            "etc",
+            "inc",
+            "ltd",
+            "corp",
+            "dept",
+            "univ",
+            "assn",
+            "bros",
+            "gen",
+            "col",
+            "lt",
+            "sgt",
+            "capt",
+            "cmdr",
+            "adm",
+            "rep",
+            "sen",
+            "gov",
+            "pres",
+            "rev",
+            "hon",
+            "jan",
+            "feb",
+            "mar",
+            "apr",
+            "jun",
+            "jul",
+            "aug",
+            "sep",
+            "sept",
+            "oct",
+            "nov",
+            "dec",
+            "fig",
+            "figs",
+            "vol",
+            "pp",
+            "approx",
+            "ave",
+            "blvd",
+            "rd",
+            "hwy",
+        ]
+    ),
+    "es": frozenset(
+        [
+            "sr",
+            "sra",
+            "srta",
+            "sres",
+            "dr",
+            "dra",
+            "lic",
+            "ing",
+            "prof",
+            "ud",
+            "uds",
+            "vd",
+            "vds",
+            "etc",
+            "pág",
+            "págs",
+            "núm",
+            "art",
+            "cap",
+            "aprox",
+            "admón",
+            "avda",
+            "gral",
+            "ene",
+            "feb",
+            "abr",
+            "jun",
+            "jul",
+            "ago",
+            "sept",
+            "oct",
+            "nov",
+            "dic",
+        ]
+    ),
+    "fr": frozenset(
+        [
+            "m",
+            "mm",
+            "mme",
+            "mmes",
+            "mlle",
+            "mlles",
+            "dr",
+            "pr",
+            "me",
+            "mgr",
+            "st",
+            "ste",
+            "etc",
+            "cf",
+            "av",
+            "bd",
+            "env",
+            "éd",
+            "vol",
+            "janv",
+            "févr",
+            "avr",
+            "juil",
+            "sept",
+            "oct",
+            "nov",
+            "déc",
+        ]
+    ),
+    "de": frozenset(
+        [
+            "hr",
+            "fr",
+            "dr",
+            "prof",
+            "nr",
+            "str",
+            "ca",
+            "bzw",
+            "usw",
+            "vgl",
+            "evtl",
+            "ggf",
+            "inkl",
+            "zzgl",
+            "bspw",
+            "abs",
+            "abb",
+            "jh",
+            "jhd",
+            "mio",
+            "mrd",
+            "tsd",
+            "st",
+            "gebr",
+            "sog",
+            "ebd",
+            "jan",
+            "feb",
+            "apr",
+            "jun",
+            "jul",
+            "aug",
+            "sept",
+            "okt",
+            "nov",
+            "dez",
+        ]
+    ),
+    "it": frozenset(
+        [
+            "sig",
+            "sigg",
+            "dott",
+            "prof",
+            "ing",
+            "avv",
+            "arch",
+            "geom",
+            "on",
+            "ecc",
+            "pag",
+            "pagg",
+            "cap",
+            "art",
+            "gen",
+            "ca",
+            "sec",
+        ]
+    ),
+    "pt": frozenset(
+        [
+            "sr",
+            "sra",
+            "srs",
+            "sras",
+            "dr",
+            "dra",
+            "drs",
+            "prof",
+            "profa",
+            "eng",
+            "exmo",
+            "exma",
+            "etc",
+            "pág",
+            "págs",
+            "art",
+            "cap",
+            "av",
+            "nº",
+            "núm",
+            "tel",
+            "aprox",
+            "jan",
+            "fev",
+            "mar",
+            "abr",
+            "jun",
+            "jul",
+            "ago",
+            "set",
+            "out",
+            "nov",
+            "dez",
+        ]
+    ),
+    "ru": frozenset(
+        [
+            "г",
+            "гг",
+            "ул",
+            "пр",
+            "пл",
+            "д",
+            "др",
+            "проф",
+            "акад",
+            "им",
+            "стр",
+            "рис",
+            "см",
+            "ср",
+            "тыс",
+            "млн",
+            "млрд",
+            "руб",
+            "коп",
+            "янв",
+            "февр",
+            "апр",
+            "авг",
+            "сент",
+            "окт",
+            "нояб",
+            "дек",
+        ]
+    ),
+}
+
+# Abbreviations that are also ordinary words ending a sentence ("there was no.",
+# "the cost is an est."): only treated as such when a digit follows
+NUMERAL_ABBREVIATIONS: dict[str, frozenset[str]] = {
+    "en": frozenset(["no", "nos", "est"]),
+}
+
+# Languages whose short numbers before a period are ordinals ("am 3. Oktober")
+ORDINAL_LANGUAGES: frozenset[str] = frozenset({"de"})
+
+# The leading lookahead lets the regex engine skip ahead to terminator characters
+_BOUNDARY_RE = re.compile(
+    r"(?=[.!?…。！？])(?:(?P<cjk>[。！？]+[」』）】〉》\"”’]*)"
+    r"|(?P<mark>[.!?…]+)[\"'”’»)\]]*(?=\s))"
+)
+_NEXT_CHAR_RE = re.compile(r"\s*(\S)")
+_OPENING = "\"'“‘«([¿¡"
+_DOTTED_RE = re.compile(r"(?:[^\W\d_]{1,3}\.)+[^\W\d_]{1,3}")
+_ORDINAL_RE = re.compile(r"\d{1,2}")
+
+
+class RegexSentenceSegmenter:
+    """Rule-based sentence splitter for one language."""
+
+    __slots__ = ("abbreviations", "numeral_abbreviations", "ordinals")
+
+    def __init__(
+        self,
+        abbreviations: Iterable[str] = (),
+        ordinals: bool = False,
+        numeral_abbreviations: Iterable[str] = (),
+    ) -> None:
+        self.abbreviations = frozenset(abbreviations)
+        self.numeral_abbreviations = frozenset(numeral_abbreviations)
+        self.ordinals = ordinals
+
+    def span_tokenize(self, text: str) -> Iterator[tuple[int, int]]:
+        """``(start, end)`` of each sentence, surrounding whitespace excluded."""
+        start = 0
+        for match in _BOUNDARY_RE.finditer(text):
+            mark = match.group("mark")
+            if mark is not None and not self._is_boundary(text, match, mark):
+                continue
+            end = match.end()
+            while start < end and text[start].isspace():
+                start += 1
+            if start < end:
+                yield start, end
+            start = end
+        end = len(text)
+        while start < end and text[start].isspace():
+            start += 1
+        while end > start and text[end - 1].isspace():
+            end -= 1
+        if start < end:
+            yield start, end
+
+    def tokenize(self, text: str) -> list[str]:
+        return [text[start:end] for start, end in self.span_tokenize(text)]
+
+    def _is_boundary(self, text: str, match: re.Match, mark: str) -> bool:
+        following = _NEXT_CHAR_RE.match(text, match.end())
+        if following is None or following.group(1).islower():
+            return False
+        mark_start = match.start()
+        if mark != "." or match.end() > match.end("mark"):
+            # "!", "?", an ellipsis, or a period inside closing quotes/brackets
+            return True
+        word_start = max(text.rfind(" ", 0, mark_start), text.rfind("\n", 0, mark_start)) + 1
+        word = text[word_start:mark_start].lstrip(_OPENING)
+        if not word:
+            return True
+        if (len(word) == 1 and word.isalpha()) or _DOTTED_RE.fullmatch(word):
+            return False
+        if self.ordinals and _ORDINAL_RE.fullmatch(word):
+            return False
+        word = word.lower()
+        if word in self.numeral_abbreviations and following.group(1).isdigit():
+            return False
+        return word not in self.abbreviations
+
+
+@lru_cache(maxsize=16)
+def sentence_segmenter(language: str) -> RegexSentenceSegmenter:
+    """Regex segmenter for *language* (English abbreviations when it has none)."""
+    table = language if language in ABBREVIATIONS else DEFAULT_LANGUAGE
+    return RegexSentenceSegmenter(
+        ABBREVIATIONS[table],
+        ordinals=language in ORDINAL_LANGUAGES,
+        numeral_abbreviations=NUMERAL_ABBREVIATIONS.get(table, ()),
+    )
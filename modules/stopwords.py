@@ -0,0 +1,84 @@
+"""
+Stopwords — one process-wide, read-only stopword registry
+=========================================================
+
+``stopword_registry`` maps each NLTK language code to its frozen stopword
+set. Each set is read once per process, on first access, and then shared by
+the text processor (language votes, statistics, streaming), the extractive
+summarizer and the CPU pool workers. No caller copies a set.
+
+- A language whose list is not installed maps to an empty set. The warning
+  is logged once, not once per processor or request.
+- ``for_vectorizer(lang)`` is the set excluded from TF-IDF terms. It is
+  sklearn's English list for English, for languages without an NLTK list,
+  and when the data is missing.
+
+Usage::
+
+    from modules.stopwords import stopword_registry
+
+    ratio_words = stopword_registry["pt"]
+    exclude = stopword_registry.for_vectorizer("pt")
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Iterator, Mapping
+
+from modules.nltk_resources import NLTK_LANGUAGES, NLTKResourceError, stopwords
+
+logger = logging.getLogger(__name__)
+
+
+class StopwordRegistry(Mapping[str, frozenset[str]]):
+    """Language code → stopword set, for the NLTK languages, loaded lazily once."""
+
+    def __init__(self) -> None:
+        self._sets: dict[str, frozenset[str]] = {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, language: str) -> frozenset[str]:
+        words = self._sets.get(language)
+        if words is not None:
+            return words
+        if language not in NLTK_LANGUAGES:
+            raise KeyError(language)
+        with self._lock:
+            words = self._sets.get(language)
+            if words is None:
+                try:
+                    words = stopwords(language)
+                except NLTKResourceError as exc:
+                    logger.warning("Could not load stopwords for %s: %s", language, exc)
+                    words = frozenset()
+                self._sets[language] = words
+        return words
+
+    def __contains__(self, language: object) -> bool:
+        return language in NLTK_LANGUAGES
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(NLTK_LANGUAGES)
+
+    def __len__(self) -> int:
+        return len(NLTK_LANGUAGES)
+
+    def for_vectorizer(self, language: str) -> frozenset[str]:
+        """Terms excluded from TF-IDF features for *language*."""
+        words = self.get(language) if language != "en" else None
+        if words:
+            return words
+        from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS  # noqa: PLC0415
+
+        return ENGLISH_STOP_WORDS
+
+    def clear(self) -> None:
+        """Forget the loaded sets (e.g. after vendoring NLTK data)."""
+        with self._lock:
+            self._sets.clear()
+
+
+# Module-level singleton
+stopword_registry = StopwordRegistry()
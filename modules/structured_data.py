@@ -0,0 +1,251 @@
+"""
+Structured Data Extraction — JSON-LD, microdata and OpenGraph
+=============================================================
+
+Many publishers embed the full article in machine-readable form:
+
+- ``<script type="application/ld+json">`` with ``articleBody``, ``headline``,
+  ``author`` and ``datePublished`` (schema.org ``Article`` and subtypes);
+- microdata attributes (``itemprop="articleBody"`` etc.);
+- OpenGraph / ``article:*`` meta tags (metadata only, never a body).
+
+This must run *before* ``WebScraper._remove_unwanted_elements`` because that
+step decomposes every ``<script>`` element.
+
+Usage::
+
+    data = extract_structured_data(soup)
+    if is_complete(data):
+        content = data["content"]
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import re
+from typing import Any
+
+from bs4 import BeautifulSoup
+
+from config import config
+
+logger = logging.getLogger(__name__)
+
+# schema.org types whose ``articleBody`` / ``text`` is the article itself
+_ARTICLE_TYPES = frozenset(
+    {
+        "article",
+        "newsarticle",
+        "blogposting",
+        "report",
+        "scholarlyarticle",
+        "techarticle",
+        "reportagenewsarticle",
+        "analysisnewsarticle",
+        "opinionnewsarticle",
+        "reviewnewsarticle",
+        "backgroundnewsarticle",
+        "socialmediaposting",
+        "liveblogposting",
+        "webpage",
+    }
+)
+
+_WS_RE = re.compile(r"\s+")
+_PARA_RE = re.compile(r"\n\s*\n")
+
+
+def extract_structured_data(soup: BeautifulSoup) -> dict[str, str]:
+    """Return article fields found in JSON-LD, microdata and OpenGraph.
+
+    Keys (all optional): title, author, publish_date, description, content,
+    source. Earlier sources win per field: JSON-LD > microdata > OpenGraph.
+    ``is_paywalled`` is set to "true" when JSON-LD marks the article as not
+    accessible for free.
+    """
+    result: dict[str, str] = {}
+    for source, extractor in (
+        ("json_ld", _from_json_ld),
+        ("microdata", _from_microdata),
+        ("opengraph", _from_opengraph),
+    ):
+        try:
+            found = extractor(soup)
+        except Exception as exc:
+            logger.debug("Structured data (%s) extraction failed: %s", source, exc)
+            continue
+        for key, value in found.items():
+            if value and key not in result:
+                result[key] = value
+                if key == "content":
+                    result["source"] = source
+    return result
+
+
+def is_complete(data: dict[str, str]) -> bool:
+    """True when *data* carries a full article body (not a teaser or paywall stub)."""
+    content = data.get("content", "")
+    if not content or data.get("is_paywalled") == "true":
+        return False
+    return len(content.split()) >= config.scraping.structured_data_min_words
+
+
+# ---------------------------------------------------------------------------
+# JSON-LD
+# ---------------------------------------------------------------------------
+
+
+def _from_json_ld(soup: BeautifulSoup) -> dict[str, str]:
+    best: dict[str, str] = {}
+    for script in soup.find_all("script", attrs={"type": re.compile(r"ld\+json", re.I)}):
+        raw = script.string or script.get_text()
+        if not raw or not raw.strip():
+            continue
+        try:
+            payload = json.loads(raw.strip())
+        except ValueError:
+            continue
+        for node in _iter_nodes(payload):
+            if not _is_article_node(node):
+                continue
+            candidate = {
+                "title": _text(node.get("headline") or node.get("name")),
+                "author": _author_name(node.get("author")),
+                "publish_date": _text(node.get("datePublished") or node.get("dateCreated")),
+                "description": _text(node.get("description")),
+                "content": _clean_body(node.get("articleBody") or node.get("text")),
+            }
+            if str(node.get("isAccessibleForFree", "")).lower() == "false":
+                candidate["is_paywalled"] = "true"
+            # Keep the node with the longest body; fill metadata gaps from the rest
+            if len(candidate["content"]) > len(best.get("content", "")):
+                candidate.update({k: v for k, v in best.items() if v and not candidate.get(k)})
+                best = candidate
+            else:
+                best.update({k: v for k, v in candidate.items() if v and not best.get(k)})
+    return best
+
+
+def _iter_nodes(payload: Any):
+    """Yield every dict node in a JSON-LD payload, flattening lists and ``@graph``."""
+    stack = [payload]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, list):
+            stack.extend(reversed(item))
+        elif isinstance(item, dict):
+            yield item
+            graph = item.get("@graph")
+            if isinstance(graph, list):
+                stack.extend(reversed(graph))
+            main = item.get("mainEntity") or item.get("mainEntityOfPage")
+            if isinstance(main, dict):
+                stack.append(main)
+
+
+def _is_article_node(node: dict) -> bool:
+    types = node.get("@type", "")
+    if isinstance(types, str):
+        types = [types]
+    return any(str(t).lower() in _ARTICLE_TYPES for t in types)
+
+
+def _author_name(value: Any) -> str:
+    if isinstance(value, list):
+        names = [_author_name(v) for v in value]
+        return ", ".join(n for n in names if n)
+    if isinstance(value, dict):
+        return _text(value.get("name"))
+    return _text(value)
+
+
+# ---------------------------------------------------------------------------
+# Microdata
+# ---------------------------------------------------------------------------
+
+
+def _from_microdata(soup: BeautifulSoup) -> dict[str, str]:
+    def prop(name: str) -> str:
+        el = soup.find(attrs={"itemprop": name})
+        if el is None:
+            return ""
+        return _text(el.get("content") or el.get("datetime") or el.get_text(" ", strip=True))
+
+    body = soup.find(attrs={"itemprop": "articleBody"})
+    author = soup.find(attrs={"itemprop": "author"})
+    author_name = ""
+    if author is not None:
+        name_el = author.find(attrs={"itemprop": "name"})
+        author_name = _text(
+            (name_el or author).get("content") or (name_el or author).get_text(" ", strip=True)
+        )
+    return {
+        "title": prop("headline"),
+        "author": author_name,
+        "publish_date": prop("datePublished"),
+        "description": prop("description"),
+        "content": _clean_body(_block_text(body)) if body is not None else "",
+    }
+
+
+def _block_text(el) -> str:
+    """Text of *el* with paragraph breaks preserved, ignoring embedded scripts/styles."""
+    parts = [
+        p.get_text(" ", strip=True)
+        for p in el.find_all(["p", "h2", "h3", "li"])
+        if p.find_parent(["script", "style"]) is None
+    ]
+    parts = [p for p in parts if p]
+    return "\n\n".join(parts) if parts else el.get_text(" ", strip=True)
+
+
+# ---------------------------------------------------------------------------
+# OpenGraph / article:* meta
+# ---------------------------------------------------------------------------
+
+
+def _from_opengraph(soup: BeautifulSoup) -> dict[str, str]:
+    def meta(*names: str) -> str:
+        for name in names:
+            el = soup.find("meta", attrs={"property": name}) or soup.find(
+                "meta", attrs={"name": name}
+            )
+            if el is not None and el.get("content"):
+                return _text(el["content"])
+        return ""
+
+    return {
+        "title": meta("og:title", "twitter:title"),
+        "author": meta("article:author", "author"),
+        "publish_date": meta("article:published_time", "og:published_time"),
+        "description": meta("og:description", "twitter:description"),
+    }
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _text(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, (list, tuple)):
+        value = value[0] if value else ""
+    if isinstance(value, dict):
+        value = value.get("name") or value.get("@value") or ""
+    return _WS_RE.sub(" ", str(value)).strip()
+
+
+def _clean_body(value: Any) -> str:
+    """Normalise an article body; strips markup some CMSes leave in ``articleBody``."""
+    if not value:
+        return ""
+    if isinstance(value, list):
+        value = "\n\n".join(str(v) for v in value)
+    body = str(value)
+    if "<" in body and ">" in body:
+        body = BeautifulSoup(body, "html.parser").get_text("\n\n")
+    paragraphs = (_WS_RE.sub(" ", block).strip() for block in _PARA_RE.split(body))
+    return "\n\n".join(p for p in paragraphs if p)
@@ -3,8 +3,10 @@ Summarizer — Dispatcher for Extractive and Generative Summarisation
 ====================================================================
 
 Two backends:
-  - ExtractiveSummarizer: TF-IDF + position + cosine scoring.
-    Works offline, no API key needed.
+  - ExtractiveSummarizer: TF-IDF + position + cosine scoring over the
+    token ids of the shared ``Document`` (no re-tokenization), or LexRank
+    centrality on a sparse k-nearest-neighbour sentence graph
+    (``method="lexrank"``). Works offline, no API key needed.
   - GeminiSummarizer: Google Gemini API.
     Requires GEMINI_API_KEY; falls back to extractive if unavailable.
 """
@@ -13,15 +15,33 @@ from __future__ import annotations
 
 import logging
 import re
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+from scipy.sparse import block_diag, csr_matrix, diags, issparse
+from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS, TfidfTransformer
+from sklearn.preprocessing import normalize
 
 from config import config
+from modules.cache import CacheBackend
+from modules.cpu_pool import cpu_pool
+from modules.document import Document
+from modules.idf_table import hashed_counts, idf_tables
+from modules.ranking_cache import RankingCache, RankingSettings, ranking_key
+from modules.stopwords import stopword_registry
 
 logger = logging.getLogger(__name__)
 
+# Weights of the TF-IDF, position, length and centroid-similarity scores
+_SCORE_WEIGHTS = np.array([0.4, 0.2, 0.2, 0.2])
+
+# Largest sentence × term matrix copied to dense float32 for the LexRank graph
+_DENSE_GRAPH_CELLS = 1 << 24
+
+# Cosine at which a sentence counts as a copy of a picked one (never picked)
+_DUPLICATE_COSINE = 1 - 1e-6
+
 
 # ---------------------------------------------------------------------------
 # Top-level dispatcher
@@ -31,18 +51,33 @@ logger = logging.getLogger(__name__)
 class Summarizer:
     """Dispatches to Gemini or extractive depending on config / availability."""
 
-    def __init__(self) -> None:
+    def __init__(self, cache_backend: CacheBackend | None = None) -> None:
         self._extractive = ExtractiveSummarizer()
         self._gemini: object | None = None  # lazy init
+        # Extractive rankings by content hash, shared by every summary length
+        self.rankings = RankingCache(cache_backend)
+        self._cache_backend = cache_backend
 
         if config.summarization.method == "generative":
             self._gemini = self._try_init_gemini()
 
+    @property
+    def cache_backend(self) -> CacheBackend | None:
+        return self._cache_backend
+
+    @cache_backend.setter
+    def cache_backend(self, backend: CacheBackend | None) -> None:
+        """Point the ranking cache and the Gemini response cache at *backend*."""
+        self._cache_backend = backend
+        self.rankings.backend = backend
+        if self._gemini is not None:
+            self._gemini.cache_backend = backend  # type: ignore[attr-defined]
+
     def _try_init_gemini(self) -> object | None:
         try:
             from .gemini_summarizer import GeminiSummarizer  # noqa: PLC0415
 
-            gs = GeminiSummarizer()
+            gs = GeminiSummarizer(cache_backend=self._cache_backend)
             logger.info("Gemini summarizer ready.")
             return gs
         except Exception as exc:
@@ -60,7 +95,8 @@ class Summarizer:
         Args:
             processed_data: Dict produced by TextProcessor.process_text().
             method: Per-call override for summarisation method
-                ("extractive" / "generative"). Falls back to config default.
+                ("extractive" / "lexrank" / "generative"). Falls back to
+                config default.
             length: Per-call override for summary length
                 ("short" / "medium" / "long"). Falls back to config default.
 
@@ -80,25 +116,23 @@ class Summarizer:
                 self._gemini = self._try_init_gemini()
             if effective_method == "generative" and self._gemini is not None:
                 result = self._gemini.summarize(  # type: ignore[attr-defined]
-                    processed_data
+                    processed_data, length=effective_length
                 )
             elif effective_method == "generative" and config.summarization.use_fallback:
                 logger.info("Gemini unavailable — falling back to extractive.")
-                result = self._extractive.summarize(
-                    sentences, processed_data, length=effective_length
+                result = self._summarize_extractive(sentences, processed_data, effective_length)
+            elif effective_method == "lexrank":
+                result = self._summarize_extractive(
+                    sentences, processed_data, effective_length, method="lexrank"
                 )
             else:
-                result = self._extractive.summarize(
-                    sentences, processed_data, length=effective_length
-                )
+                result = self._summarize_extractive(sentences, processed_data, effective_length)
 
         except Exception as exc:
             logger.error("Primary summarisation failed: %s", exc)
             if config.summarization.use_fallback and effective_method != "extractive":
                 logger.info("Falling back to extractive summarisation.")
-                result = self._extractive.summarize(
-                    sentences, processed_data, length=effective_length
-                )
+                result = self._summarize_extractive(sentences, processed_data, effective_length)
             else:
                 raise
 
@@ -109,6 +143,77 @@ class Summarizer:
         result["language"] = processed_data.get("language", "unknown")
         return result
 
+    def summarize_many(
+        self,
+        batch: Sequence[dict],
+        method: str | None = None,
+        length: str | None = None,
+    ) -> list[dict]:
+        """``summarize`` for each processed-data dict of *batch*, in order.
+
+        Extractive and LexRank rankings missing from the ranking cache are
+        computed together by ``ExtractiveSummarizer.rank_many`` (one task
+        when the CPU pool is enabled); generative summaries are made one by
+        one through ``summarize``.
+        """
+        effective_method = method or config.summarization.method
+        effective_length = length or config.summarization.summary_length
+        if effective_method not in ("extractive", "lexrank"):
+            return [self.summarize(data, effective_method, effective_length) for data in batch]
+
+        # Read once here: pool workers do not see settings changed at runtime
+        settings = RankingSettings.from_config()
+        keys, misses = [], []
+        rankings: list[dict | None] = []
+        for i, processed_data in enumerate(batch):
+            sentences = processed_data.get("sentences", [])
+            if not sentences:
+                raise ValueError(f"No sentences in processed_data (batch item {i}).")
+            key = ranking_key(
+                sentences, processed_data.get("language", "en"), effective_method, settings
+            )
+            keys.append(key)
+            rankings.append(self.rankings.get(key))
+            if rankings[-1] is None:
+                misses.append(i)
+
+        if misses:
+            items = [(batch[i]["sentences"], batch[i]) for i in misses]
+            computed = (
+                cpu_pool.rank_extractive_many(items, effective_method, settings)
+                if cpu_pool.enabled
+                else self._extractive.rank_many(items, effective_method, settings)
+            )
+            for i, ranking in zip(misses, computed, strict=True):
+                rankings[i] = ranking
+                self.rankings.put(keys[i], ranking)
+
+        results = []
+        for processed_data, ranking in zip(batch, rankings, strict=True):
+            sentences = processed_data["sentences"]
+            result = self._extractive.select(sentences, ranking, effective_length, effective_method)
+            result["original_sentence_count"] = len(sentences)
+            result["summary_length_setting"] = effective_length
+            result["language"] = processed_data.get("language", "unknown")
+            results.append(result)
+        return results
+
+    def _summarize_extractive(
+        self, sentences: list[str], processed_data: dict, length: str, method: str = "extractive"
+    ) -> dict:
+        # Read once here: pool workers do not see settings changed at runtime
+        settings = RankingSettings.from_config()
+        key = ranking_key(sentences, processed_data.get("language", "en"), method, settings)
+        ranking = self.rankings.get(key)
+        if ranking is None:
+            # CPU-bound scoring runs in the process pool when it is enabled
+            if cpu_pool.enabled:
+                ranking = cpu_pool.rank_extractive(sentences, processed_data, method, settings)
+            else:
+                ranking = self._extractive.rank(sentences, processed_data, method, settings)
+            self.rankings.put(key, ranking)
+        return self._extractive.select(sentences, ranking, length, method)
+
 
 # ---------------------------------------------------------------------------
 # Extractive summariser
@@ -116,186 +221,591 @@ class Summarizer:
 
 
 class ExtractiveSummarizer:
-    """TF-IDF + position + cosine-similarity sentence ranking."""
+    """TF-IDF + position + cosine-similarity (or LexRank) sentence ranking."""
 
     def summarize(
         self,
         sentences: list[str],
         processed_data: dict,
         length: str | None = None,
+        method: str = "extractive",
     ) -> dict:
-        if len(sentences) < 2:
-            return {
-                "summary": sentences[0] if sentences else "",
-                "selected_sentences": sentences,
-                "sentence_scores": [1.0] if sentences else [],
-                "method_used": "extractive",
-            }
+        """Rank *sentences* and select a summary of *length* by MMR."""
+        return self.select(sentences, self.rank(sentences, processed_data, method), length, method)
+
+    def rank(
+        self,
+        sentences: list[str],
+        processed_data: dict,
+        method: str = "extractive",
+        settings: RankingSettings | None = None,
+    ) -> dict:
+        """Score *sentences* and order them for every summary length.
+
+        *method* "extractive" combines TF-IDF mass, position, length and
+        centroid similarity; "lexrank" ranks by centrality in the sentence
+        similarity graph. Both read the same TF-IDF matrix.
+
+        Returns ``{"scores": float32 array, "order": int32 array}``: the
+        MMR pick order up to the longest configured length. The first *k*
+        picks are the summary of *k* sentences, so ``select`` serves any
+        length from one ranking. *settings* defaults to the current config.
+        """
+        settings = settings or RankingSettings.from_config()
+        n = len(sentences)
+        if n < 2:
+            return {"scores": np.ones(n, dtype=np.float32), "order": np.arange(n, dtype=np.int32)}
 
         language = processed_data.get("language", "en")
         stop_words = self._get_stop_words(language)
+        document = self._document(sentences, processed_data, language)
+        n = len(document)
+        threshold = settings.hierarchical_min_sentences
+        if 0 < threshold <= n and n > settings.section_sentences:
+            return self._rank_hierarchical(document, stop_words, method, settings)
+
+        # One TF-IDF fit serves term mass, centroid similarity and redundancy
+        matrix = self._tfidf_matrix(document, stop_words, settings.tfidf_mode)
+        combined = self._scores(document, matrix, method, self._position_scores(n), settings)
+        order = self._ranking_order(document, combined, matrix, settings)
+        return {"scores": combined.astype(np.float32), "order": np.asarray(order, dtype=np.int32)}
+
+    def _scores(
+        self,
+        document: Document,
+        matrix: csr_matrix | None,
+        method: str,
+        position: np.ndarray,
+        settings: RankingSettings,
+    ) -> np.ndarray:
+        """Relevance of each sentence of *document* under *method*."""
+        n = len(document)
+        if method == "lexrank":
+            return self._lexrank_scores(
+                matrix if matrix is not None else self._overlap_matrix(document),
+                n,
+                neighbors=settings.lexrank_neighbors,
+                damping=settings.lexrank_damping,
+                tolerance=settings.lexrank_tolerance,
+                max_iter=settings.lexrank_max_iter,
+            )
+        return self._combine_scores(
+            self._tfidf_scores(matrix, n),
+            position,
+            self._length_scores(document),
+            self._similarity_scores(matrix, n),
+        )
+
+    def _rank_hierarchical(
+        self,
+        document: Document,
+        stop_words: frozenset[str],
+        method: str,
+        settings: RankingSettings,
+    ) -> dict:
+        """``rank`` for very long documents: sections first, then their best sentences.
+
+        The document is cut into sections of ``section_sentences``, each
+        scored on its own TF-IDF fit (in a thread pool) and reduced to its
+        ``section_candidates`` best-scoring sentences. The candidates are
+        scored again together and the MMR order is taken over them. No matrix
+        spans the whole document: memory follows the section and shortlist
+        sizes. Position scores keep the sentences' place in the document.
+        Each sentence's score is the one from the last stage it reached.
+        """
+        n = len(document)
+        size = settings.section_sentences
+        per_section = max(settings.limit, settings.section_candidates)
+        position = self._position_scores(n)
+        scores = np.empty(n)
+
+        def shortlist_section(start: int) -> np.ndarray:
+            stop = min(start + size, n)
+            section = document.section(start, stop)
+            section_scores = self._scores(
+                section,
+                self._tfidf_matrix(section, stop_words, settings.tfidf_mode),
+                method,
+                position[start:stop],
+                settings,
+            )
+            scores[start:stop] = section_scores
+            if stop - start <= per_section:
+                return np.arange(start, stop)
+            return start + np.argpartition(section_scores, -per_section)[-per_section:]
+
+        workers = max(1, config.summarization.section_workers)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            candidates = np.sort(
+                np.concatenate(list(executor.map(shortlist_section, range(0, n, size))))
+            ).tolist()
+
+        shortlist = document.select(candidates)
+        matrix = self._tfidf_matrix(shortlist, stop_words, settings.tfidf_mode)
+        final = self._scores(shortlist, matrix, method, position[candidates], settings)
+        scores[candidates] = final
+        order = self._ranking_order(shortlist, final, matrix, settings)
+        return {
+            "scores": scores.astype(np.float32),
+            "order": np.asarray([candidates[i] for i in order], dtype=np.int32),
+        }
 
-        tfidf_scores = self._tfidf_scores(sentences, stop_words)
-        position_scores = self._position_scores(sentences)
-        length_scores = self._length_scores(sentences)
-        similarity_scores = self._similarity_scores(sentences, stop_words)
+    def rank_many(
+        self,
+        batch: Sequence[tuple[list[str], dict]],
+        method: str = "extractive",
+        settings: RankingSettings | None = None,
+    ) -> list[dict]:
+        """``rank`` for each ``(sentences, processed_data)`` of *batch*, scored together.
+
+        The documents' count matrices are stacked block-diagonally into one
+        sparse matrix (each document keeps its own rows and columns), so the
+        TF-IDF weighting and the TF-IDF, position, length and centroid scores
+        run once over the whole batch instead of once per document. The
+        results are the same as ``rank`` per document. Only the MMR order
+        (and the LexRank graph) is still computed per document, on its block
+        of rows.
+
+        Very long documents (hierarchical ranking), documents scored with a
+        background IDF table and those without TF-IDF terms go through
+        ``rank`` one at a time.
+        """
+        settings = settings or RankingSettings.from_config()
+        rankings: list[dict | None] = [None] * len(batch)
+        documents: list[Document] = []
+        counts: list[csr_matrix] = []
+        members: list[int] = []
+        for i, (sentences, processed_data) in enumerate(batch):
+            language = processed_data.get("language", "en")
+            n = len(sentences)
+            threshold = settings.hierarchical_min_sentences
+            if (
+                n < 2
+                or (0 < threshold <= n and n > settings.section_sentences)
+                or (settings.tfidf_mode == "hashed" and idf_tables.weights(language) is not None)
+            ):
+                continue
+            document = self._document(sentences, processed_data, language)
+            try:
+                counts.append(
+                    document.term_matrix(
+                        exclude=self._get_stop_words(language),
+                        ngram_range=(1, 2),
+                        max_features=1000,
+                    )
+                )
+            except ValueError:
+                continue
+            documents.append(document)
+            members.append(i)
+
+        if documents:
+            rows = np.cumsum([0] + [len(d) for d in documents])
+            columns = np.cumsum([0] + [c.shape[1] for c in counts])
+            matrix = self._stacked_tfidf(counts, rows, columns)
+            lengths = np.concatenate([d.sentence_lengths() for d in documents])
+            position = self._batch_position_scores(rows)
+            combined = self._combine_scores(
+                self._batch_tfidf_scores(matrix, rows),
+                position,
+                self._word_count_scores(lengths),
+                self._batch_similarity_scores(matrix, rows),
+            )
+            for j, (document, i) in enumerate(zip(documents, members, strict=True)):
+                block = self._block(matrix, rows[j], rows[j + 1], columns[j], columns[j + 1])
+                scores = (
+                    self._scores(document, block, method, position[rows[j] : rows[j + 1]], settings)
+                    if method == "lexrank"
+                    else combined[rows[j] : rows[j + 1]]
+                )
+                order = self._ranking_order(document, scores, block, settings)
+                rankings[i] = {
+                    "scores": scores.astype(np.float32),
+                    "order": np.asarray(order, dtype=np.int32),
+                }
+
+        for i, (sentences, processed_data) in enumerate(batch):
+            if rankings[i] is None:
+                rankings[i] = self.rank(sentences, processed_data, method, settings)
+        return rankings  # type: ignore[return-value]
+
+    @staticmethod
+    def _stacked_tfidf(
+        counts: list[csr_matrix], rows: np.ndarray, columns: np.ndarray
+    ) -> csr_matrix:
+        """Block-diagonal, row-normalized TF-IDF of per-document count matrices.
+
+        Each block gets its own smoothed IDF, ``log((1 + n) / (1 + df)) + 1``
+        with *n* its sentence count, as ``TfidfTransformer`` would fit it.
+        """
+        stacked = block_diag(counts, format="csr", dtype=np.float64)
+        df = np.bincount(stacked.indices, minlength=stacked.shape[1])
+        sentences = np.repeat(np.diff(rows), np.diff(columns))
+        idf = np.log((1 + sentences) / (1 + df)) + 1
+        return normalize(stacked @ diags(idf), copy=False).tocsr()
+
+    @staticmethod
+    def _block(matrix: csr_matrix, lo: int, hi: int, col_lo: int, col_hi: int) -> csr_matrix:
+        """Rows ``lo:hi`` of block-diagonal *matrix*, restricted to their columns."""
+        indptr = matrix.indptr[lo : hi + 1]
+        start, stop = indptr[0], indptr[-1]
+        return csr_matrix(
+            (matrix.data[start:stop], matrix.indices[start:stop] - col_lo, indptr - start),
+            shape=(hi - lo, col_hi - col_lo),
+        )
 
-        combined = self._combine_scores(
-            tfidf_scores, position_scores, length_scores, similarity_scores
+    @staticmethod
+    def _batch_tfidf_scores(matrix: csr_matrix, rows: np.ndarray) -> np.ndarray:
+        """``_tfidf_scores`` of every document, scaled by its own maximum."""
+        scores = np.asarray(matrix.sum(axis=1)).ravel()
+        peaks = np.repeat(np.maximum.reduceat(scores, rows[:-1]), np.diff(rows))
+        return np.divide(scores, peaks, out=scores, where=peaks > 0)
+
+    @staticmethod
+    def _batch_position_scores(rows: np.ndarray) -> np.ndarray:
+        """``_position_scores`` of every document, concatenated."""
+        sizes = np.diff(rows)
+        n = np.repeat(sizes, sizes)
+        index = np.arange(rows[-1]) - np.repeat(rows[:-1], sizes)
+        return np.where(index < n * 0.1, 1.0, np.where(index > n * 0.9, 0.8, 0.5))
+
+    @staticmethod
+    def _batch_similarity_scores(matrix: csr_matrix, rows: np.ndarray) -> np.ndarray:
+        """``_similarity_scores`` of every document against its own centroid."""
+        sizes = np.diff(rows)
+        owner = np.repeat(np.arange(sizes.size), sizes)
+        # Documents × sentences averaging operator: one product gives every centroid
+        averaging = csr_matrix((1 / sizes[owner], (owner, np.arange(rows[-1]))))
+        centroids = averaging @ matrix
+        norms = np.sqrt(np.asarray(centroids.multiply(centroids).sum(axis=1)).ravel())
+        centroids = (
+            diags(np.divide(1, norms, out=np.zeros_like(norms), where=norms > 0)) @ centroids
         )
+        # Blocks share no columns, so each row only meets its own centroid
+        return np.asarray((matrix @ centroids.T).sum(axis=1)).ravel()
 
-        selected_idx = self._select_diverse(sentences, combined, length=length)
+    def select(
+        self,
+        sentences: list[str],
+        ranking: dict,
+        length: str | None = None,
+        method: str = "extractive",
+    ) -> dict:
+        """Summary of *length* from a ``rank`` result (no scoring is repeated)."""
+        if len(sentences) < 2:
+            return {
+                "summary": sentences[0] if sentences else "",
+                "selected_sentences": list(sentences),
+                "sentence_scores": np.ones(len(sentences), dtype=np.float32),
+                "method_used": method,
+            }
+
+        scores = ranking["scores"]
+        selected_idx = sorted(ranking["order"][: self._target(length, len(sentences))].tolist())
         selected = [sentences[i] for i in selected_idx]
         summary = self._join_sentences(selected)
 
+        # Scores and indices stay compact arrays (JSON output converts them)
         return {
             "summary": summary,
             "selected_sentences": selected,
-            "sentence_scores": [combined[i] for i in selected_idx],
-            "all_scores": combined,
-            "selection_indices": selected_idx,
-            "method_used": "extractive",
+            "sentence_scores": scores[selected_idx],
+            "all_scores": scores,
+            "selection_indices": np.asarray(selected_idx, dtype=np.int32),
+            "method_used": method,
         }
 
+    @staticmethod
+    def _document(sentences: list[str], processed_data: dict, language: str) -> Document:
+        """The processor's tokenized document, or a fresh one for bare sentence lists."""
+        document = processed_data.get("document")
+        if isinstance(document, Document) and (
+            document.sentences is sentences or document.sentences == sentences
+        ):
+            return document
+        return Document.from_sentences(sentences, language)
+
     # --- Scoring ---
 
-    def _get_stop_words(self, language: str) -> str | list[str]:
-        """Return stop words appropriate for *language*.
+    def _get_stop_words(self, language: str) -> frozenset[str]:
+        """Terms excluded from TF-IDF for *language* (the shared registry set).
 
-        sklearn's TfidfVectorizer only understands "english" as a string;
-        for other languages we pass a list from NLTK.
+        sklearn's English list stands in for English and for languages
+        without NLTK stopwords.
         """
-        if language == "en":
-            return "english"
-        nltk_map = {
-            "pt": "portuguese",
-            "es": "spanish",
-            "fr": "french",
-            "de": "german",
-            "it": "italian",
-            "ru": "russian",
-        }
-        if language in nltk_map:
-            try:
-                from nltk.corpus import stopwords as _sw  # noqa: PLC0415
+        return stopword_registry.for_vectorizer(language)
 
-                return list(_sw.words(nltk_map[language]))
-            except Exception as exc:
-                logger.debug("Could not load %s stopwords: %s", language, exc)
-        return "english"
-
-    def _tfidf_scores(
-        self, sentences: list[str], stop_words: str | list[str] = "english"
-    ) -> list[float]:
+    def _tfidf_matrix(
+        self,
+        document: Document,
+        stop_words: frozenset[str] = ENGLISH_STOP_WORDS,
+        mode: str | None = None,
+    ) -> csr_matrix | None:
+        """L2-normalized sentence × term TF-IDF matrix (unigrams and bigrams).
+
+        With *mode* (default ``tfidf_mode``) "hashed" and a background IDF
+        table for the document's language, hashed unigrams weighted by that
+        table instead. Returns None when no term survives the stop-word
+        filtering.
+        """
+        if (mode or config.summarization.tfidf_mode) == "hashed":
+            idf = idf_tables.weights(document.language)
+            if idf is not None:
+                return self._hashed_tfidf_matrix(document, stop_words, idf)
         try:
-            vec = TfidfVectorizer(
-                stop_words=stop_words,
-                lowercase=True,
-                max_features=1000,
+            counts = document.term_matrix(
+                exclude=stop_words,
                 ngram_range=(1, 2),
+                max_features=1000,
             )
-            matrix = vec.fit_transform(sentences)
-            scores = np.array(matrix.sum(axis=1)).flatten()
-            if scores.max() > 0:
-                scores /= scores.max()
-            return scores.tolist()
+            return TfidfTransformer().fit_transform(counts).tocsr()
         except Exception as exc:
-            logger.warning("TF-IDF scoring failed: %s", exc)
-            return [1.0] * len(sentences)
+            logger.warning("TF-IDF fit failed: %s", exc)
+            return None
 
-    def _position_scores(self, sentences: list[str]) -> list[float]:
-        n = len(sentences)
-        scores = []
-        for i in range(n):
-            if i < n * 0.1:
-                scores.append(1.0)
-            elif i > n * 0.9:
-                scores.append(0.8)
-            else:
-                scores.append(0.5)
-        return scores
+    @staticmethod
+    def _hashed_tfidf_matrix(
+        document: Document, stop_words: frozenset[str], idf: np.ndarray
+    ) -> csr_matrix | None:
+        """TF-IDF over hashed unigrams with background *idf* (nothing is fitted).
 
-    def _length_scores(self, sentences: list[str]) -> list[float]:
-        scores = []
-        for s in sentences:
-            wc = len(s.split())
-            if 10 <= wc <= 30:
-                scores.append(1.0)
-            elif wc < 5:
-                scores.append(0.3)
-            elif wc > 50:
-                scores.append(0.5)
-            else:
-                scores.append(0.7)
+        Only the features present in *document* become columns.
+        """
+        hashed = hashed_counts(document, idf.size, exclude=stop_words)
+        if hashed is None:
+            return None
+        counts, features = hashed
+        return normalize(counts @ diags(idf[features]), copy=False).tocsr()
+
+    def _tfidf_scores(self, matrix: csr_matrix | None, n: int) -> np.ndarray:
+        """Each sentence's TF-IDF mass, scaled to a maximum of 1."""
+        if matrix is None:
+            return np.ones(n)
+        scores = np.asarray(matrix.sum(axis=1)).ravel()
+        if scores.max() > 0:
+            scores /= scores.max()
         return scores
 
-    def _similarity_scores(
-        self, sentences: list[str], stop_words: str | list[str] = "english"
-    ) -> list[float]:
-        try:
-            doc = " ".join(sentences)
-            vec = TfidfVectorizer(stop_words=stop_words, lowercase=True)
-            matrix = vec.fit_transform(sentences + [doc])
-            sims = cosine_similarity(matrix[:-1], matrix[-1:]).flatten()
-            return sims.tolist()
-        except Exception as exc:
-            logger.warning("Similarity scoring failed: %s", exc)
-            return [1.0] * len(sentences)
+    def _position_scores(self, n: int) -> np.ndarray:
+        """1.0 for the first 10% of sentences, 0.8 for the last 10%, else 0.5."""
+        index = np.arange(n)
+        return np.where(index < n * 0.1, 1.0, np.where(index > n * 0.9, 0.8, 0.5))
+
+    def _length_scores(self, document: Document) -> np.ndarray:
+        """Preference for sentences of 10-30 words; very short ones score lowest."""
+        return self._word_count_scores(document.sentence_lengths())
+
+    @staticmethod
+    def _word_count_scores(words: np.ndarray) -> np.ndarray:
+        return np.select(
+            [(words >= 10) & (words <= 30), words < 5, words > 50], [1.0, 0.3, 0.5], 0.7
+        )
+
+    def _similarity_scores(self, matrix: csr_matrix | None, n: int) -> np.ndarray:
+        """Cosine similarity of each sentence to the document centroid (mean row)."""
+        if matrix is None:
+            return np.ones(n)
+        centroid = np.asarray(matrix.mean(axis=0)).ravel()
+        norm = np.linalg.norm(centroid)
+        if not norm:
+            return np.zeros(n)
+        # Rows are unit-length, so the dot product with the unit centroid is the cosine
+        return matrix @ (centroid / norm)
 
     def _combine_scores(
         self,
-        tfidf: list[float],
-        position: list[float],
-        length: list[float],
-        similarity: list[float],
-    ) -> list[float]:
-        w = {"tfidf": 0.4, "position": 0.2, "length": 0.2, "similarity": 0.2}
-        return [
-            w["tfidf"] * tfidf[i]
-            + w["position"] * position[i]
-            + w["length"] * length[i]
-            + w["similarity"] * similarity[i]
-            for i in range(len(tfidf))
-        ]
+        tfidf: np.ndarray,
+        position: np.ndarray,
+        length: np.ndarray,
+        similarity: np.ndarray,
+    ) -> np.ndarray:
+        """Weighted sum of the four score vectors (one matrix-vector product)."""
+        return _SCORE_WEIGHTS @ np.vstack((tfidf, position, length, similarity))
+
+    # --- Graph ranking (LexRank) ---
+
+    def _lexrank_scores(
+        self,
+        matrix: csr_matrix | None,
+        n: int,
+        neighbors: int | None = None,
+        damping: float | None = None,
+        tolerance: float | None = None,
+        max_iter: int | None = None,
+    ) -> np.ndarray:
+        """Stationary PageRank score of each sentence, scaled to a maximum of 1.
+
+        Sentences are linked to their *neighbors* most cosine-similar
+        sentences (the graph is symmetrized), edges weighted by cosine. The
+        power iteration stops once the L1 change drops below *tolerance*.
+        Without a *matrix*, every sentence scores 1.
+        """
+        summarization = config.summarization
+        neighbors = summarization.lexrank_neighbors if neighbors is None else neighbors
+        damping = summarization.lexrank_damping if damping is None else damping
+        tolerance = summarization.lexrank_tolerance if tolerance is None else tolerance
+        max_iter = summarization.lexrank_max_iter if max_iter is None else max_iter
+        if matrix is None:
+            return np.ones(n)
+
+        graph = self._similarity_graph(matrix, neighbors)
+        out_weight = np.asarray(graph.sum(axis=1)).ravel()
+        dangling = out_weight == 0
+        # Column-stochastic transitions: rank flows along each sentence's edges
+        transition = (diags(1 / np.where(dangling, 1, out_weight)) @ graph).T.tocsr()
+
+        rank = np.full(n, 1 / n)
+        for _ in range(max_iter):
+            leaked = rank[dangling].sum() / n
+            updated = (1 - damping) / n + damping * (transition @ rank + leaked)
+            delta = np.abs(updated - rank).sum()
+            rank = updated
+            if delta < tolerance:
+                break
+        return rank / rank.max()
+
+    @staticmethod
+    def _similarity_graph(matrix: csr_matrix, neighbors: int) -> csr_matrix:
+        """Symmetric k-nearest-neighbour cosine graph over the unit-length rows."""
+        n = matrix.shape[0]
+        k = min(neighbors, n - 1)
+        if k < 1:
+            return csr_matrix((n, n))
+        # Similarities are computed in dense blocks of ~4M cells against a
+        # dense float32 copy of the terms (sparse × dense is several times
+        # faster than sparse × sparse here) unless that copy is too large
+        features = matrix.astype(np.float32)
+        transposed = (
+            np.ascontiguousarray(features.T.toarray())
+            if n * features.shape[1] <= _DENSE_GRAPH_CELLS
+            else features.T
+        )
+        block = max(1, (1 << 22) // n)
+        rows, cols, weights = [], [], []
+        for start in range(0, n, block):
+            stop = min(start + block, n)
+            sims = features[start:stop] @ transposed
+            if issparse(sims):
+                sims = sims.toarray()
+            sims[np.arange(stop - start), np.arange(start, stop)] = 0.0
+            top = np.argpartition(sims, -k, axis=1)[:, -k:]
+            top_sims = np.take_along_axis(sims, top, axis=1)
+            keep = top_sims > 0
+            rows.append(np.nonzero(keep)[0] + start)
+            cols.append(top[keep])
+            weights.append(top_sims[keep])
+        graph = csr_matrix(
+            (np.concatenate(weights), (np.concatenate(rows), np.concatenate(cols))), shape=(n, n)
+        )
+        return graph.maximum(graph.T).tocsr()
 
     # --- Selection ---
 
     def _select_diverse(
         self,
-        sentences: list[str],
-        scores: list[float],
+        document: Document,
+        scores: np.ndarray,
         length: str | None = None,
+        matrix: csr_matrix | None = None,
+        redundancy_threshold: float | None = None,
+        mmr_lambda: float | None = None,
     ) -> list[int]:
-        effective_length = length or config.summarization.summary_length
-        target = config.summarization.extractive_sentences.get(effective_length, 5)
-        target = min(target, len(sentences))
+        """Indices (sorted) of the MMR summary of *length*; see ``_mmr_order``."""
+        order = self._mmr_order(
+            document,
+            scores,
+            self._target(length, len(document)),
+            matrix=matrix,
+            redundancy_threshold=redundancy_threshold,
+            mmr_lambda=mmr_lambda,
+        )
+        return sorted(order)
 
-        ranked = sorted(enumerate(scores), key=lambda x: x[1], reverse=True)
-        selected_idx: list[int] = []
-        selected_texts: list[str] = []
+    def _ranking_order(
+        self,
+        document: Document,
+        scores: np.ndarray,
+        matrix: csr_matrix | None,
+        settings: RankingSettings,
+    ) -> list[int]:
+        """``_mmr_order`` up to ``settings.limit`` picks, with its MMR settings."""
+        return self._mmr_order(
+            document,
+            scores,
+            settings.limit,
+            matrix=matrix,
+            redundancy_threshold=settings.redundancy_threshold,
+            mmr_lambda=settings.mmr_lambda,
+        )
 
-        for idx, _score in ranked:
-            if len(selected_idx) >= target:
-                break
-            if self._is_diverse(sentences[idx], selected_texts):
-                selected_idx.append(idx)
-                selected_texts.append(sentences[idx])
+    @staticmethod
+    def _target(length: str | None, n: int) -> int:
+        """Number of sentences in a summary of *length* out of *n*."""
+        summarization = config.summarization
+        effective_length = length or summarization.summary_length
+        return min(summarization.extractive_sentences.get(effective_length, 5), n)
+
+    def _mmr_order(
+        self,
+        document: Document,
+        scores: np.ndarray,
+        limit: int,
+        matrix: csr_matrix | None = None,
+        redundancy_threshold: float | None = None,
+        mmr_lambda: float | None = None,
+    ) -> list[int]:
+        """Up to *limit* sentence indices in Maximal Marginal Relevance pick order.
+
+        Each pick maximizes ``λ·score − (1 − λ)·max_sim``, where ``max_sim``
+        is a sentence's highest cosine to the sentences picked so far; a
+        sentence whose ``max_sim`` exceeds *redundancy_threshold* is only
+        picked once no other is left, so near-duplicates fill a summary
+        rather than leave it short (exact copies are never picked).
+        ``max_sim`` is kept as one vector, updated by a sparse
+        product per pick, so selection costs O(n·k). Without the TF-IDF
+        *matrix* (no term survived stop-word filtering), similarity comes
+        from plain token overlap.
+        """
+        summarization = config.summarization
+        threshold = (
+            summarization.redundancy_threshold
+            if redundancy_threshold is None
+            else redundancy_threshold
+        )
+        lam = summarization.mmr_lambda if mmr_lambda is None else mmr_lambda
 
-        selected_idx.sort()
+        matrix = self._overlap_matrix(document) if matrix is None else matrix.tocsr()
+        relevance = lam * np.asarray(scores, dtype=np.float64)
+        max_sim = np.zeros(len(document))
+        picked = np.zeros(len(document), dtype=bool)
+        selected_idx: list[int] = []
+        while len(selected_idx) < limit:
+            marginal = relevance - (1 - lam) * max_sim
+            marginal[picked | (max_sim >= _DUPLICATE_COSINE)] = -np.inf
+            novel = np.where(max_sim > threshold, -np.inf, marginal)
+            idx = int(np.argmax(novel if np.isfinite(novel).any() else marginal))
+            if not np.isfinite(marginal[idx]):
+                break  # only copies of picked sentences are left
+            selected_idx.append(idx)
+            picked[idx] = True
+            if matrix is not None:
+                # Rows are unit-length: the product is the cosine to the new pick.
+                # The row is read from the CSR arrays (sparse indexing costs more)
+                lo, hi = matrix.indptr[idx], matrix.indptr[idx + 1]
+                row = np.zeros(matrix.shape[1])
+                row[matrix.indices[lo:hi]] = matrix.data[lo:hi]
+                np.maximum(max_sim, matrix @ row, out=max_sim)
         return selected_idx
 
-    def _is_diverse(self, candidate: str, selected: list[str]) -> bool:
-        if not selected:
-            return True
-        cand_words = set(candidate.lower().split())
-        for s in selected:
-            sel_words = set(s.lower().split())
-            union = cand_words | sel_words
-            if union:
-                jaccard = len(cand_words & sel_words) / len(union)
-                if jaccard > 0.3:
-                    return False
-        return True
+    @staticmethod
+    def _overlap_matrix(document: Document) -> csr_matrix | None:
+        """L2-normalized binary sentence × token matrix (stop words included)."""
+        try:
+            counts = document.term_matrix(min_chars=1)
+        except ValueError:
+            return None
+        counts.data[:] = 1
+        return normalize(counts.astype(np.float64))
 
     def _join_sentences(self, sentences: list[str]) -> str:
         text = " ".join(sentences)
@@ -3,75 +3,314 @@ Text Processor Module for Article Summarizer Agent
 Handles advanced text cleaning and preprocessing
 """
 
+import heapq
 import logging
 import re
 import string
 import unicodedata
+from collections.abc import Iterable, Iterator
+from functools import lru_cache
 
-import nltk
-from langdetect import DetectorFactory, detect
-from nltk.corpus import stopwords
-from nltk.stem import WordNetLemmatizer
-from nltk.tokenize import sent_tokenize, word_tokenize
+import numpy as np
 
 from config import DEFAULT_LANGUAGE, SUPPORTED_LANGUAGES, config
-
-# Set seed for langdetect for consistent results
-DetectorFactory.seed = 0
+from modules.document import Document, TextSpans, tokenize
+from modules.language_id import language_identifier
+from modules.nltk_resources import (
+    NLTK_LANGUAGES,
+    PUNKT_LANGUAGES,
+    sentence_tokenizer,
+)
+from modules.sentence_segmenter import sentence_segmenter
+from modules.stopwords import stopword_registry
+
+# ---------------------------------------------------------------------------
+# Cleaning tables and fused patterns (compiled once)
+# ---------------------------------------------------------------------------
+
+# Character mapping/deletion applied after NFKC (see TextProcessor._clean_text)
+_CHAR_TABLE: dict[int, str | None] = {
+    # C0/C1 control characters (tab becomes a space, newline is kept)
+    **dict.fromkeys(cp for cp in range(0x20) if cp not in (0x09, 0x0A)),
+    **dict.fromkeys(range(0x7F, 0xA0)),
+    0x09: " ",
+    0x0B: "\n",
+    0x0C: "\n",
+    0x0D: "\n",
+    0x2028: "\n",
+    0x2029: "\n\n",
+    # Zero-width characters, BOM and soft hyphen
+    0x200B: None,
+    0x200C: None,
+    0x200D: None,
+    0x2060: None,
+    0xFEFF: None,
+    0x00AD: None,
+    # Typographic quotes and dashes
+    0x2018: "'",
+    0x2019: "'",
+    0x201A: "'",
+    0x201B: "'",
+    0x201C: '"',
+    0x201D: '"',
+    0x201E: '"',
+    0x201F: '"',
+    0x2013: "-",
+    0x2014: "-",
+    0x2015: "-",
+    0x2212: "-",
+}
+
+_CHAR_RE = re.compile("[" + re.escape("".join(map(chr, _CHAR_TABLE))) + "]")
+
+
+def _map_char(match: re.Match) -> str:
+    return _CHAR_TABLE[ord(match.group())] or ""
+
+
+# URLs, e-mail addresses and phone numbers (basic patterns), removed in one scan.
+# The e-mail branch can start at any non-space character, which makes every
+# position expensive — texts without an "@" use the variant without it.
+_URL_PATTERN = r"http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\(\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+"
+_EMAIL_PATTERN = r"(?<!\S)\S+@\S+\.\S+"
+_PHONE_PATTERN = r"[\+]?[1-9]?[0-9]{7,15}"
+_NOISE_RE = re.compile(f"{_URL_PATTERN}|{_EMAIL_PATTERN}|{_PHONE_PATTERN}")
+_NOISE_NO_EMAIL_RE = re.compile(f"{_URL_PATTERN}|{_PHONE_PATTERN}")
+
+# Runs of sentence punctuation collapse to the last mark ("?!" -> "!", "..." -> "."),
+# and every ., !, ?, ",", ";", ":" gets exactly one following space. Replacement
+# is r"\1\2 " — the unmatched group expands to "". The lookahead lets the
+# scan reject ordinary characters with a single check.
+_PUNCT_RE = re.compile(r"(?=[ .!?,;:])[ ]*(?:[.!?]*([.!?])|([,;:]))")
+
+_LETTER_RE = re.compile(r"[^\W\d_]")
+_ASCII_LETTERS = string.ascii_letters.encode("ascii")
+_PUNCT_DELETE = str.maketrans("", "", string.punctuation)
+
+# ---------------------------------------------------------------------------
+# Sentence filtering — navigation, UI and reference-list patterns per language
+# ---------------------------------------------------------------------------
+
+# Per language: patterns anchored at the start of the (lower-cased) sentence,
+# and phrases that reject a sentence wherever they occur
+_UI_PATTERNS: dict[str, dict[str, tuple[str, ...]]] = {
+    "common": {
+        "prefix": (
+            r"[0-9 \t\-/]+$",
+            # Numbered reference / footnote items: "3) de 2025...", "1. texto..."
+            r"\d+[\)\.]\s",
+        ),
+        "contains": ("copyright", "©", "(c)", "google play", "ebookstore"),
+    },
+    # English navigation (also applied to every other language: site chrome
+    # is frequently English regardless of the article language)
+    "en": {
+        "prefix": (
+            r"(?:click|select|choose|enter|submit|login|register|home|about|contact|menu)",
+            r"(?:next|previous|back|forward|up|down)$",
+        ),
+        "contains": (),
+    },
+    # Portuguese UI / marketplace / book-store patterns
+    "pt": {
+        "prefix": (
+            r"(?:obter|comprar|encontrar|procure|ir para|ver todos|baixar)\b",
+            r"(?:livraria|editora|publicado por|publicada por|sobre este|sobre o livro)\b",
+            r"(?:ouvir|assistir|denunciar|sinalizar)\b",
+        ),
+        "contains": ("todos os vendedores", "e-book dispon", "livro impresso"),
+    },
+}
+
+
+@lru_cache(maxsize=32)
+def _ui_matchers(language: str | None) -> tuple[re.Pattern, re.Pattern | None]:
+    """Compiled ``(prefix, contains)`` matchers for *language*.
+
+    Each is a single alternation over the common, English and *language*
+    patterns (every language's when None). The contains alternation is made
+    of plain lower-case literals, so the regex engine can skip ahead on their
+    first characters instead of trying every branch at every position.
+    """
+    if language is None:
+        groups = list(_UI_PATTERNS)
+    else:
+        groups = ["common", "en"] + ([language] if language in _UI_PATTERNS else [])
+    prefixes = [p for g in dict.fromkeys(groups) for p in _UI_PATTERNS[g]["prefix"]]
+    phrases = [p for g in dict.fromkeys(groups) for p in _UI_PATTERNS[g]["contains"]]
+    prefix_re = re.compile("|".join(prefixes))
+    contains_re = re.compile("|".join(map(re.escape, phrases))) if phrases else None
+    return prefix_re, contains_re
+
+
+def _letter_count(text: str) -> int:
+    """Number of alphabetic characters in *text*."""
+    if text.isascii():
+        raw = text.encode("ascii")
+        return len(raw) - len(raw.translate(None, _ASCII_LETTERS))
+    return sum(map(str.isalpha, text))
+
+
+# ---------------------------------------------------------------------------
+# Sentence and paragraph spans over the cleaned text
+# ---------------------------------------------------------------------------
+
+_SENTENCE_BREAK_RE = re.compile(r"(?<=[.!?])\s+(?=[A-Z])")
+_PARAGRAPH_BREAK_RE = re.compile(r"\n\s*\n")
+
+
+def _spans_between(text: str, separator: re.Pattern, join_lines: bool = False) -> TextSpans:
+    """Spans of the non-blank pieces of *text* between *separator* matches, stripped."""
+    spans = TextSpans(text, join_lines=join_lines)
+    bounds = [0]
+    for match in separator.finditer(text):
+        bounds += (match.start(), match.end())
+    bounds.append(len(text))
+    for start, end in zip(bounds[::2], bounds[1::2], strict=True):
+        while start < end and text[start].isspace():
+            start += 1
+        while end > start and text[end - 1].isspace():
+            end -= 1
+        if start < end:
+            spans.append(start, end)
+    return spans
+
+
+# ---------------------------------------------------------------------------
+# Streaming mode — raw windows and online statistics
+# ---------------------------------------------------------------------------
+
+
+def _raw_windows(chunks: Iterable[str], size: int) -> Iterator[str]:
+    """Regroup *chunks* into windows of about *size* characters.
+
+    Each window is cut at its last paragraph break (else line break) so that
+    line-based cleaning always sees whole lines; the remainder starts the
+    next window. Buffered text stays below *size* plus one chunk.
+    """
+    parts: list[str] = []
+    length = 0
+    for chunk in chunks:
+        parts.append(chunk)
+        length += len(chunk)
+        if length < size:
+            continue
+        buffer = "".join(parts)
+        cut = buffer.rfind("\n\n")
+        if cut <= 0:
+            cut = buffer.rfind("\n")
+        if cut <= 0:
+            cut = len(buffer)
+        yield buffer[:cut]
+        parts = [buffer[cut:]]
+        length = len(parts[0])
+    if length:
+        yield "".join(parts)
+
+
+class _DistinctCounter:
+    """Distinct-item estimate in fixed memory (k minimum values sketch).
+
+    Exact up to *k* distinct items; beyond that the estimate has a relative
+    standard error of about 1/sqrt(k).
+    """
+
+    __slots__ = ("k", "_heap", "_members")
+
+    def __init__(self, k: int = 4096) -> None:
+        self.k = k
+        self._heap: list[int] = []  # negated hashes: the k smallest, max on top
+        self._members: set[int] = set()
+
+    def add(self, item: str) -> None:
+        h = hash(item) & 0xFFFFFFFFFFFFFFFF
+        if h in self._members:
+            return
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, -h)
+            self._members.add(h)
+        elif h < -self._heap[0]:
+            self._members.discard(-heapq.heappushpop(self._heap, -h))
+            self._members.add(h)
+
+    def __len__(self) -> int:
+        if len(self._heap) < self.k:
+            return len(self._heap)
+        return round((self.k - 1) * 2**64 / -self._heap[0])
+
+
+class StreamingStatistics:
+    """Online accumulators for the ``process_text`` statistics in streaming mode.
+
+    Counts are exact; vocabulary richness uses a distinct-word estimate.
+    Paragraph and character counts treat every window boundary as a paragraph
+    break, so they may differ slightly from the batch figures.
+    """
+
+    __slots__ = (
+        "language",
+        "character_count",
+        "word_count",
+        "sentence_count",
+        "paragraph_count",
+        "word_chars",
+        "stopword_count",
+        "_distinct",
+    )
+
+    def __init__(self) -> None:
+        self.language: str | None = None
+        self.character_count = 0
+        self.word_count = 0
+        self.sentence_count = 0
+        self.paragraph_count = 0
+        self.word_chars = 0
+        self.stopword_count = 0
+        self._distinct = _DistinctCounter()
+
+    def add_text(self, clean_text: str) -> None:
+        if self.character_count:
+            self.character_count += 2  # the paragraph break between windows
+        self.character_count += len(clean_text)
+        self.paragraph_count += clean_text.count("\n\n") + 1
+
+    def add_sentence(self, sentence: str, stop_words: frozenset[str]) -> None:
+        words = tokenize(sentence)
+        self.sentence_count += 1
+        self.word_count += len(words)
+        self.word_chars += sum(map(len, words))
+        self.stopword_count += sum(1 for word in words if word in stop_words)
+        add = self._distinct.add
+        for word in words:
+            add(word)
+
+    def as_dict(self) -> dict:
+        """Same keys as the ``statistics`` of ``process_text``."""
+        words = self.word_count
+        stats = {
+            "character_count": self.character_count,
+            "word_count": words,
+            "sentence_count": self.sentence_count,
+            "paragraph_count": self.paragraph_count,
+            "avg_words_per_sentence": words / self.sentence_count if self.sentence_count else 0,
+            "avg_chars_per_word": self.word_chars / words if words else 0,
+            "language": self.language,
+            "vocabulary_richness": len(self._distinct) / words if words else 0,
+        }
+        if self.language in NLTK_LANGUAGES:
+            stats["stopword_ratio"] = self.stopword_count / words if words else 0
+        return stats
 
 
 class TextProcessor:
     """Advanced text processor with multilingual support"""
 
-    def __init__(self):
+    def __init__(self, segmenter: str | None = None):
         self.logger = logging.getLogger(__name__)
-        self.lemmatizer = WordNetLemmatizer()
-        self._download_nltk_data()
-        self._load_stopwords()
-
-    def _download_nltk_data(self):
-        """Download required NLTK data"""
-        for resource, name in [
-            ("tokenizers/punkt", "punkt"),
-            ("tokenizers/punkt_tab", "punkt_tab"),
-        ]:
-            try:
-                nltk.data.find(resource)
-            except LookupError:
-                self.logger.info("Downloading NLTK %s...", name)
-                nltk.download(name, quiet=True)
-
-        try:
-            nltk.data.find("corpora/stopwords")
-        except LookupError:
-            self.logger.info("Downloading NLTK stopwords...")
-            nltk.download("stopwords", quiet=True)
-
-        try:
-            nltk.data.find("corpora/wordnet")
-        except LookupError:
-            self.logger.info("Downloading NLTK wordnet...")
-            nltk.download("wordnet", quiet=True)
-
-    def _load_stopwords(self):
-        """Load stopwords for supported languages"""
-        self.stopwords_dict = {}
-        nltk_languages = {
-            "en": "english",
-            "es": "spanish",
-            "fr": "french",
-            "de": "german",
-            "it": "italian",
-            "pt": "portuguese",
-            "ru": "russian",
-        }
-
-        for lang_code, nltk_lang in nltk_languages.items():
-            try:
-                self.stopwords_dict[lang_code] = set(stopwords.words(nltk_lang))
-            except Exception:
-                self.logger.warning(f"Could not load stopwords for {lang_code}")
-                self.stopwords_dict[lang_code] = set()
+        # "punkt" or "regex" (see config.processing.sentence_segmenter)
+        self.segmenter = segmenter or config.processing.sentence_segmenter
+        # Process-wide, read-only sets loaded once per language
+        self.stopwords_dict = stopword_registry
 
     def process_text(self, raw_text: str) -> dict:
         """
@@ -92,21 +331,20 @@ class TextProcessor:
         language = self._detect_language(raw_text)
         self.logger.info(f"Detected language: {language}")
 
-        # Basic cleaning
-        clean_text = self._basic_cleaning(raw_text)
-
-        # Advanced cleaning
-        clean_text = self._advanced_cleaning(clean_text)
-
-        # Normalize text
-        clean_text = self._normalize_text(clean_text)
+        # Clean and normalize (single fused pass, keeps line/paragraph breaks)
+        clean_text = self._clean_text(raw_text)
 
         # Split into sentences and paragraphs
         sentences = self._extract_sentences(clean_text, language)
         paragraphs = self._extract_paragraphs(clean_text)
 
+        # Tokenize once; statistics and the summarizer share the token ids
+        document = Document.from_sentences(sentences, language)
+
         # Filter content
-        filtered_sentences = self._filter_sentences(sentences)
+        kept = self._kept_indices(sentences, language)
+        filtered_document = document.select(kept)
+        filtered_sentences = filtered_document.sentences
         filtered_paragraphs = self._filter_paragraphs(paragraphs)
 
         # Extract structure if enabled
@@ -115,12 +353,13 @@ class TextProcessor:
             structure = self._extract_structure(raw_text)
 
         # Calculate statistics
-        stats = self._calculate_statistics(clean_text, sentences, language)
+        stats = self._calculate_statistics(clean_text, document, language)
 
         processed_data = {
             "original_text": raw_text,
             "clean_text": clean_text,
             "sentences": filtered_sentences,
+            "document": filtered_document,
             "paragraphs": filtered_paragraphs,
             "language": language,
             "structure": structure,
@@ -132,132 +371,163 @@ class TextProcessor:
         )
         return processed_data
 
+    def iter_sentences(
+        self,
+        chunks: Iterable[str],
+        language: str | None = None,
+        statistics: StreamingStatistics | None = None,
+    ) -> Iterator[str]:
+        """Stream the filtered sentences of raw text given as *chunks*.
+
+        Bounded-memory counterpart of ``process_text`` for very large inputs
+        (e.g. an open text file, which iterates by line): the text is cleaned,
+        split and filtered in windows of ``stream_window_chars``. Each
+        window's last sentence may be cut short by the window, so it is
+        carried over and re-split with the next one; once the carry reaches
+        ``stream_window_chars`` (text with no sentence boundary) it is emitted
+        as a sentence of its own, keeping memory bounded. *language* is detected
+        from the first window when not given; pass a ``StreamingStatistics``
+        to accumulate the statistics as sentences go by.
+        """
+        carry = ""
+        stop_words: frozenset[str] = frozenset()
+        for raw in _raw_windows(chunks, config.processing.stream_window_chars):
+            if language is None:
+                language = self._detect_language(raw)
+                self.logger.info(f"Detected language: {language}")
+            if statistics is not None and statistics.language is None:
+                statistics.language = language
+                if language in self.stopwords_dict:
+                    stop_words = self.stopwords_dict[language]
+            clean = self._clean_text(raw)
+            if not clean:
+                continue
+            if statistics is not None:
+                statistics.add_text(clean)
+
+            sentences = list(
+                self._extract_sentences(f"{carry}\n{clean}" if carry else clean, language)
+            )
+            carry = sentences.pop() if sentences else ""
+            if len(carry) >= config.processing.stream_window_chars:
+                sentences.append(carry)
+                carry = ""
+            yield from self._emit_sentences(sentences, language, statistics, stop_words)
+        if carry:
+            yield from self._emit_sentences([carry], language, statistics, stop_words)
+
+    def _emit_sentences(
+        self,
+        sentences: list[str],
+        language: str | None,
+        statistics: StreamingStatistics | None,
+        stop_words: frozenset[str],
+    ) -> Iterator[str]:
+        if statistics is not None:
+            for sentence in sentences:
+                statistics.add_sentence(sentence, stop_words)
+        yield from self.filter_sentences(sentences, language)
+
     def _detect_language(self, text: str) -> str:
-        """Detect text language"""
+        """Detect text language (n-gram model; stopword overlap for short texts)"""
         if not config.processing.language_detection:
             return DEFAULT_LANGUAGE
 
         try:
             # Take a sample of the text for detection (first 1000 chars)
             sample = text[:1000].strip()
-            if len(sample) < 50:
+            if not sample:
                 return DEFAULT_LANGUAGE
 
-            detected_lang = detect(sample)
+            detected_lang = language_identifier.detect(sample, self.stopwords_dict)
 
             # Check if detected language is supported
             if detected_lang in SUPPORTED_LANGUAGES:
                 return detected_lang
-            else:
-                self.logger.warning(
-                    f"Unsupported language detected: {detected_lang}, using default"
-                )
-                return DEFAULT_LANGUAGE
+            self.logger.debug("No language evidence in sample, using default")
+            return DEFAULT_LANGUAGE
 
         except Exception as e:
             self.logger.warning(f"Language detection failed: {str(e)}, using default")
             return DEFAULT_LANGUAGE
 
-    def _basic_cleaning(self, text: str) -> str:
-        """Basic text cleaning operations"""
-        # Remove extra whitespace
-        text = re.sub(r"\s+", " ", text)
-
-        # Remove control characters
-        text = "".join(char for char in text if ord(char) >= 32 or char in "\n\t")
-
-        # Fix common encoding issues
-        text = text.replace(""", "'").replace(""", "'")
-        text = text.replace('"', '"').replace('"', '"')
-        text = text.replace("–", "-").replace("—", "-")
-        text = text.replace("…", "...")
-
-        # Remove excessive punctuation
-        text = re.sub(r"([.!?]){2,}", r"\1", text)
+    def _clean_text(self, text: str) -> str:
+        """Clean, normalise and de-noise *text* while keeping its line structure.
 
-        return text.strip()
-
-    def _advanced_cleaning(self, text: str) -> str:
-        """Advanced text cleaning operations"""
-        # Remove URLs
-        text = re.sub(
-            r"http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+",
-            "",
-            text,
-        )
-
-        # Remove email addresses
-        text = re.sub(r"\S+@\S+\.\S+", "", text)
-
-        # Remove phone numbers (basic pattern)
-        text = re.sub(r"[\+]?[1-9]?[0-9]{7,15}", "", text)
-
-        # Remove excessive newlines
-        text = re.sub(r"\n{3,}", "\n\n", text)
-
-        # Remove lines that are mostly punctuation or numbers
-        lines = text.split("\n")
-        clean_lines = []
-        for line in lines:
-            line = line.strip()
-            if line and self._is_content_line(line):
-                clean_lines.append(line)
-
-        return "\n".join(clean_lines)
+        Single fused pipeline — one character mapping/deletion table, one
+        regex for URLs / e-mails / phone numbers, one for punctuation runs and
+        spacing, and a final pass over lines that collapses whitespace, drops
+        junk lines and keeps paragraph breaks as a single blank line.
+        """
+        text = unicodedata.normalize("NFKC", text)
+        if "\r" in text:
+            text = text.replace("\r\n", "\n")
+        # str.translate leaves its ASCII fast path on non-ASCII input and does a
+        # dict lookup per character; there a regex over the (rare) mapped code
+        # points applies the same table faster
+        text = text.translate(_CHAR_TABLE) if text.isascii() else _CHAR_RE.sub(_map_char, text)
+        text = (_NOISE_RE if "@" in text else _NOISE_NO_EMAIL_RE).sub(" ", text)
+        text = _PUNCT_RE.sub(r"\1\2 ", text)
+
+        out: list[str] = []
+        paragraph: list[str] = []
+        for raw_line in text.split("\n"):
+            line = " ".join(raw_line.split())
+            if line:
+                paragraph.append(line)
+                continue
+            self._flush_paragraph(paragraph, out)
+        self._flush_paragraph(paragraph, out)
+        return "\n".join(out)
+
+    def _flush_paragraph(self, paragraph: list[str], out: list[str]) -> None:
+        """Append the content lines of *paragraph* to *out*, blank-line separated."""
+        if len(paragraph) == 1:
+            # A standalone line: nav crumbs, bylines, dates, "Share" buttons...
+            lines = paragraph if self._is_content_line(paragraph[0]) else []
+        else:
+            # Hard-wrapped text (PDFs): short tails like "goals." are real content,
+            # only drop lines without any letter (page numbers, rulers)
+            lines = [line for line in paragraph if _LETTER_RE.search(line)]
+        if lines:
+            if out:
+                out.append("")
+            out.extend(lines)
+        paragraph.clear()
 
     def _is_content_line(self, line: str) -> bool:
         """Check if a line contains meaningful content"""
-        if len(line) < 10:
+        length = len(line)
+        if length < 10:
             return False
 
         # Calculate ratio of letters to total characters
-        letter_count = sum(1 for char in line if char.isalpha())
-        if letter_count / len(line) < 0.5:
-            return False
-
-        # Skip lines that are mostly numbers or dates
-        if re.match(r"^\s*[\d\s\-/.,]+\s*$", line):
+        letter_count = _letter_count(line)
+        if letter_count / length < 0.5:
             return False
 
         # Skip lines that are mostly punctuation
-        punct_count = sum(1 for char in line if char in string.punctuation)
-        return not punct_count / len(line) > 0.5
+        punct_count = length - len(line.translate(_PUNCT_DELETE))
+        return not punct_count / length > 0.5
 
     def _normalize_text(self, text: str) -> str:
         """Normalize text using Unicode normalization"""
-        # Normalize Unicode characters
         text = unicodedata.normalize("NFKC", text)
+        return " ".join(_PUNCT_RE.sub(r"\1\2 ", text).split())
 
-        # Fix spacing around punctuation
-        text = re.sub(r"\s*([.!?])\s*", r"\1 ", text)
-        text = re.sub(r"\s*,\s*", ", ", text)
-        text = re.sub(r"\s*;\s*", "; ", text)
-        text = re.sub(r"\s*:\s*", ": ", text)
-
-        # Ensure sentences end with proper spacing
-        text = re.sub(r"([.!?])([A-Z])", r"\1 \2", text)
-
-        return text.strip()
-
-    def _extract_sentences(self, text: str, language: str) -> list[str]:
-        """Extract sentences using NLTK tokenizer"""
+    def _extract_sentences(self, text: str, language: str) -> TextSpans:
+        """Sentence spans of *text*, using the configured segmenter for *language*"""
+        # Sentences may span hard-wrapped lines; they read back whitespace-collapsed
+        sentences = TextSpans(text, join_lines=True)
         try:
-            # Use appropriate NLTK language model if available
-            lang_models = {
-                "en": "english",
-                "de": "german",
-                "fr": "french",
-                "it": "italian",
-                "pt": "portuguese",
-                "es": "spanish",
-            }
-
-            if language in lang_models:
-                sentences = sent_tokenize(text, language=lang_models[language])
+            if self.segmenter == "regex" or language not in PUNKT_LANGUAGES:
+                spans = sentence_segmenter(language).span_tokenize(text)
             else:
-                sentences = sent_tokenize(text)
-
-            return [sent.strip() for sent in sentences if sent.strip()]
+                spans = sentence_tokenizer(language).span_tokenize(text)
+            for start, end in spans:
+                if start < end:
+                    sentences.append(start, end)
+            return sentences
 
         except Exception as e:
             self.logger.warning(
@@ -265,75 +535,60 @@ class TextProcessor:
             )
             return self._regex_sentence_split(text)
 
-    def _regex_sentence_split(self, text: str) -> list[str]:
+    def _regex_sentence_split(self, text: str) -> TextSpans:
         """Fallback sentence splitting using regex"""
         # Split on sentence endings followed by whitespace and capital letter
-        pattern = r"(?<=[.!?])\s+(?=[A-Z])"
-        sentences = re.split(pattern, text)
-        return [sent.strip() for sent in sentences if sent.strip()]
+        return _spans_between(text, _SENTENCE_BREAK_RE, join_lines=True)
 
-    def _extract_paragraphs(self, text: str) -> list[str]:
-        """Extract paragraphs from text"""
-        paragraphs = re.split(r"\n\s*\n", text)
-        return [para.strip() for para in paragraphs if para.strip()]
+    def _extract_paragraphs(self, text: str) -> TextSpans:
+        """Paragraph spans of *text* (separated by blank lines)"""
+        return _spans_between(text, _PARAGRAPH_BREAK_RE)
 
-    def _filter_sentences(self, sentences: list[str]) -> list[str]:
-        """Filter sentences based on quality criteria"""
-        filtered = []
+    def filter_sentences(self, sentences: list[str], language: str | None = None) -> list[str]:
+        """Return the sentences of *sentences* that meet the quality criteria.
 
-        for sentence in sentences:
-            if self._is_valid_sentence(sentence):
-                filtered.append(sentence)
-
-        return filtered
-
-    def _is_valid_sentence(self, sentence: str) -> bool:
+        Batch API: the UI/boilerplate matchers for *language* (all languages'
+        patterns when None) are compiled once and reused for the whole list.
+        """
+        return [sentences[i] for i in self._kept_indices(sentences, language)]
+
+    def _kept_indices(self, sentences: list[str], language: str | None = None) -> list[int]:
+        """Indices of the sentences that pass ``filter_sentences``."""
+        min_len = config.processing.min_sentence_length
+        max_len = config.processing.max_sentence_length
+        prefix_re, contains_re = _ui_matchers(language)
+        match_prefix = prefix_re.match
+        search_phrase = contains_re.search if contains_re is not None else None
+
+        kept = []
+        for index, sentence in enumerate(sentences):
+            length = len(sentence)
+            if not min_len <= length <= max_len:
+                continue
+            # Skip sentences without letters or made mostly of numbers/symbols
+            letter_count = _letter_count(sentence)
+            if not letter_count or letter_count / length < 0.3:
+                continue
+            # Skip sentences that look like navigation, UI, or reference list items
+            lowered = sentence.lower()
+            if match_prefix(lowered) or (search_phrase and search_phrase(lowered)):
+                continue
+            kept.append(index)
+        return kept
+
+    def _is_valid_sentence(self, sentence: str, language: str | None = None) -> bool:
         """Check if sentence meets quality criteria"""
-        # Length check
-        if len(sentence) < config.processing.min_sentence_length:
-            return False
-
-        if len(sentence) > config.processing.max_sentence_length:
-            return False
-
-        # Must contain at least one letter
-        if not re.search(r"[a-zA-Z]", sentence):
-            return False
-
-        # Skip sentences that are mostly numbers or symbols
-        alpha_count = sum(1 for char in sentence if char.isalpha())
-        if alpha_count / len(sentence) < 0.3:
-            return False
+        return bool(self.filter_sentences([sentence], language))
 
-        # Skip sentences that look like navigation, UI, or reference list items
-        ui_patterns = [
-            # English navigation
-            r"^(click|select|choose|enter|submit|login|register|home|about|contact|menu)",
-            r"(copyright|©|\(c\))",
-            r"^(next|previous|back|forward|up|down)$",
-            r"^[0-9\s\-/]+$",
-            # Numbered reference / footnote items: "3) de 2025...", "1. texto..."
-            r"^\d+[\)\.]\s",
-            # Portuguese UI / marketplace / book-store patterns
-            r"^(obter|comprar|encontrar|procure|ir para|ver todos|baixar)\b",
-            r"^(livraria|editora|publicado por|publicada por|sobre este|sobre o livro)\b",
-            r"(todos os vendedores|e-book dispon|livro impresso|google play|eBookstore)",
-            r"^(ouvir|assistir|denunciar|sinalizar)\b",
-        ]
-
-        return all(not re.search(pattern, sentence.lower()) for pattern in ui_patterns)
-
-    def _filter_paragraphs(self, paragraphs: list[str]) -> list[str]:
+    def _filter_paragraphs(self, paragraphs: TextSpans) -> TextSpans:
         """Filter paragraphs based on configuration"""
         if not config.processing.remove_short_paragraphs:
             return paragraphs
 
-        filtered = []
-        for para in paragraphs:
-            if len(para) >= config.processing.min_paragraph_length:
-                filtered.append(para)
-
-        return filtered
+        min_len = config.processing.min_paragraph_length
+        return paragraphs.select(
+            i for i, length in enumerate(paragraphs.span_lengths()) if length >= min_len
+        )
 
     def _extract_structure(self, text: str) -> dict:
         """Extract document structure (headings, sections)"""
@@ -370,32 +625,52 @@ class TextProcessor:
         else:
             return 3
 
-    def _calculate_statistics(self, text: str, sentences: list[str], language: str) -> dict:
-        """Calculate text statistics"""
-        words = word_tokenize(text.lower())
+    def refresh_statistics(self, processed_data: dict) -> dict:
+        """Recompute statistics after sentences were dropped from ``processed_data``
+
+        Boilerplate removal runs after ``process_text``; without this the counts
+        (and the compression-ratio base) would describe sentences that are no
+        longer summarized. The paragraph count is carried over unchanged.
+        """
+        language = processed_data.get("language", DEFAULT_LANGUAGE)
+        document = processed_data.get("document")
+        if document is None:
+            document = Document.from_sentences(processed_data["sentences"], language)
+        previous = processed_data.get("statistics") or {}
+
+        stats = self._calculate_statistics(" ".join(document.sentences), document, language)
+        if "paragraph_count" in previous:
+            stats["paragraph_count"] = previous["paragraph_count"]
+        processed_data["statistics"] = stats
+        return stats
 
-        # Filter out punctuation
-        words = [word for word in words if word.isalnum()]
+    def _calculate_statistics(self, text: str, document: Document, language: str) -> dict:
+        """Calculate text statistics from the shared tokenized document"""
+        words = document.token_ids
+        word_count = document.word_count
+        sentence_count = len(document)
+        term_lengths = np.fromiter(map(len, document.terms), np.int64, len(document.terms))
 
         # Calculate readability metrics
         stats = {
             "character_count": len(text),
-            "word_count": len(words),
-            "sentence_count": len(sentences),
-            "paragraph_count": len(text.split("\n\n")),
-            "avg_words_per_sentence": len(words) / len(sentences) if sentences else 0,
-            "avg_chars_per_word": sum(len(word) for word in words) / len(words) if words else 0,
+            "word_count": word_count,
+            "sentence_count": sentence_count,
+            "paragraph_count": text.count("\n\n") + 1,
+            "avg_words_per_sentence": word_count / sentence_count if sentence_count else 0,
+            "avg_chars_per_word": int(term_lengths[words].sum()) / word_count if word_count else 0,
             "language": language,
         }
 
         # Add vocabulary richness
-        unique_words = set(words)
-        stats["vocabulary_richness"] = len(unique_words) / len(words) if words else 0
+        unique_count = np.unique(words).size
+        stats["vocabulary_richness"] = unique_count / word_count if word_count else 0
 
         # Add stopword ratio if we have stopwords for the language
         if language in self.stopwords_dict:
-            stopword_count = sum(1 for word in words if word in self.stopwords_dict[language])
-            stats["stopword_ratio"] = stopword_count / len(words) if words else 0
+            stop_ids = document.term_ids(self.stopwords_dict[language])
+            stopword_count = int(np.isin(words, stop_ids).sum())
+            stats["stopword_ratio"] = stopword_count / word_count if word_count else 0
 
         return stats
 
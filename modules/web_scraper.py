@@ -25,8 +25,12 @@ import hashlib
 import ipaddress
 import logging
 import random
+import re
 import socket
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse
 
 import chardet
@@ -42,7 +46,13 @@ from tenacity import (
 from urllib3.util.retry import Retry
 
 from config import CONTENT_SELECTORS, UNWANTED_SELECTORS, config
+from modules.cache import CacheBackend
 from modules.circuit_breaker import CircuitOpenError, circuit_breaker
+from modules.cpu_pool import cpu_pool
+from modules.host_latency import host_latency
+from modules.light_variant import find_variant_link, head_complete, variant_rules
+from modules.pagination import find_pagination_links, page_number, same_article
+from modules.structured_data import extract_structured_data, is_complete
 
 logger = logging.getLogger(__name__)
 
@@ -104,6 +114,64 @@ def _check_ssrf(url: str) -> None:
                 )
 
 
+class LighterVariantAvailable(Exception):
+    """Raised mid-download when the page head advertises a lighter AMP/print variant."""
+
+    def __init__(self, variant_url: str, kind: str) -> None:
+        self.variant_url = variant_url
+        self.kind = kind
+        super().__init__(f"Lighter {kind} variant available at {variant_url!r}")
+
+
+# Inline blobs that never carry article text. One left-to-right alternation so
+# that e.g. "<script>" inside a comment (or "<!--" inside a script) is handled
+# by whichever construct opens first. The tag name must end at whitespace, "/"
+# or ">" so custom elements (<svg-icon>, <script-loader>) are left alone, and a
+# self-closing tag (<svg .../>) is matched before it could pair with a later
+# closing tag.
+_PRESTRIP_RE = re.compile(
+    rb"<!--.*?-->"
+    rb"|<(?:script|style|svg|noscript|template)(?=[\s/>])[^>]*/>"
+    rb"|<(script|style|svg|noscript|template)(?=[\s/>])([^>]*)>.*?</\1\s*>",
+    re.IGNORECASE | re.DOTALL,
+)
+_LD_JSON_RE = re.compile(rb"""type\s*=\s*["']?application/ld\+json""", re.IGNORECASE)
+# Byte-level regexes are only safe on ASCII-compatible encodings
+_WIDE_ENCODINGS = ("utf-16", "utf_16", "utf-32", "utf_32", "utf16", "utf32")
+
+
+def _prestrip_html(raw: bytes, encoding: str) -> bytes:
+    """Drop scripts, styles, SVG and comments from raw HTML before DOM construction.
+
+    On modern pages these are most of the bytes; BeautifulSoup would build
+    full node trees for them only for ``_remove_unwanted_elements`` to
+    decompose them again. JSON-LD scripts are kept for the structured-data
+    fast path.
+    """
+    if (encoding or "").lower().startswith(_WIDE_ENCODINGS):
+        return raw
+
+    def _keep_ld_json(match: re.Match) -> bytes:
+        tag = match.group(1)
+        if tag is not None and tag.lower() == b"script" and _LD_JSON_RE.search(match.group(2)):
+            return match.group(0)
+        return b""
+
+    return _PRESTRIP_RE.sub(_keep_ld_json, raw)
+
+
+def _decode(raw: bytes, encoding: str) -> str:
+    try:
+        return raw.decode(encoding or "utf-8", errors="replace")
+    except LookupError:
+        return raw.decode("utf-8", errors="replace")
+
+
+def _looks_binary(url: str) -> bool:
+    """True when the URL path names a document handled by the binary extractors."""
+    return urlparse(url).path.lower().endswith((".pdf", ".docx", ".txt"))
+
+
 # ---------------------------------------------------------------------------
 # WebScraper
 # ---------------------------------------------------------------------------
@@ -112,9 +180,13 @@ def _check_ssrf(url: str) -> None:
 class WebScraper:
     """HTTP-based article extractor with SSRF protection and size limits."""
 
-    def __init__(self) -> None:
+    def __init__(self, cache_backend: CacheBackend | None = None) -> None:
         self.session = self._build_session()
+        self.cache_backend = cache_backend
         self._mem_cache: dict[str, dict] = {}
+        # Extracted pages 2..n of paginated articles, keyed per page URL (bounded LRU)
+        self._page_cache: OrderedDict[str, dict] = OrderedDict()
+        self._page_cache_lock = threading.Lock()
 
     # ------------------------------------------------------------------
     # Public API
@@ -127,6 +199,8 @@ class WebScraper:
           title, author, publish_date, description, content,
           word_count, url, status_code, encoding, scraped_at,
           extraction_method.
+        Paginated articles additionally carry page_count and page_urls;
+        pages fetched via an AMP / print variant carry variant_url.
 
         Raises ValueError for SSRF-blocked URLs.
         Raises requests.HTTPError / requests.RequestException on HTTP failures.
@@ -144,16 +218,36 @@ class WebScraper:
         headers = dict(config.scraping.headers)
         headers["User-Agent"] = random.choice(config.scraping.user_agents)
 
-        # 4. Fetch with retries — fall back to Wayback Machine on 403
+        # 4. Optionally prefer a lighter AMP / print variant of the page
+        prefer_light = config.scraping.prefer_light_variant and not _looks_binary(url)
+        if prefer_light:
+            predicted = variant_rules.predict(url)
+            if predicted is not None:
+                light = self._scrape_light_variant(url, *predicted, headers)
+                if light is not None:
+                    self._mem_cache[url_hash] = light
+                    return light
+                variant_rules.forget(url)
+
+        # 5. Fetch with retries — fall back to Wayback Machine on 403 (also when
+        #    the original is re-fetched after an unusable light variant)
         try:
-            response = self._fetch(url, headers)
+            try:
+                response = self._fetch(url, headers, sniff_variant=prefer_light)
+            except LighterVariantAvailable as found:
+                light = self._scrape_light_variant(url, found.variant_url, found.kind, headers)
+                if light is not None:
+                    variant_rules.learn(url, found.variant_url, found.kind)
+                    self._mem_cache[url_hash] = light
+                    return light
+                response = self._fetch(url, headers)
         except requests.HTTPError as http_exc:
             if http_exc.response is not None and http_exc.response.status_code == 403:
                 logger.warning("403 Forbidden for %s — trying Wayback Machine fallback", url)
                 return self._scrape_via_wayback(url)
             raise
 
-        # 5. Binary format early-exit — bypass HTML pipeline entirely
+        # 6. Binary format early-exit — bypass HTML pipeline entirely
         content_type = response.headers.get("Content-Type", "").lower()
         url_path = url.lower().split("?")[0]
 
@@ -188,22 +282,10 @@ class WebScraper:
             )
             return content_data
 
-        # 6. Detect encoding
-        encoding = self._detect_encoding(response)
-        response.encoding = encoding
-
-        # 7. Parse and extract
-        soup = BeautifulSoup(response.text, "html.parser")
-        content_data = self._extract_content(soup, url)
-
-        content_data.update(
-            {
-                "url": url,
-                "status_code": response.status_code,
-                "encoding": encoding,
-                "scraped_at": time.time(),
-            }
-        )
+        # 7. Detect encoding, parse and extract; stitch further pages if paginated
+        content_data, page_links = self._extract_html_page(response, url)
+        if page_links:
+            content_data = self._stitch_pages(content_data, url, page_links, headers)
 
         # 8. If content is suspiciously thin (JS-rendered SPA), try Wayback Machine
         if content_data.get("word_count", 0) < 80:
@@ -228,10 +310,20 @@ class WebScraper:
 
     def clear_cache(self) -> None:
         self._mem_cache.clear()
+        with self._page_cache_lock:
+            self._page_cache.clear()
 
     def get_cache_size(self) -> int:
         return len(self._mem_cache)
 
+    def get_host_timeouts(self) -> dict[str, dict]:
+        """Return the learned per-host latency and derived connect/read deadlines."""
+        return host_latency.snapshot()
+
+    def get_variant_rules(self) -> dict[str, dict]:
+        """Return the learned per-host AMP / print URL rewrite rules."""
+        return variant_rules.snapshot()
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
@@ -250,8 +342,15 @@ class WebScraper:
         session.mount("https://", adapter)
         return session
 
-    def _fetch(self, url: str, headers: dict[str, str]) -> requests.Response:
-        """Perform the HTTP GET with circuit breaker, Tenacity retries, and content-size guard."""
+    def _fetch(
+        self, url: str, headers: dict[str, str], sniff_variant: bool = False
+    ) -> requests.Response:
+        """Perform the HTTP GET with circuit breaker, Tenacity retries, and content-size guard.
+
+        With *sniff_variant*, the head of the document is inspected as it
+        streams in; if it links a lighter AMP / print variant the download is
+        abandoned and LighterVariantAvailable is raised.
+        """
         hostname = urlparse(url).hostname or url
 
         # Circuit breaker check — fail fast if the host is known-broken
@@ -269,14 +368,25 @@ class WebScraper:
             reraise=True,
         )
         def _do_fetch() -> requests.Response:
+            connect_timeout, read_timeout = host_latency.get_timeouts(hostname)
+            started = time.monotonic()
             # stream=True lets us check Content-Length before downloading body
-            response = self.session.get(
-                url,
-                headers=headers,
-                timeout=config.scraping.timeout,
-                stream=True,
-                verify=True,  # SSL verification always on
-            )
+            try:
+                response = self.session.get(
+                    url,
+                    headers=headers,
+                    timeout=(connect_timeout, read_timeout),
+                    stream=True,
+                    verify=True,  # SSL verification always on
+                )
+            except requests.ConnectTimeout:
+                host_latency.record_timeout(hostname, connect_timeout)
+                raise
+            except requests.Timeout:
+                host_latency.record_timeout(hostname, read_timeout)
+                raise
+            # Time-to-first-byte (headers parsed) feeds the per-host latency sketch
+            host_latency.record(hostname, time.monotonic() - started)
             response.raise_for_status()
 
             # Content-size guard
@@ -290,6 +400,7 @@ class WebScraper:
             # Read body with size cap
             chunks = []
             total = 0
+            sniffing = sniff_variant and "html" in response.headers.get("Content-Type", "html")
             for chunk in response.iter_content(chunk_size=65536):
                 total += len(chunk)
                 if total > config.scraping.max_content_bytes:
@@ -297,6 +408,16 @@ class WebScraper:
                         f"Response body exceeded {config.scraping.max_content_bytes} bytes."
                     )
                 chunks.append(chunk)
+                if sniffing:
+                    head = b"".join(chunks)
+                    found = find_variant_link(head, response.url or url)
+                    if found is not None:
+                        response.close()
+                        raise LighterVariantAvailable(*found)
+                    sniffing = (
+                        total < config.scraping.light_variant_sniff_bytes
+                        and not head_complete(head)
+                    )
             response._content = b"".join(chunks)
             return response
 
@@ -304,6 +425,9 @@ class WebScraper:
             response = _do_fetch()
             circuit_breaker.record_success(hostname)
             return response
+        except LighterVariantAvailable:
+            circuit_breaker.record_success(hostname)
+            raise
         except CircuitOpenError:
             raise
         except (requests.ConnectionError, requests.Timeout) as exc:
@@ -314,6 +438,188 @@ class WebScraper:
             circuit_breaker.record_failure(hostname)
             raise
 
+    def _extract_html_response(self, response: requests.Response, url: str) -> dict:
+        """Detect encoding, parse an HTML response and run the extraction cascade."""
+        return self._extract_html_page(response, url, find_pages=False)[0]
+
+    def _extract_html_page(
+        self, response: requests.Response, url: str, find_pages: bool = True
+    ) -> tuple[dict, list[str]]:
+        """Like _extract_html_response, plus pagination links found before pruning."""
+        encoding = self._detect_encoding(response)
+        response.encoding = encoding
+
+        # Parsing and extraction are CPU-bound: run them in the process pool
+        # when it is enabled (thread-dispatcher mode); the fetch stays here
+        parse = cpu_pool.extract_html if cpu_pool.enabled else self._parse_html
+        content_data, page_links = parse(
+            response.content, encoding, url, response.url or url, find_pages
+        )
+        content_data.update(
+            {
+                "url": url,
+                "status_code": response.status_code,
+                "encoding": encoding,
+                "scraped_at": time.time(),
+            }
+        )
+        return content_data, page_links
+
+    def _parse_html(
+        self, raw: bytes, encoding: str, url: str, base_url: str, find_pages: bool
+    ) -> tuple[dict, list[str]]:
+        """Parse raw HTML and run the extraction cascade (no network access)."""
+        if config.scraping.prestrip_html:
+            raw = _prestrip_html(raw, encoding)
+        soup = BeautifulSoup(_decode(raw, encoding), "html.parser")
+        page_links: list[str] = []
+        if find_pages and config.scraping.max_pages > 1:
+            page_links = find_pagination_links(soup, base_url)
+        return self._extract_content(soup, url), page_links
+
+    # --- Multi-page articles ---
+
+    def _stitch_pages(
+        self, first: dict, url: str, page_links: list[str], headers: dict[str, str]
+    ) -> dict:
+        """Fetch pages 2..n concurrently and append their bodies, in page order, to *first*.
+
+        Page 1 is always fetched (it is where new pages are discovered); every
+        other page is cached on its own, so an article that grows a new page
+        only costs the new page's fetch. A page 1 body from structured data
+        (JSON-LD / microdata ``articleBody``) usually holds every page's text
+        already and is returned as is; page bodies already contained in the
+        text so far are dropped.
+        """
+        if first.get("extraction_method", "").startswith("structured_data_"):
+            return first
+
+        limit = config.scraping.max_pages - 1
+        pages: dict[str, dict] = {}
+        pending = [u for u in page_links if u != url][:limit]
+        seen = {url, *pending}
+
+        with ThreadPoolExecutor(
+            max_workers=max(1, config.scraping.pagination_concurrency),
+            thread_name_prefix="page-fetch",
+        ) as pool:
+            while pending:
+                results = pool.map(lambda u: (u, self._load_page(u, headers)), pending)
+                pages.update((u, page) for u, page in results if page is not None)
+                # Later pages may reveal further ones (e.g. a "next" link on the last
+                # page); only those within this article are followed
+                discovered = [
+                    link
+                    for page in pages.values()
+                    for link in page["links"]
+                    if link not in seen and same_article(link, url)
+                ]
+                pending = list(dict.fromkeys(discovered))[: max(0, limit - len(pages))]
+                seen.update(pending)
+
+        # Numbered pages in page order; un-numbered "next" links in discovery order
+        discovery = list(pages)
+        ordered = sorted(pages, key=lambda u: (page_number(u) or 10**6, discovery.index(u)))
+        bodies = [first["content"]]
+        used = [url]
+        # Whitespace-normalized text so far, to drop pages that repeat it
+        stitched = " ".join(first["content"].split())
+        for page_url in ordered:
+            body = pages[page_url]["content"].strip()
+            flat = " ".join(body.split())
+            if flat and flat not in stitched:
+                bodies.append(body)
+                used.append(page_url)
+                stitched = f"{stitched}\n{flat}"
+        if len(bodies) == 1:
+            return first
+
+        content = "\n\n".join(bodies)
+        first.update(
+            {
+                "content": content,
+                "word_count": len(content.split()),
+                "page_count": len(bodies),
+                "page_urls": used,
+            }
+        )
+        logger.info("Stitched %d pages for %s — %d words", len(bodies), url, first["word_count"])
+        return first
+
+    def _load_page(self, page_url: str, headers: dict[str, str]) -> dict | None:
+        """Return ``{"content", "links"}`` for one article page, from cache or network."""
+        key = CacheBackend.make_key(f"page:{page_url}")
+        with self._page_cache_lock:
+            cached = self._page_cache.get(key)
+            if cached is not None:
+                self._page_cache.move_to_end(key)
+                return cached
+        if self.cache_backend is not None and config.output.cache_enabled:
+            cached = self.cache_backend.get(key)
+        if cached is not None:
+            self._remember_page(key, cached)
+            return cached
+
+        try:
+            _check_ssrf(page_url)
+            response = self._fetch(page_url, headers)
+        except Exception as exc:
+            logger.info("Skipping article page %s: %s", page_url, exc)
+            return None
+        if "html" not in response.headers.get("Content-Type", "html").lower():
+            return None
+
+        content_data, links = self._extract_html_page(response, page_url)
+        page = {"content": content_data.get("content", ""), "links": links}
+        self._remember_page(key, page)
+        if self.cache_backend is not None and config.output.cache_enabled:
+            self.cache_backend.set(key, page, ttl=config.output.cache_ttl)
+        return page
+
+    def _remember_page(self, key: str, page: dict) -> None:
+        if config.scraping.page_cache_size <= 0:
+            return
+        with self._page_cache_lock:
+            self._page_cache[key] = page
+            self._page_cache.move_to_end(key)
+            while len(self._page_cache) > config.scraping.page_cache_size:
+                self._page_cache.popitem(last=False)
+
+    def _scrape_light_variant(
+        self, url: str, variant_url: str, kind: str, headers: dict[str, str]
+    ) -> dict | None:
+        """Fetch and extract the AMP / print variant of *url*; None if it is unusable."""
+        try:
+            _check_ssrf(variant_url)
+            response = self._fetch(variant_url, headers)
+        except Exception as exc:
+            logger.info("Light %s variant %s unavailable: %s", kind, variant_url, exc)
+            return None
+
+        if "html" not in response.headers.get("Content-Type", "html").lower():
+            return None
+
+        content_data = self._extract_html_response(response, variant_url)
+        if content_data.get("word_count", 0) < 80:
+            logger.info("Light %s variant %s too thin — using original", kind, variant_url)
+            return None
+
+        content_data.update(
+            {
+                "url": url,
+                "variant_url": variant_url,
+                "extraction_method": f"{content_data.get('extraction_method', '')}+{kind}",
+            }
+        )
+        logger.info(
+            "Scraped %r via %s variant (%d bytes) — %d words",
+            content_data.get("title", "?"),
+            kind,
+            len(response.content),
+            content_data.get("word_count", 0),
+        )
+        return content_data
+
     def _scrape_via_wayback(self, url: str) -> dict:
         """Fetch article from Wayback Machine when direct access is blocked (403).
 
@@ -355,17 +661,8 @@ class WebScraper:
         )
         snap_resp.raise_for_status()
 
-        soup = BeautifulSoup(snap_resp.text, "html.parser")
-        content_data = self._extract_content(soup, url)
-        content_data.update(
-            {
-                "url": url,
-                "status_code": snap_resp.status_code,
-                "encoding": self._detect_encoding(snap_resp),
-                "scraped_at": time.time(),
-                "extraction_method": content_data.get("extraction_method", "") + "+wayback",
-            }
-        )
+        content_data = self._extract_html_response(snap_resp, url)
+        content_data["extraction_method"] = content_data.get("extraction_method", "") + "+wayback"
 
         self._mem_cache[hashlib.md5(url.encode()).hexdigest()] = content_data
         logger.info(
@@ -538,6 +835,21 @@ class WebScraper:
 
     def _extract_content(self, soup: BeautifulSoup, url: str) -> dict:
         """Try multiple extraction strategies from most to least specific."""
+        # Structured data lives in <script> tags, so read it before pruning
+        structured = extract_structured_data(soup)
+        if is_complete(structured):
+            content = structured["content"]
+            logger.debug("Content extracted via structured data (%s)", structured["source"])
+            return {
+                "title": structured.get("title") or self._extract_title(soup),
+                "author": structured.get("author") or self._extract_author(soup),
+                "publish_date": structured.get("publish_date") or self._extract_publish_date(soup),
+                "description": structured.get("description") or self._extract_description(soup),
+                "content": content,
+                "word_count": len(content.split()),
+                "extraction_method": f"structured_data_{structured['source']}",
+            }
+
         self._remove_unwanted_elements(soup)
         html = str(soup)
 
@@ -561,10 +873,10 @@ class WebScraper:
             method = "full_text_fallback"
 
         return {
-            "title": self._extract_title(soup),
-            "author": self._extract_author(soup),
-            "publish_date": self._extract_publish_date(soup),
-            "description": self._extract_description(soup),
+            "title": structured.get("title") or self._extract_title(soup),
+            "author": structured.get("author") or self._extract_author(soup),
+            "publish_date": structured.get("publish_date") or self._extract_publish_date(soup),
+            "description": structured.get("description") or self._extract_description(soup),
             "content": content.strip(),
             "word_count": len(content.split()) if content else 0,
             "extraction_method": method,
@@ -68,9 +68,12 @@ def api_summarize():
         return jsonify({"success": False, "error": f"Invalid URL: {url!r}"}), 400
 
     method = data.get("method", "extractive").lower()
-    if method not in ("extractive", "generative"):
+    if method not in ("extractive", "lexrank", "generative"):
         return jsonify(
-            {"success": False, "error": 'method must be "extractive" or "generative".'}
+            {
+                "success": False,
+                "error": 'method must be "extractive", "lexrank", or "generative".',
+            }
         ), 400
 
     length = data.get("length", "medium").lower()
@@ -3,6 +3,8 @@
 set -o errexit
 
 pip install -r requirements.txt
+python -m modules.nltk_resources
+python -m modules.language_id
 python -m alembic upgrade head
 
 # Build React SPA — required; deploy fails if this step fails
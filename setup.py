@@ -37,21 +37,10 @@ def main():
         print("❌ Failed to install dependencies. Please check your pip installation.")
         sys.exit(1)
 
-    # Download NLTK data
-    print("📚 Downloading NLTK data...")
-    try:
-        # Import nltk only after it's installed
-        import nltk
-
-        nltk.download("punkt", quiet=True)
-        nltk.download("stopwords", quiet=True)
-        nltk.download("wordnet", quiet=True)
-        print("✅ NLTK data downloaded successfully")
-    except ImportError:
-        print("⚠️ Warning: NLTK not yet installed. NLTK data will be downloaded on first run.")
-    except Exception as e:
-        print(f"⚠️ Warning: Could not download NLTK data: {e}")
-        print("   This will be downloaded automatically on first run.")
+    # Vendor NLTK data (never downloaded at runtime)
+    if not run_command("python -m modules.nltk_resources", "Vendoring NLTK data into nltk_data/"):
+        print("⚠️ Warning: NLTK data missing — sentence splitting falls back to regex.")
+        print("   Re-run: python -m modules.nltk_resources")
 
     # Create directories
     os.makedirs("outputs", exist_ok=True)
@@ -6,6 +6,8 @@ function collectSettingsPayload() {
             "scraping.max_content_bytes": Number(document.getElementById("maxContentBytes").value),
             "summarization.default_method": document.getElementById("defaultMethod").value,
             "summarization.default_length": document.getElementById("defaultLength").value,
+            "summarization.mmr_lambda": Number(document.getElementById("mmrLambda").value),
+            "summarization.redundancy_threshold": Number(document.getElementById("redundancyThreshold").value),
             "summarization.gemini_model_id": document.getElementById("geminiModelId").value.trim(),
             "output.cache_enabled": document.getElementById("cacheEnabled").value === "true",
             "output.cache_ttl": Number(document.getElementById("cacheTtl").value),
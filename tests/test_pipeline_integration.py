@@ -89,3 +89,78 @@ class TestPipelineIntegration:
         # Should succeed via fallback
         assert result["success"] is True
         assert result["method_used"] in ("extractive", "generative")
+
+    def test_length_switch_reuses_the_ranking(self, mock_scraper, monkeypatch):
+        from main import ArticleSummarizerAgent
+        from modules.cache import CacheBackend
+        from modules.summarizer import ExtractiveSummarizer
+
+        class DictBackend(CacheBackend):
+            def __init__(self):
+                self.data = {}
+
+            def get(self, key):
+                return self.data.get(key)
+
+            def set(self, key, value, ttl=None):
+                self.data[key] = value
+
+            def delete(self, key):
+                self.data.pop(key, None)
+
+            def clear_all(self):
+                self.data.clear()
+
+        calls = []
+        original_rank = ExtractiveSummarizer.rank
+
+        def counting_rank(self, *args, **kwargs):
+            calls.append(args)
+            return original_rank(self, *args, **kwargs)
+
+        monkeypatch.setattr(ExtractiveSummarizer, "rank", counting_rank)
+        agent = ArticleSummarizerAgent(cache_backend=DictBackend())
+        url = "https://example.com/ml-ranking"
+        short = agent.run(url, method="extractive", length="short")
+        long = agent.run(url, method="extractive", length="long")
+
+        assert short["success"] and long["success"]
+        assert len(long["summary"]) > len(short["summary"])
+        assert len(calls) == 1
+
+    def test_length_switch_skips_text_processing(self, mock_scraper, monkeypatch):
+        from config import config
+        from main import ArticleSummarizerAgent
+        from modules.text_processor import TextProcessor
+
+        # No stored results: the second run must not come from the result cache
+        monkeypatch.setattr(config.output, "cache_enabled", False)
+        agent = ArticleSummarizerAgent()
+        url = "https://example.com/ml-length-switch"
+        short = agent.run(url, method="extractive", length="short")
+        assert short["success"]
+
+        def fail(*args, **kwargs):
+            raise AssertionError("process_text called for a length-only change")
+
+        monkeypatch.setattr(TextProcessor, "process_text", fail)
+        long = agent.run(url, method="extractive", length="long")
+
+        assert long["success"], long.get("error")
+        assert len(long["summary"]) > len(short["summary"])
+
+    def test_compression_ratio_counts_words_like_the_processor(self, tmp_path, monkeypatch):
+        from config import config
+        from modules.file_manager import FileManager
+        from modules.text_processor import TextProcessor
+
+        monkeypatch.setattr(config.output, "output_dir", str(tmp_path))
+        text = "State-of-the-art models cut costs by 40%. Older ones (pre-2020) did not."
+        processed = TextProcessor().process_text(text)
+        summary = {"summary": "State-of-the-art models cut costs by 40%."}
+
+        stats = FileManager()._calculate_processing_stats({"content": text}, processed, summary)
+
+        assert stats["original"]["word_count"] == processed["statistics"]["word_count"] == 15
+        assert stats["summary"]["word_count"] == 9
+        assert stats["summary"]["compression_ratio"] == pytest.approx(9 / 15)
@@ -6,6 +6,7 @@ import time
 
 from infrastructure.runtime_settings import RuntimeSettingsApplier
 from modules.cache import FilesystemCacheBackend, create_cache_backend
+from modules.host_latency import HostLatencyTracker
 from modules.rate_limiter import InMemoryRateLimiter
 from modules.secrets_manager import SecretsManager
 
@@ -60,6 +61,47 @@ class TestSecretsManager:
         assert len(manager.get_all_valid_keys()) == 1
 
 
+class TestHostLatencyTracker:
+    def test_cold_host_uses_static_timeout(self, monkeypatch):
+        from config import config
+
+        monkeypatch.setattr(config.scraping, "timeout", 30)
+        tracker = HostLatencyTracker(min_samples=3)
+        tracker.record("example.com", 0.2)
+
+        assert tracker.get_timeouts("example.com") == (30.0, 30.0)
+
+    def test_fast_host_gets_tight_deadlines_within_bounds(self, monkeypatch):
+        from config import config
+
+        monkeypatch.setattr(config.scraping, "adaptive_timeouts", True)
+        monkeypatch.setattr(config.scraping, "connect_timeout_min", 3.0)
+        monkeypatch.setattr(config.scraping, "read_timeout_min", 5.0)
+        tracker = HostLatencyTracker(min_samples=3)
+        for latency in (0.1, 0.15, 0.12, 0.11):
+            tracker.record("fast.example", latency)
+
+        assert tracker.get_timeouts("fast.example") == (3.0, 5.0)
+
+    def test_timeouts_push_slow_host_deadline_up_to_max(self, monkeypatch):
+        from config import config
+
+        monkeypatch.setattr(config.scraping, "adaptive_timeouts", True)
+        monkeypatch.setattr(config.scraping, "read_timeout_max", 60.0)
+        tracker = HostLatencyTracker(min_samples=3)
+        for latency in (8.0, 9.0, 12.0):
+            tracker.record("archive.example", latency)
+        tracker.record_timeout("archive.example", 40.0)
+
+        _connect, read = tracker.get_timeouts("archive.example")
+        status = tracker.snapshot()["archive.example"]
+
+        assert read == 60.0
+        assert status["samples"] == 4
+        assert status["timeouts"] == 1
+        assert status["read_timeout"] == read
+
+
 class DummyPipelineRunner:
     def __init__(self) -> None:
         self.cache_backend = object()
@@ -85,13 +127,18 @@ class TestRuntimeSettingsApplier:
         monkeypatch.setattr(
             "infrastructure.runtime_settings.create_cache_backend", lambda ttl: {"ttl": ttl}
         )
-        monkeypatch.setattr("infrastructure.runtime_settings.Summarizer", lambda: {"rebuilt": True})
+        rebuilt = type("SummarizerStub", (), {"cache_backend": None})()
+        monkeypatch.setattr(
+            "infrastructure.runtime_settings.Summarizer", lambda cache_backend: rebuilt
+        )
+        monkeypatch.setattr(config.summarization, "redundancy_threshold", 0.5)
 
         applier.apply(
             {
                 "scraping.max_retries": 7,
                 "summarization.default_method": "generative",
                 "summarization.gemini_model_id": "gemini-test",
+                "summarization.redundancy_threshold": 0.4,
                 "output.cache_ttl": 120,
                 "rate_limit.admin.max_requests": 2,
             }
@@ -100,8 +147,200 @@ class TestRuntimeSettingsApplier:
         assert config.scraping.max_retries == 7
         assert config.summarization.method == "generative"
         assert config.gemini.model_id == "gemini-test"
+        assert config.summarization.redundancy_threshold == 0.4
         assert pipeline_runner.web_scraper.session == "session"
-        assert pipeline_runner.summarizer == {"rebuilt": True}
+        assert pipeline_runner.summarizer is rebuilt
+        assert rebuilt.cache_backend == {"ttl": 120}
         assert pipeline_runner.cache_backend == {"ttl": 120}
         assert pipeline_runner.file_manager.cache_backend == {"ttl": 120}
         assert isinstance(rate_limiters["admin"], InMemoryRateLimiter)
+
+
+class TestCPUPool:
+    TEXT = (
+        "The committee published its findings on Tuesday after a long review of the network. "
+        "Ridership on the regional network grew by four percent over the last year alone. "
+        "Officials expect the new timetable to take effect early next spring across the region. "
+        "Critics argue that the investment plan still leaves rural lines without enough trains."
+    )
+
+    def test_stages_match_inline_results(self):
+        from modules.cpu_pool import CPUPool
+        from modules.ranking_cache import RankingSettings
+        from modules.summarizer import ExtractiveSummarizer
+        from modules.text_processor import TextProcessor
+        from modules.web_scraper import WebScraper
+
+        settings = RankingSettings.from_config()
+        pool = CPUPool()
+        pool.enable(1)
+        try:
+            processed = pool.process_text(self.TEXT)
+            ranking = pool.rank_extractive(
+                processed["sentences"], processed, "extractive", settings
+            )
+            html = f"<html><head><title>Report</title></head><body><p>{self.TEXT}</p></body></html>"
+            extracted = pool.extract_html(
+                html.encode(), "utf-8", "https://example.com/a", "https://example.com/a", True
+            )
+        finally:
+            pool.shutdown()
+
+        inline = TextProcessor().process_text(self.TEXT)
+        assert processed["original_text"] == self.TEXT
+        assert list(processed["sentences"]) == list(inline["sentences"])
+        assert processed["statistics"] == inline["statistics"]
+        expected = ExtractiveSummarizer().rank(
+            list(inline["sentences"]), inline, "extractive", settings
+        )
+        assert ranking["order"].tolist() == expected["order"].tolist()
+        assert ranking["scores"].tolist() == expected["scores"].tolist()
+        assert extracted == WebScraper()._parse_html(
+            html.encode(), "utf-8", "https://example.com/a", "https://example.com/a", True
+        )
+
+    def test_runtime_ranking_settings_reach_workers(self, monkeypatch):
+        from config import config
+        from modules.cpu_pool import cpu_pool
+        from modules.summarizer import ExtractiveSummarizer, Summarizer
+        from modules.text_processor import TextProcessor
+
+        summarization = config.summarization
+        monkeypatch.setattr(summarization, "mmr_lambda", summarization.mmr_lambda)
+        monkeypatch.setattr(
+            summarization, "redundancy_threshold", summarization.redundancy_threshold
+        )
+        monkeypatch.setattr(summarization, "extractive_sentences", {"short": 2, "long": 4})
+        # A near-copy of the lead sentence, which the default threshold rejects
+        lead = self.TEXT.split(". ")[0]
+        text = self.TEXT.replace(". ", f". {lead.replace('Tuesday', 'Monday')}. ", 1)
+        processed = TextProcessor().process_text(text)
+        summarizer = Summarizer()
+
+        cpu_pool.enable(1)
+        try:
+            # Workers were spawned with the env defaults; only this process changes
+            RuntimeSettingsApplier(DummyPipelineRunner(), {}).apply(
+                {"summarization.mmr_lambda": 1.0, "summarization.redundancy_threshold": 1.0}
+            )
+            result = summarizer.summarize(processed, method="extractive", length="short")
+        finally:
+            cpu_pool.enable(0)
+
+        expected = ExtractiveSummarizer().summarize(
+            list(processed["sentences"]), processed, length="short"
+        )
+        assert result["selection_indices"].tolist() == expected["selection_indices"].tolist()
+        # Pure relevance without a threshold keeps the near-copy of the lead
+        assert result["selection_indices"].tolist() == [0, 1]
+
+    def test_disabled_pool_runs_inline(self):
+        from modules.cpu_pool import CPUPool
+
+        pool = CPUPool()
+        assert not pool.enabled
+        assert pool.process_text(self.TEXT)["sentences"]
+        assert pool._executor is None
+
+    def test_broken_pool_falls_back_inline(self, monkeypatch):
+        from concurrent.futures.process import BrokenProcessPool
+
+        from modules.cpu_pool import CPUPool
+
+        class BrokenExecutor:
+            def submit(self, *args):
+                raise BrokenProcessPool("worker died")
+
+            def shutdown(self, **kwargs):
+                pass
+
+        pool = CPUPool()
+        pool.workers = 1
+        pool._executor = BrokenExecutor()
+
+        assert pool.process_text(self.TEXT)["sentences"]
+        assert pool._executor is None
+
+
+class TestBoilerplateIndex:
+    FOOTER = [
+        "Example Media is an independent publisher based in the city since 1998.",
+        "Our reporters have covered the region for three decades of local news.",
+    ]
+
+    def _processed(self, body: list[str]) -> dict:
+        from modules.text_processor import TextProcessor
+
+        return TextProcessor().process_text(" ".join(body + self.FOOTER))
+
+    def test_fingerprint_ignores_case_punctuation_and_digits(self):
+        from modules.boilerplate import sentence_fingerprint
+
+        assert sentence_fingerprint("© 2024 Example Media.") == sentence_fingerprint(
+            "2025 example   media"
+        )
+        assert sentence_fingerprint("Example Media") != sentence_fingerprint("Other Media")
+
+    def test_document_fingerprints_match_sentence_fingerprints(self):
+        from modules.boilerplate import _document_fingerprints, sentence_fingerprint
+
+        processed = self._processed(["The council approved the 2025 budget on Monday night."])
+
+        assert _document_fingerprints(processed["document"]) == [
+            sentence_fingerprint(s) for s in processed["sentences"]
+        ]
+
+    def test_sentences_repeated_across_host_pages_are_dropped(self):
+        from modules.boilerplate import InMemoryBoilerplateIndex, remove_boilerplate
+
+        index = InMemoryBoilerplateIndex()
+        for page in range(2):
+            processed = self._processed([f"Article number {page} covers a different local story."])
+            assert remove_boilerplate(index, f"https://news.example.com/a/{page}", processed) == 0
+
+        processed = self._processed(["The third article reports on the regional rail network."])
+        assert remove_boilerplate(index, "https://news.example.com/a/2", processed) == 2
+        assert list(processed["sentences"]) == [
+            "The third article reports on the regional rail network."
+        ]
+        assert processed["document"].sentences is processed["sentences"]
+
+        # Another host has not seen the footer yet
+        processed = self._processed(["A story on another site entirely about rail fares."])
+        assert remove_boilerplate(index, "https://other.example.org/a/1", processed) == 0
+
+    def test_statistics_follow_the_filtered_document(self):
+        from modules.boilerplate import InMemoryBoilerplateIndex, remove_boilerplate
+        from modules.text_processor import TextProcessor
+
+        index = InMemoryBoilerplateIndex()
+        for page in range(2):
+            processed = self._processed([f"Article number {page} covers a different local story."])
+            remove_boilerplate(index, f"https://news.example.com/a/{page}", processed)
+
+        processed = self._processed(["The third article reports on the regional rail network."])
+        assert remove_boilerplate(index, "https://news.example.com/a/2", processed) == 2
+        stats = TextProcessor().refresh_statistics(processed)
+
+        assert processed["statistics"] is stats
+        assert stats["sentence_count"] == 1
+        assert stats["word_count"] == processed["document"].word_count
+
+    def test_pages_are_counted_once_per_url(self):
+        from modules.boilerplate import InMemoryBoilerplateIndex
+
+        index = InMemoryBoilerplateIndex()
+        for _ in range(5):
+            pages, counts = index.observe("news.example.com", "https://news.example.com/a", ["f"])
+
+        assert (pages, counts) == (1, [1])
+
+    def test_nothing_is_dropped_when_every_sentence_is_boilerplate(self):
+        from modules.boilerplate import InMemoryBoilerplateIndex, remove_boilerplate
+
+        index = InMemoryBoilerplateIndex()
+        for page in range(4):
+            processed = self._processed([])
+            remove_boilerplate(index, f"https://news.example.com/a/{page}", processed)
+
+        assert list(processed["sentences"]) == self.FOOTER
@@ -4,6 +4,7 @@ Gemini is NOT called — tests run fully offline.
 """
 
 import pytest
+from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS
 
 from config import config
 from modules.summarizer import ExtractiveSummarizer, Summarizer
@@ -113,17 +114,733 @@ class TestLanguageAwareStopWords:
 
     def test_portuguese_stop_words_loaded(self, summarizer):
         sw = summarizer._get_stop_words("pt")
-        assert isinstance(sw, list)
+        assert isinstance(sw, frozenset)
         # Common Portuguese stopwords must be present
         assert "de" in sw or "que" in sw
 
-    def test_english_returns_string(self, summarizer):
-        assert summarizer._get_stop_words("en") == "english"
+    def test_english_uses_sklearn_list(self, summarizer):
+        assert summarizer._get_stop_words("en") is ENGLISH_STOP_WORDS
 
     def test_unknown_lang_falls_back_to_english(self, summarizer):
-        assert summarizer._get_stop_words("xx") == "english"
+        assert summarizer._get_stop_words("xx") is ENGLISH_STOP_WORDS
+
+    def test_stop_words_shared_not_copied(self, summarizer):
+        assert summarizer._get_stop_words("pt") is ExtractiveSummarizer()._get_stop_words("pt")
 
     def test_portuguese_summary_produced(self, summarizer):
         result = summarizer.summarize(PT_SENTENCES, PT_PROCESSED)
         assert result["summary"]
         assert len(result["selected_sentences"]) >= 1
+
+
+class TestSharedDocument:
+    def test_processor_document_reused(self, monkeypatch):
+        from modules.document import Document
+
+        document = Document.from_sentences(SENTENCES, "en")
+        built = []
+        original = Document.from_sentences.__func__
+
+        def tracking(cls, sentences, language="en"):
+            built.append(sentences)
+            return original(cls, sentences, language)
+
+        monkeypatch.setattr(Document, "from_sentences", classmethod(tracking))
+        result = ExtractiveSummarizer().summarize(
+            SENTENCES, {**PROCESSED_DATA, "document": document}
+        )
+
+        assert result["summary"]
+        assert built == []
+
+    def test_stale_document_ignored(self):
+        from modules.document import Document
+
+        stale = Document.from_sentences(["Unrelated text here.", "More unrelated text."])
+        result = ExtractiveSummarizer().summarize(SENTENCES, {**PROCESSED_DATA, "document": stale})
+
+        assert all(s in SENTENCES for s in result["selected_sentences"])
+
+
+class TestSharedTfidfFit:
+    def test_one_term_matrix_per_summary(self, monkeypatch):
+        from modules.document import Document
+
+        calls = []
+        original = Document.term_matrix
+
+        def tracking(self, *args, **kwargs):
+            calls.append(kwargs)
+            return original(self, *args, **kwargs)
+
+        monkeypatch.setattr(Document, "term_matrix", tracking)
+        result = ExtractiveSummarizer().summarize(SENTENCES, PROCESSED_DATA, length="long")
+
+        assert result["summary"]
+        assert len(calls) == 1
+
+    def test_centroid_similarity_is_cosine_to_mean_row(self):
+        import numpy as np
+
+        from modules.document import Document
+
+        summarizer = ExtractiveSummarizer()
+        document = Document.from_sentences(SENTENCES, "en")
+        matrix = summarizer._tfidf_matrix(document)
+        centroid = np.asarray(matrix.mean(axis=0)).ravel()
+        dense = matrix.toarray()
+        expected = dense @ centroid / (np.linalg.norm(dense, axis=1) * np.linalg.norm(centroid))
+
+        assert summarizer._similarity_scores(matrix, len(document)) == pytest.approx(expected)
+
+    def test_redundant_sentences_are_not_both_selected(self, monkeypatch):
+        monkeypatch.setitem(config.summarization.extractive_sentences, "short", 2)
+        sentences = [
+            SENTENCES[0],
+            SENTENCES[0].replace("many", "several"),
+            SENTENCES[1],
+            SENTENCES[2],
+        ]
+        result = ExtractiveSummarizer().summarize(
+            sentences, {**PROCESSED_DATA, "sentences": sentences}, length="short"
+        )
+
+        assert result["selection_indices"].tolist() != [0, 1]
+        assert len(result["selection_indices"]) == 2
+
+
+class TestVectorizedScoring:
+    def test_results_hold_compact_arrays(self):
+        import numpy as np
+
+        result = ExtractiveSummarizer().summarize(SENTENCES, PROCESSED_DATA, length="medium")
+
+        assert result["all_scores"].dtype == np.float32
+        assert result["all_scores"].shape == (len(SENTENCES),)
+        assert result["selection_indices"].dtype == np.int32
+        assert result["sentence_scores"].tolist() == (
+            result["all_scores"][result["selection_indices"]].tolist()
+        )
+        assert result["selected_sentences"] == [SENTENCES[i] for i in result["selection_indices"]]
+
+    def test_position_and_length_scores(self):
+        from modules.document import Document
+
+        summarizer = ExtractiveSummarizer()
+        document = Document.from_sentences(
+            ["one two", "a b c d e f g h i j k l", " ".join(["w"] * 40), " ".join(["w"] * 60)]
+        )
+
+        assert summarizer._position_scores(20).tolist() == [1.0] * 2 + [0.5] * 17 + [0.8]
+        assert summarizer._length_scores(document).tolist() == [0.3, 1.0, 0.7, 0.5]
+
+
+class TestMMRSelection:
+    SCORES = [0.9, 0.85, 0.5, 0.4]
+
+    def _select(self, sentences, **kwargs):
+        import numpy as np
+
+        from modules.document import Document
+
+        summarizer = ExtractiveSummarizer()
+        document = Document.from_sentences(sentences, "en")
+        matrix = summarizer._tfidf_matrix(document)
+        return summarizer._select_diverse(
+            document, np.array(self.SCORES), length="short", matrix=matrix, **kwargs
+        )
+
+    def _sentences(self):
+        return [
+            SENTENCES[0],
+            SENTENCES[0].replace("transforming", "reshaping"),
+            SENTENCES[1],
+            SENTENCES[2],
+        ]
+
+    def test_redundancy_threshold_blocks_near_duplicates(self, monkeypatch):
+        monkeypatch.setitem(config.summarization.extractive_sentences, "short", 2)
+
+        assert self._select(self._sentences(), redundancy_threshold=0.5, mmr_lambda=1.0) == [0, 2]
+        assert self._select(self._sentences(), redundancy_threshold=1.0, mmr_lambda=1.0) == [0, 1]
+
+    def test_lambda_trades_relevance_for_novelty(self, monkeypatch):
+        monkeypatch.setitem(config.summarization.extractive_sentences, "short", 2)
+
+        # Without a hard threshold, a low lambda still avoids the near-duplicate
+        assert self._select(self._sentences(), redundancy_threshold=1.0, mmr_lambda=0.3) == [0, 2]
+
+    def test_near_duplicates_fill_the_summary_once_nothing_else_is_left(self, monkeypatch):
+        monkeypatch.setitem(config.summarization.extractive_sentences, "short", 3)
+        sentences = [
+            SENTENCES[0],
+            SENTENCES[0].replace("transforming", "reshaping"),
+            SENTENCES[0].replace("many", "several"),
+            SENTENCES[1],
+        ]
+
+        # The novel sentence comes first, then the best near-duplicate
+        assert self._select(sentences, redundancy_threshold=0.5, mmr_lambda=1.0) == [0, 1, 3]
+
+    def test_exact_copies_are_never_picked(self, monkeypatch):
+        monkeypatch.setitem(config.summarization.extractive_sentences, "short", 3)
+        sentences = [SENTENCES[0]] * 4
+
+        assert self._select(sentences, redundancy_threshold=0.5) == [0]
+
+    def test_overlap_fallback_without_tfidf_terms(self, monkeypatch):
+        import numpy as np
+
+        from modules.document import Document
+
+        monkeypatch.setitem(config.summarization.extractive_sentences, "short", 2)
+        sentences = ["It is what it is.", "It is what it is!", "And so on and on."]
+        document = Document.from_sentences(sentences, "en")
+        summarizer = ExtractiveSummarizer()
+
+        assert summarizer._tfidf_matrix(document) is None
+        assert summarizer._select_diverse(document, np.array([0.9, 0.8, 0.1]), "short") == [0, 2]
+
+
+class TestLexRank:
+    def _matrix(self, sentences):
+        from modules.document import Document
+
+        summarizer = ExtractiveSummarizer()
+        return summarizer, summarizer._tfidf_matrix(Document.from_sentences(sentences, "en"))
+
+    def test_dispatcher_selects_lexrank_per_call(self, monkeypatch):
+        monkeypatch.setattr(config.summarization, "method", "extractive")
+        result = Summarizer().summarize(PROCESSED_DATA, method="lexrank", length="short")
+
+        assert result["method_used"] == "lexrank"
+        assert (
+            len(result["selected_sentences"]) == config.summarization.extractive_sentences["short"]
+        )
+
+    def test_saved_result_keeps_scores(self, tmp_path, monkeypatch):
+        from modules.file_manager import FileManager
+
+        monkeypatch.setattr(config.output, "output_dir", str(tmp_path))
+        monkeypatch.setattr(config.output, "cache_enabled", False)
+        summary = Summarizer().summarize(PROCESSED_DATA, method="lexrank", length="short")
+
+        data = FileManager()._create_result_data(summary, {}, PROCESSED_DATA)
+
+        assert len(data["extractive_data"]["sentence_scores"]) == len(summary["selected_sentences"])
+        assert list(data["extractive_data"]["selection_indices"]) == list(
+            summary["selection_indices"]
+        )
+
+    def test_graph_is_symmetric_and_sparse(self):
+        summarizer, matrix = self._matrix(SENTENCES)
+        graph = summarizer._similarity_graph(matrix, neighbors=2)
+
+        assert (graph != graph.T).nnz == 0
+        assert graph.diagonal().sum() == 0
+        # Each row keeps its own two neighbours plus those that chose it
+        assert graph.nnz <= 2 * 2 * len(SENTENCES)
+
+    def test_power_iteration_matches_dense_pagerank(self):
+        import numpy as np
+
+        summarizer, matrix = self._matrix(SENTENCES)
+        n = len(SENTENCES)
+        scores = summarizer._lexrank_scores(
+            matrix, n, neighbors=n, damping=0.85, tolerance=1e-12, max_iter=1000
+        )
+
+        weights = (matrix @ matrix.T).toarray()
+        np.fill_diagonal(weights, 0)
+        sums = weights.sum(axis=1, keepdims=True)
+        transition = np.where(sums > 0, weights / np.where(sums > 0, sums, 1), 1 / n)
+        google = 0.15 / n + 0.85 * transition.T
+        values, vectors = np.linalg.eig(google)
+        expected = np.abs(vectors[:, np.argmax(values.real)].real)
+
+        np.testing.assert_allclose(scores, expected / expected.max(), atol=1e-6)
+
+    def test_hub_sentence_ranks_first(self):
+        import numpy as np
+
+        sentences = [
+            "Solar panels and wind turbines now supply most new power capacity.",
+            "Solar panels keep getting cheaper every year.",
+            "Wind turbines are being installed offshore at record pace.",
+            "New power capacity is mostly renewable this decade.",
+            "The museum reopened its sculpture garden on Sunday.",
+        ]
+        summarizer, matrix = self._matrix(sentences)
+
+        assert int(np.argmax(summarizer._lexrank_scores(matrix, len(sentences)))) == 0
+
+    def test_scores_without_terms_are_uniform(self):
+        import numpy as np
+
+        assert np.array_equal(ExtractiveSummarizer()._lexrank_scores(None, 3), np.ones(3))
+
+
+class TestRankingCache:
+    class DictBackend:
+        def __init__(self):
+            self.data = {}
+
+        def get(self, key):
+            return self.data.get(key)
+
+        def set(self, key, value, ttl=None):
+            self.data[key] = value
+
+    @pytest.fixture
+    def rank_calls(self, monkeypatch):
+        calls = []
+        original_rank = ExtractiveSummarizer.rank
+
+        def counting_rank(self, *args, **kwargs):
+            calls.append(args)
+            return original_rank(self, *args, **kwargs)
+
+        monkeypatch.setattr(ExtractiveSummarizer, "rank", counting_rank)
+        return calls
+
+    def test_every_length_served_from_one_ranking(self, rank_calls):
+        summarizer = Summarizer()
+        results = {
+            length: summarizer.summarize(PROCESSED_DATA, method="extractive", length=length)
+            for length in ("short", "medium", "long")
+        }
+
+        assert len(rank_calls) == 1
+        for length, result in results.items():
+            direct = ExtractiveSummarizer().summarize(SENTENCES, PROCESSED_DATA, length=length)
+            assert result["summary"] == direct["summary"]
+            assert result["selection_indices"].tolist() == direct["selection_indices"].tolist()
+
+    def test_pick_order_prefixes_match_selection(self):
+        import numpy as np
+
+        from modules.document import Document
+
+        summarizer = ExtractiveSummarizer()
+        ranking = summarizer.rank(SENTENCES, PROCESSED_DATA)
+        document = Document.from_sentences(SENTENCES, "en")
+        matrix = summarizer._tfidf_matrix(document)
+        for k in range(1, len(ranking["order"]) + 1):
+            assert sorted(ranking["order"][:k].tolist()) == sorted(
+                summarizer._mmr_order(document, ranking["scores"], k, matrix=matrix)
+            )
+        assert ranking["scores"].dtype == np.float32
+
+    def test_backend_shares_rankings_across_instances(self, rank_calls):
+        import numpy as np
+
+        backend = self.DictBackend()
+        first = Summarizer(cache_backend=backend).summarize(PROCESSED_DATA, length="short")
+        second = Summarizer(cache_backend=backend).summarize(PROCESSED_DATA, length="short")
+
+        assert len(rank_calls) == 1
+        assert second["summary"] == first["summary"]
+        assert second["all_scores"].dtype == np.float32
+        np.testing.assert_allclose(second["all_scores"], first["all_scores"])
+
+    def test_key_tracks_content_method_and_settings(self, monkeypatch):
+        from modules.ranking_cache import ranking_key
+
+        key = ranking_key(SENTENCES, "en", "extractive")
+        assert ranking_key(list(SENTENCES), "en", "extractive") == key
+        assert ranking_key(SENTENCES[:-1], "en", "extractive") != key
+        assert ranking_key(SENTENCES, "en", "lexrank") != key
+        monkeypatch.setattr(config.summarization, "mmr_lambda", 0.5)
+        assert ranking_key(SENTENCES, "en", "extractive") != key
+
+    def test_in_process_entries_are_bounded(self):
+        import numpy as np
+
+        from modules.ranking_cache import RankingCache
+
+        rankings = RankingCache(max_entries=2)
+        ranking = {"scores": np.ones(2, dtype=np.float32), "order": np.arange(2, dtype=np.int32)}
+        for key in ("a", "b", "c"):
+            rankings.put(key, ranking)
+
+        assert len(rankings) == 2
+        assert rankings.get("a") is None
+        assert rankings.get("c") is ranking
+
+
+class TestHierarchicalRanking:
+    @pytest.fixture
+    def long_document(self, monkeypatch):
+        from modules.document import Document
+
+        monkeypatch.setattr(config.summarization, "hierarchical_min_sentences", 20)
+        monkeypatch.setattr(config.summarization, "section_sentences", 8)
+        monkeypatch.setattr(config.summarization, "section_candidates", 3)
+        monkeypatch.setattr(
+            config.summarization, "extractive_sentences", {"short": 2, "medium": 3, "long": 3}
+        )
+        sentences = SENTENCES * 2 + PT_SENTENCES + SENTENCES
+        return sentences, {"language": "en", "document": Document.from_sentences(sentences, "en")}
+
+    def test_long_documents_are_ranked_by_section(self, long_document, monkeypatch):
+        sentences, processed = long_document
+        summarizer = ExtractiveSummarizer()
+        fitted = []
+        original_fit = summarizer._tfidf_matrix
+
+        def recording_fit(document, *args):
+            fitted.append(len(document))
+            return original_fit(document, *args)
+
+        monkeypatch.setattr(summarizer, "_tfidf_matrix", recording_fit)
+        ranking = summarizer.rank(sentences, processed)
+
+        # Four sections of 8, then one fit over their 3 candidates each
+        assert sorted(fitted) == [8, 8, 8, 8, 12]
+        assert len(ranking["scores"]) == len(sentences)
+        assert len(set(ranking["order"].tolist())) == len(ranking["order"])
+
+    def test_final_selection_over_candidates(self, long_document):
+        sentences, processed = long_document
+        summarizer = ExtractiveSummarizer()
+        ranking = summarizer.rank(sentences, processed)
+        result = summarizer.select(sentences, ranking, length="medium")
+
+        assert len(ranking["order"]) == 3
+        assert result["summary"]
+        # Duplicated sections compete in the final MMR: no sentence text twice
+        assert len(set(result["selected_sentences"])) == len(result["selected_sentences"])
+
+    def test_short_documents_stay_flat(self, monkeypatch):
+        monkeypatch.setattr(config.summarization, "hierarchical_min_sentences", 20)
+        summarizer = ExtractiveSummarizer()
+        monkeypatch.setattr(
+            summarizer,
+            "_rank_hierarchical",
+            lambda *args: pytest.fail("hierarchical ranking used for a short document"),
+        )
+
+        assert summarizer.rank(SENTENCES, PROCESSED_DATA)["order"].size
+
+
+class TestHashedTfidf:
+    @pytest.fixture
+    def table(self, monkeypatch):
+        from modules.idf_table import build_idf_table, idf_tables
+
+        table = build_idf_table([("en", SENTENCES * 3)], n_features=1 << 12)
+        monkeypatch.setattr(config.summarization, "tfidf_mode", "hashed")
+        idf_tables.use(table)
+        yield table
+        idf_tables.reload()
+
+    def test_build_counts_sentence_frequency(self):
+        import numpy as np
+
+        from modules.idf_table import build_idf_table, feature_ids
+
+        table = build_idf_table(
+            [("en", ["Rail fares rise.", "Rail strike ends."]), ("pt", ["Um texto."])],
+            n_features=1 << 12,
+            min_sentences=2,
+        )
+        rail, fares = feature_ids(["rail", "fares"], 1 << 12)
+
+        assert table.languages == ("en",)
+        assert table.sentences.tolist() == [2]
+        # idf = log((1 + S) / (1 + df)) + 1, as in TfidfTransformer(smooth_idf=True)
+        assert table.weights("en")[rail] == pytest.approx(np.log(3 / 3) + 1)
+        assert table.weights("en")[fares] == pytest.approx(np.log(3 / 2) + 1)
+        assert table.weights("pt") is None
+
+    def test_save_load_round_trip(self, tmp_path):
+        import numpy as np
+
+        from modules.idf_table import IdfTable, build_idf_table
+
+        table = build_idf_table([("en", SENTENCES)], n_features=1 << 10)
+        path = str(tmp_path / "idf.npz")
+        table.save(path)
+        loaded = IdfTable.load(path)
+
+        assert loaded.languages == table.languages
+        assert loaded.n_features == 1 << 10
+        assert loaded.idf.dtype == np.float32
+        np.testing.assert_array_equal(loaded.idf, table.idf)
+
+    def test_hashed_matrix_is_normalized_without_a_fit(self, table, monkeypatch):
+        import numpy as np
+        from sklearn.feature_extraction import text
+
+        from modules.document import Document
+
+        monkeypatch.setattr(
+            text.TfidfTransformer,
+            "fit_transform",
+            lambda *args: pytest.fail("hashed mode fitted a TF-IDF model"),
+        )
+        matrix = ExtractiveSummarizer()._tfidf_matrix(Document.from_sentences(SENTENCES, "en"))
+
+        assert matrix.shape[0] == len(SENTENCES)
+        norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+        np.testing.assert_allclose(norms, 1.0, rtol=1e-5)
+
+    def test_hashed_mode_summarizes(self, table):
+        result = ExtractiveSummarizer().summarize(SENTENCES, PROCESSED_DATA, length="short")
+
+        assert result["summary"]
+        assert len(result["selected_sentences"]) <= 3
+
+    def test_uncovered_language_falls_back_to_fit(self, table, monkeypatch):
+        from modules.document import Document
+
+        summarizer = ExtractiveSummarizer()
+        document = Document.from_sentences(PT_SENTENCES, "pt")
+        stop_words = summarizer._get_stop_words("pt")
+
+        hashed = summarizer._tfidf_matrix(document, stop_words)
+        monkeypatch.setattr(config.summarization, "tfidf_mode", "fit")
+        fitted = summarizer._tfidf_matrix(document, stop_words)
+
+        assert hashed.shape == fitted.shape
+        assert (hashed != fitted).nnz == 0
+
+    def test_relative_table_path_resolves_against_project_root(self, tmp_path, monkeypatch):
+        import config as config_module
+        from modules.idf_table import IdfTables, build_idf_table
+
+        build_idf_table([("en", SENTENCES)], n_features=1 << 10).save(str(tmp_path / "idf.npz"))
+        monkeypatch.setattr(config_module, "PROJECT_ROOT", str(tmp_path))
+        monkeypatch.setattr(config.summarization, "idf_table_path", "idf.npz")
+        monkeypatch.chdir(tmp_path.parent)  # started from another directory
+
+        assert IdfTables().weights("en") is not None
+
+    def test_ranking_key_follows_idf_table(self, table):
+        from modules.idf_table import build_idf_table, idf_tables
+        from modules.ranking_cache import ranking_key
+
+        key = ranking_key(SENTENCES, "en", "extractive")
+        assert ranking_key(SENTENCES, "en", "extractive") == key
+
+        idf_tables.use(build_idf_table([("en", SENTENCES * 5)], n_features=1 << 12))
+        assert ranking_key(SENTENCES, "en", "extractive") != key
+
+    def test_cli_rebuilds_from_stored_results(self, tmp_path, monkeypatch):
+        import json
+        import os
+        import sys
+
+        from modules.idf_table import IdfTable, main
+
+        for name, url, language, sentences in [
+            ("old", "https://a.example/1", "en", ["Stale text."]),
+            ("new", "https://a.example/1", "en", SENTENCES),
+            ("other", "https://b.example/2", "pt", PT_SENTENCES),
+            ("unknown", "https://c.example/3", "unknown", SENTENCES),
+        ]:
+            path = tmp_path / f"{name}.json"
+            path.write_text(
+                json.dumps(
+                    {
+                        "metadata": {"url": url, "language": language},
+                        "original_content": {"sentences": sentences},
+                    }
+                ),
+                encoding="utf-8",
+            )
+        os.utime(tmp_path / "old.json", (0, 0))
+        output = tmp_path / "idf.npz"
+        monkeypatch.setattr(
+            sys,
+            "argv",
+            [
+                "idf_table",
+                "--source",
+                str(tmp_path),
+                "--output",
+                str(output),
+                "--min-sentences",
+                "1",
+                "--features",
+                "1024",
+            ],
+        )
+        main()
+        table = IdfTable.load(str(output))
+
+        assert table.languages == ("en", "pt")
+        assert table.sentences.tolist() == [len(SENTENCES), len(PT_SENTENCES)]
+
+
+class TestBatchSummarization:
+    BATCH = [
+        {"sentences": SENTENCES, "language": "en"},
+        {"sentences": PT_SENTENCES, "language": "pt"},
+        {"sentences": SENTENCES[:3], "language": "en"},
+        {"sentences": ["Only one sentence here."], "language": "en"},
+        {"sentences": ["It is.", "And so."], "language": "en"},  # only stop words
+    ]
+
+    @pytest.mark.parametrize("method", ["extractive", "lexrank"])
+    def test_rank_many_matches_rank(self, method):
+        import numpy as np
+
+        summarizer = ExtractiveSummarizer()
+        items = [(data["sentences"], data) for data in self.BATCH]
+        batched = summarizer.rank_many(items, method)
+
+        assert len(batched) == len(items)
+        for (sentences, data), ranking in zip(items, batched, strict=True):
+            single = summarizer.rank(sentences, data, method)
+            np.testing.assert_allclose(ranking["scores"], single["scores"], atol=1e-6)
+            assert ranking["order"].tolist() == single["order"].tolist()
+
+    def test_scores_are_computed_in_one_stacked_matrix(self, monkeypatch):
+        summarizer = ExtractiveSummarizer()
+        monkeypatch.setattr(
+            summarizer, "_tfidf_matrix", lambda *args: pytest.fail("per-document TF-IDF fit")
+        )
+        items = [(data["sentences"], data) for data in self.BATCH[:3]]
+
+        assert len(summarizer.rank_many(items)) == 3
+
+    def test_summarize_many_matches_summarize(self):
+        summarizer = Summarizer()
+        results = summarizer.summarize_many(self.BATCH, method="extractive", length="short")
+
+        for data, result in zip(self.BATCH, results, strict=True):
+            single = Summarizer().summarize(data, method="extractive", length="short")
+            assert result["summary"] == single["summary"]
+            assert result["language"] == data["language"]
+            assert result["original_sentence_count"] == len(data["sentences"])
+            assert result["summary_length_setting"] == "short"
+
+    def test_summarize_many_reuses_cached_rankings(self, monkeypatch):
+        summarizer = Summarizer()
+        summarizer.summarize(self.BATCH[0], method="extractive")
+        ranked = []
+        original = ExtractiveSummarizer.rank_many
+
+        def recording(self, items, *args):
+            ranked.append(len(items))
+            return original(self, items, *args)
+
+        monkeypatch.setattr(ExtractiveSummarizer, "rank_many", recording)
+        summarizer.summarize_many(self.BATCH[:2], method="extractive")
+        summarizer.summarize_many(self.BATCH[:2], method="extractive", length="long")
+
+        assert ranked == [1]
+
+    def test_generative_goes_through_summarize(self, monkeypatch):
+        summarizer = Summarizer()
+        calls = []
+        monkeypatch.setattr(
+            summarizer,
+            "summarize",
+            lambda data, method, length: calls.append(method) or {"summary": "x"},
+        )
+
+        assert summarizer.summarize_many(self.BATCH[:2], method="generative") == [
+            {"summary": "x"},
+            {"summary": "x"},
+        ]
+        assert calls == ["generative", "generative"]
+
+    def test_empty_item_raises(self):
+        with pytest.raises(ValueError, match="batch item 1"):
+            Summarizer().summarize_many([self.BATCH[0], {"sentences": []}], method="extractive")
+
+
+class TestGeminiResponseCache:
+    DictBackend = TestRankingCache.DictBackend
+
+    @pytest.fixture
+    def gemini(self, monkeypatch):
+        from types import SimpleNamespace
+
+        from modules import gemini_summarizer
+
+        calls = []
+
+        def generate_content(model, contents, config):
+            calls.append(contents)
+            return SimpleNamespace(
+                text="A cached summary.",
+                usage_metadata=SimpleNamespace(
+                    prompt_token_count=120, candidates_token_count=30, total_token_count=150
+                ),
+            )
+
+        monkeypatch.setattr(
+            gemini_summarizer,
+            "genai_types",
+            SimpleNamespace(GenerateContentConfig=lambda **kwargs: kwargs),
+            raising=False,
+        )
+        monkeypatch.setattr(config.output, "cache_enabled", True)
+        summarizer = gemini_summarizer.GeminiSummarizer.__new__(gemini_summarizer.GeminiSummarizer)
+        summarizer._client = SimpleNamespace(
+            models=SimpleNamespace(generate_content=generate_content)
+        )
+        summarizer._model_id = "gemini-test"
+        summarizer.cache_backend = self.DictBackend()
+        return summarizer, calls
+
+    def test_same_text_is_served_from_cache(self, gemini):
+        from modules.metrics import GEMINI_TOKENS_SAVED
+
+        summarizer, calls = gemini
+        saved = GEMINI_TOKENS_SAVED.labels(kind="prompt")._value.get()
+        first = summarizer.summarize(PROCESSED_DATA, length="short")
+        # Another URL, same syndicated text
+        second = summarizer.summarize(dict(PROCESSED_DATA, url="https://b.example/"), "short")
+
+        assert len(calls) == 1
+        assert first["cached"] is False and second["cached"] is True
+        assert second["summary"] == first["summary"]
+        assert second["usage"] == first["usage"]
+        assert GEMINI_TOKENS_SAVED.labels(kind="prompt")._value.get() == saved + 120
+
+    def test_key_covers_model_length_and_text(self, gemini):
+        from modules.gemini_summarizer import response_key
+
+        summarizer, calls = gemini
+        summarizer.summarize(PROCESSED_DATA, length="short")
+        summarizer.summarize(PROCESSED_DATA, length="long")
+        summarizer.summarize({"sentences": SENTENCES[:4]}, length="short")
+        summarizer._model_id = "gemini-other"
+        summarizer.summarize(PROCESSED_DATA, length="short")
+
+        assert len(calls) == 4
+        assert response_key("m", "short", "text") != response_key("m", "short", "text.")
+
+    def test_cache_disabled(self, gemini, monkeypatch):
+        summarizer, calls = gemini
+        monkeypatch.setattr(config.output, "cache_enabled", False)
+        summarizer.summarize(PROCESSED_DATA, length="short")
+        summarizer.summarize(PROCESSED_DATA, length="short")
+
+        assert len(calls) == 2
+        assert not summarizer.cache_backend.data
+
+    def test_dispatcher_passes_backend_and_length(self, monkeypatch):
+        summarizer = Summarizer(cache_backend=self.DictBackend())
+        seen = []
+        summarizer._gemini = type(
+            "GeminiStub",
+            (),
+            {
+                "cache_backend": None,
+                "summarize": lambda self, data, length=None: (
+                    seen.append(length) or {"summary": "x", "method_used": "generative"}
+                ),
+            },
+        )()
+        replacement = self.DictBackend()
+        summarizer.cache_backend = replacement
+        summarizer.summarize(PROCESSED_DATA, method="generative", length="long")
+
+        assert seen == ["long"]
+        assert summarizer._gemini.cache_backend is replacement
+        assert summarizer.rankings.backend is replacement
@@ -2,6 +2,8 @@
 Tests for TextProcessor — language detection, cleaning, sentence splitting.
 """
 
+from collections.abc import Sequence
+
 import pytest
 
 from modules.text_processor import TextProcessor
@@ -38,7 +40,7 @@ class TestBasicProcessing:
     def test_sentences_are_list_of_strings(self, processor):
         result = processor.process_text(SAMPLE_EN)
         sentences = result["sentences"]
-        assert isinstance(sentences, list)
+        assert isinstance(sentences, Sequence)
         assert len(sentences) >= 1
         assert all(isinstance(s, str) for s in sentences)
 
@@ -108,3 +110,619 @@ class TestSentenceFiltering:
         sentences = result["sentences"]
         for s in sentences:
             assert "copyright" not in s.lower(), f"Copyright line leaked: {s!r}"
+
+    def test_filter_sentences_batch(self, processor):
+        sentences = [
+            "The committee published its findings on Tuesday.",
+            "Click here to subscribe to our daily newsletter.",
+            "12 / 04 / 2025 - 13 / 04 / 2025 - 14 / 04",
+            "Officials expect the timetable to change next spring.",
+        ]
+        assert processor.filter_sentences(sentences, "en") == [sentences[0], sentences[3]]
+
+    def test_language_specific_patterns(self, processor):
+        sentence = "Ouvir este artigo agora mesmo com narração."
+        assert processor.filter_sentences([sentence], "pt") == []
+        assert processor.filter_sentences([sentence], "de") == [sentence]
+        assert processor.filter_sentences([sentence]) == []
+
+    def test_non_latin_sentences_kept(self, processor):
+        sentence = "Этот текст полностью написан на русском языке."
+        assert processor.filter_sentences([sentence], "ru") == [sentence]
+
+
+class TestCleaning:
+    def test_paragraph_breaks_preserved(self, processor):
+        text = "First paragraph about the economy.\n\n\n\nSecond paragraph on policy today."
+        assert processor._clean_text(text) == (
+            "First paragraph about the economy.\n\nSecond paragraph on policy today."
+        )
+
+    def test_navigation_lines_dropped(self, processor):
+        text = "Home\n\n12/03/2025\n\nThe council approved the new budget on Monday."
+        assert processor._clean_text(text) == "The council approved the new budget on Monday."
+
+    def test_wrapped_lines_kept_within_paragraph(self, processor):
+        text = "The study covers every region of the\ncountry.\n42\n"
+        assert processor._clean_text(text) == "The study covers every region of the\ncountry."
+
+    def test_characters_mapped_and_spacing_normalised(self, processor):
+        text = "It’s “done” — really\x07!!!  Call +5511987654321 ,now."
+        assert processor._clean_text(text) == 'It\'s "done" - really! Call, now.'
+
+    def test_emails_removed(self, processor):
+        cleaned = processor._clean_text("Write to press@example.com for the full report today.")
+        assert "@" not in cleaned
+
+
+class TestNLTKResources:
+    @pytest.fixture
+    def data_dir(self, tmp_path, monkeypatch):
+        from config import config
+        from modules import nltk_resources
+        from modules.stopwords import stopword_registry
+
+        monkeypatch.setattr(config.processing, "nltk_data_dir", str(tmp_path))
+        monkeypatch.delenv("NLTK_DATA", raising=False)
+        monkeypatch.setattr("nltk.data.path", [])
+        nltk_resources.stopwords.cache_clear()
+        stopword_registry.clear()
+        yield tmp_path
+        nltk_resources.stopwords.cache_clear()
+        stopword_registry.clear()
+
+    def test_stopwords_read_from_vendored_dir(self, data_dir):
+        from modules.nltk_resources import stopwords
+
+        corpus = data_dir / "corpora" / "stopwords"
+        corpus.mkdir(parents=True)
+        (corpus / "portuguese").write_text("de\na\no\n\n", encoding="utf-8")
+
+        assert stopwords("pt") == frozenset({"de", "a", "o"})
+
+    def test_stopwords_read_from_zip(self, data_dir):
+        import zipfile
+
+        from modules.nltk_resources import stopwords
+
+        (data_dir / "corpora").mkdir()
+        with zipfile.ZipFile(data_dir / "corpora" / "stopwords.zip", "w") as zf:
+            zf.writestr("stopwords/german", "der\ndie\ndas\n")
+
+        assert stopwords("de") == frozenset({"der", "die", "das"})
+
+    def test_relative_dir_resolves_against_project_root(self, data_dir, monkeypatch):
+        import os
+
+        from config import PROJECT_ROOT, config
+        from modules import nltk_resources
+
+        # A worker started from another directory still finds the vendored data
+        monkeypatch.setattr(config.processing, "nltk_data_dir", "nltk_data")
+        monkeypatch.chdir(data_dir)
+
+        assert nltk_resources.vendored_dir() == os.path.join(PROJECT_ROOT, "nltk_data")
+
+    def test_falls_back_to_nltk_data_path(self, data_dir, tmp_path_factory, monkeypatch):
+        from modules.nltk_resources import stopwords
+
+        # Installed the usual NLTK way (e.g. ~/nltk_data), nothing vendored
+        home = tmp_path_factory.mktemp("nltk_home")
+        corpus = home / "corpora" / "stopwords"
+        corpus.mkdir(parents=True)
+        (corpus / "spanish").write_text("el\nla\n", encoding="utf-8")
+        monkeypatch.setattr("nltk.data.path", [str(home)])
+
+        assert stopwords("es") == frozenset({"el", "la"})
+
+    def test_missing_resource_raises_with_vendor_hint(self, data_dir):
+        from modules.nltk_resources import NLTKResourceError, stopwords
+
+        with pytest.raises(NLTKResourceError, match="python -m modules.nltk_resources"):
+            stopwords("fr")
+
+    def test_processor_never_downloads(self, data_dir, monkeypatch):
+        import nltk
+
+        def fail(*args, **kwargs):
+            raise AssertionError("nltk.download called at runtime")
+
+        monkeypatch.setattr(nltk, "download", fail)
+        processor = TextProcessor()
+        result = processor.process_text(SAMPLE_EN)
+
+        assert result["sentences"]
+        assert processor.stopwords_dict["fr"] == frozenset()
+
+
+class TestStopwordRegistry:
+    @pytest.fixture
+    def registry(self, monkeypatch):
+        from modules import stopwords as stopwords_module
+
+        loads = []
+
+        def fake_stopwords(language):
+            loads.append(language)
+            if language == "fr":
+                raise stopwords_module.NLTKResourceError("missing")
+            return frozenset({f"{language}-word"})
+
+        monkeypatch.setattr(stopwords_module, "stopwords", fake_stopwords)
+        registry = stopwords_module.StopwordRegistry()
+        registry.loads = loads
+        return registry
+
+    def test_each_language_loaded_once(self, registry):
+        first = registry["pt"]
+        assert registry["pt"] is first
+        assert registry.loads == ["pt"]
+
+    def test_missing_list_is_empty_and_not_retried(self, registry):
+        assert registry["fr"] == frozenset()
+        assert registry["fr"] == frozenset()
+        assert registry.loads == ["fr"]
+
+    def test_covers_nltk_languages_only(self, registry):
+        from modules.nltk_resources import NLTK_LANGUAGES
+
+        assert "zh" not in registry
+        assert registry.get("zh") is None
+        assert list(registry) == list(NLTK_LANGUAGES)
+        assert registry.loads == []
+
+    def test_vectorizer_set_falls_back_to_english(self, registry):
+        from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS
+
+        assert registry.for_vectorizer("pt") == frozenset({"pt-word"})
+        assert registry.for_vectorizer("en") is ENGLISH_STOP_WORDS
+        assert registry.for_vectorizer("fr") is ENGLISH_STOP_WORDS
+        assert registry.for_vectorizer("zh") is ENGLISH_STOP_WORDS
+
+    def test_processors_share_the_registry(self):
+        from modules.stopwords import stopword_registry
+
+        assert TextProcessor().stopwords_dict is stopword_registry
+        assert TextProcessor().stopwords_dict is stopword_registry
+
+
+LANGUAGE_SAMPLES = {
+    "en": "The committee published its findings on Tuesday, saying the regional "
+    "transport network needs investment.",
+    "pt": "O comitê publicou suas conclusões na terça-feira, dizendo que a rede de "
+    "transporte regional precisa de investimento.",
+    "es": "El comité publicó sus conclusiones el martes, diciendo que la red de "
+    "transporte regional necesita inversión.",
+    "fr": "Le comité a publié ses conclusions mardi, affirmant que le réseau de "
+    "transport régional a besoin d'investissements.",
+    "de": "Der Ausschuss veröffentlichte am Dienstag seine Ergebnisse und erklärte, "
+    "das regionale Verkehrsnetz brauche Investitionen.",
+    "ru": "Комитет опубликовал свои выводы во вторник, заявив, что региональная "
+    "транспортная сеть нуждается в инвестициях.",
+    "zh": "委员会周二公布了调查结果，称区域交通网络需要投资。",
+    "ja": "委員会は火曜日に調査結果を発表し、地域の交通網には投資が必要だと述べた。",
+    "ko": "위원회는 화요일에 조사 결과를 발표하며 지역 교통망에 투자가 필요하다고 말했다.",
+}
+
+
+class TestLanguageIdentification:
+    @pytest.fixture
+    def identifier(self):
+        from modules.language_id import LanguageIdentifier, language_identifier
+
+        identifier = LanguageIdentifier()
+        identifier._model = language_identifier.model  # share the loaded arrays
+        return identifier
+
+    @pytest.mark.parametrize("language", sorted(LANGUAGE_SAMPLES))
+    def test_detects_language(self, identifier, language):
+        assert identifier.detect(LANGUAGE_SAMPLES[language]) == language
+
+    def test_short_text_uses_stopwords(self, identifier, monkeypatch):
+        def fail(text):
+            raise AssertionError("n-gram model used for a short text")
+
+        monkeypatch.setattr(identifier, "_ngram_vote", fail)
+        stopword_sets = {
+            "en": frozenset({"the", "of", "and"}),
+            "pt": frozenset({"o", "de", "que", "para"}),
+        }
+
+        assert identifier.detect("o preço de venda que caiu", stopword_sets) == "pt"
+
+    def test_stopword_tie_falls_back_to_ngrams(self, identifier):
+        stopword_sets = {"en": frozenset({"a"}), "pt": frozenset({"a"})}
+        assert identifier.detect("a casa e a rua da cidade", stopword_sets) == "pt"
+
+    def test_results_are_cached(self, identifier, monkeypatch):
+        text = LANGUAGE_SAMPLES["de"]
+        assert identifier.detect(text) == "de"
+
+        monkeypatch.setattr(identifier, "_ngram_vote", lambda text: "en")
+        assert identifier.detect(text) == "de"
+        identifier.clear_cache()
+        assert identifier.detect(text) == "en"
+
+    def test_no_letters_gives_no_language(self, identifier):
+        assert identifier.detect("") is None
+
+    def test_stopword_vote_reads_only_ngram_candidates(self, identifier):
+        class RecordingSets(dict):
+            def __getitem__(self, language):
+                read.append(language)
+                return dict.__getitem__(self, language)
+
+        read = []
+        stopword_sets = RecordingSets(
+            {lang: frozenset({"o", "de", "que"}) for lang in ("en", "pt", "ru", "zh", "ko")}
+        )
+        stopword_sets["pt"] = frozenset({"o", "de", "que", "para"})
+
+        assert identifier.detect("o preço de venda que caiu para", stopword_sets) == "pt"
+        assert "pt" in read and len(read) == len(set(read)) <= 3
+        assert not {"ru", "zh", "ko"} & set(read)
+
+    def test_model_built_in_memory_when_missing_and_reloaded(self, tmp_path, monkeypatch):
+        from config import config
+        from modules.language_id import LanguageIdentifier, build_model
+
+        path = tmp_path / "langid.npz"
+        monkeypatch.setattr(config.processing, "langid_model_path", str(path))
+        built = LanguageIdentifier().model
+        assert not path.exists()  # only the build step writes the model
+
+        build_model().save(str(path))
+        loaded = LanguageIdentifier().model
+        assert loaded.languages == built.languages
+        assert (loaded.log_probs == built.log_probs).all()
+
+    def test_relative_model_path_resolves_against_project_root(self, tmp_path, monkeypatch):
+        import config as config_module
+        from config import SUPPORTED_LANGUAGES, config
+        from modules import language_id
+
+        (tmp_path / "models").mkdir()
+        language_id.language_identifier.model.save(str(tmp_path / "models" / "langid.npz"))
+        monkeypatch.setattr(config_module, "PROJECT_ROOT", str(tmp_path))
+        monkeypatch.setattr(config.processing, "langid_model_path", "models/langid.npz")
+        monkeypatch.chdir(tmp_path / "models")  # started from another directory
+        monkeypatch.setattr(language_id, "build_model", lambda: pytest.fail("model rebuilt"))
+
+        assert language_id.LanguageIdentifier().model.languages == tuple(SUPPORTED_LANGUAGES)
+
+    def test_processor_uses_identifier(self, processor):
+        assert processor._detect_language(LANGUAGE_SAMPLES["pt"]) == "pt"
+        assert processor._detect_language("   ") == "en"
+
+
+class TestDocument:
+    def test_processor_shares_tokenized_document(self, processor):
+        from modules.document import Document
+
+        result = processor.process_text(SAMPLE_EN)
+        document = result["document"]
+
+        assert isinstance(document, Document)
+        assert document.sentences == result["sentences"]
+        assert document.language == result["language"]
+        assert len(document.offsets) == len(document) + 1
+
+    def test_token_ids_and_vocabulary(self):
+        from modules.document import Document
+
+        document = Document.from_sentences(["The cat sat.", "The dog, the cat!"])
+
+        assert document.terms == ["the", "cat", "sat", "dog"]
+        assert document.token_ids.tolist() == [0, 1, 2, 0, 3, 0, 1]
+        assert document.sentence_lengths().tolist() == [3, 4]
+        assert document.token_sets() == [frozenset({0, 1, 2}), frozenset({0, 1, 3})]
+        assert document.word_count == 7
+
+    def test_select_shares_vocabulary(self):
+        from modules.document import Document
+
+        document = Document.from_sentences(["alpha beta", "gamma", "beta delta"])
+        subset = document.select([0, 2])
+
+        assert subset.sentences == ["alpha beta", "beta delta"]
+        assert subset.vocabulary is document.vocabulary
+        assert [subset.sentence_ids(i).tolist() for i in range(2)] == [[0, 1], [1, 3]]
+
+    def test_section_is_a_contiguous_select(self):
+        from modules.document import Document, TextSpans
+
+        text = "alpha beta. gamma. beta delta. epsilon alpha."
+        spans = TextSpans(text)
+        for start, end in ((0, 11), (12, 18), (19, 30), (31, 45)):
+            spans.append(start, end)
+        document = Document.from_sentences(spans)
+
+        section = document.section(1, 3)
+        expected = document.select([1, 2])
+
+        assert list(section.sentences) == list(expected.sentences)
+        assert section.sentences.text is text
+        assert section.token_ids.tolist() == expected.token_ids.tolist()
+        assert section.offsets.tolist() == expected.offsets.tolist()
+        assert section.vocabulary is document.vocabulary
+
+    def test_term_matrix_matches_count_vectorizer(self):
+        from sklearn.feature_extraction.text import CountVectorizer
+
+        from modules.document import Document
+
+        sentences = [
+            "The regional network needs sustained investment.",
+            "Investment in the network grew, and the network grew again.",
+            "A b c.",
+        ]
+        ours = Document.from_sentences(sentences).term_matrix(
+            exclude={"the", "and"}, ngram_range=(1, 2)
+        )
+        reference = CountVectorizer(stop_words=["the", "and"], ngram_range=(1, 2))
+        expected = reference.fit_transform(sentences)
+
+        assert ours.shape == expected.shape
+        assert sorted(ours.sum(axis=0).tolist()[0]) == sorted(expected.sum(axis=0).tolist()[0])
+        assert ours.sum(axis=1).tolist() == expected.sum(axis=1).tolist()
+
+    def test_term_matrix_empty_vocabulary_raises(self):
+        from modules.document import Document
+
+        with pytest.raises(ValueError, match="empty vocabulary"):
+            Document.from_sentences(["a b c"]).term_matrix()
+
+
+WRAPPED = (
+    "The committee published its findings on Tuesday after a long\n"
+    "review of the network. Ridership grew by four percent last year.\n"
+    "\n"
+    "Officials expect the new timetable to take effect early next spring."
+)
+
+
+class TestTextSpans:
+    def test_spans_materialize_on_access(self):
+        from modules.document import TextSpans
+
+        spans = TextSpans("alpha beta\ngamma. delta", join_lines=True)
+        spans.append(0, 16)
+        spans.append(18, 23)
+
+        assert len(spans) == 2
+        assert spans[0] == "alpha beta gamma"
+        assert list(spans) == ["alpha beta gamma", "delta"]
+        assert spans == ["alpha beta gamma", "delta"]
+        assert spans.span_lengths() == [16, 5]
+        assert list(spans.select([1])) == ["delta"]
+
+    def test_pickled_subset_carries_only_spanned_text(self):
+        import pickle
+
+        from modules.document import TextSpans
+
+        text = "x" * 1000 + "alpha beta\ngamma. delta"
+        spans = TextSpans(text, join_lines=True)
+        spans.append(1000, 1016)
+        spans.append(1018, 1023)
+
+        restored = pickle.loads(pickle.dumps(spans))
+
+        assert list(restored) == ["alpha beta gamma", "delta"]
+        assert len(restored.text) == 21
+
+    def test_processor_sentences_share_clean_text(self, processor):
+        from modules.document import TextSpans
+
+        result = processor.process_text(SAMPLE_EN)
+
+        for key in ("sentences", "paragraphs"):
+            assert isinstance(result[key], TextSpans)
+            assert result[key].text is result["clean_text"]
+        assert result["document"].sentences is result["sentences"]
+
+    def test_regex_split_matches_string_split(self, processor):
+        import re
+
+        expected = [" ".join(s.split()) for s in re.split(r"(?<=[.!?])\s+(?=[A-Z])", WRAPPED)]
+        assert list(processor._regex_sentence_split(WRAPPED)) == expected
+
+    def test_punkt_spans_match_tokenize(self, processor, monkeypatch):
+        from nltk.tokenize.punkt import PunktSentenceTokenizer
+
+        from modules import text_processor
+
+        tokenizer = PunktSentenceTokenizer()
+        monkeypatch.setattr(text_processor, "sentence_tokenizer", lambda language: tokenizer)
+
+        expected = [" ".join(s.split()) for s in tokenizer.tokenize(WRAPPED)]
+        assert list(processor._extract_sentences(WRAPPED, "en")) == expected
+
+    def test_paragraph_spans(self, processor):
+        paragraphs = processor._extract_paragraphs(WRAPPED)
+
+        assert list(paragraphs) == [p.strip() for p in WRAPPED.split("\n\n")]
+        assert "\n" in paragraphs[0]
+
+    def test_json_output_materializes_spans(self, tmp_path, monkeypatch):
+        import json
+
+        from config import config
+        from modules.file_manager import FileManager
+
+        monkeypatch.setattr(config.output, "output_dir", str(tmp_path))
+        monkeypatch.setattr(config.output, "cache_enabled", False)
+        result = TextProcessor().process_text(SAMPLE_EN)
+        path = tmp_path / "out.json"
+
+        FileManager()._save_json({"sentences": result["sentences"]}, path)
+
+        assert json.loads(path.read_text(encoding="utf-8"))["sentences"] == list(
+            result["sentences"]
+        )
+
+
+class TestStreaming:
+    @pytest.fixture
+    def small_windows(self, monkeypatch):
+        from config import config
+
+        monkeypatch.setattr(config.processing, "stream_window_chars", 700)
+
+    def test_stream_matches_batch(self, processor, small_windows):
+        from modules.text_processor import StreamingStatistics
+
+        text = SAMPLE_EN * 20
+        chunks = [text[i : i + 97] for i in range(0, len(text), 97)]
+        statistics = StreamingStatistics()
+
+        streamed = list(processor.iter_sentences(chunks, statistics=statistics))
+        batch = processor.process_text(text)
+
+        assert streamed == list(batch["sentences"])
+        assert statistics.as_dict() == pytest.approx(batch["statistics"])
+
+    def test_sentence_fragment_carried_across_windows(self, processor, small_windows):
+        sentence = "The regional transport network needs sustained investment over time."
+        line = " ".join([sentence] * 12)
+        chunks = [line[:500], line[500:]]  # no line break: the window cuts mid-sentence
+
+        assert list(processor.iter_sentences(chunks, language="en")) == [sentence] * 12
+
+    def test_carry_without_sentence_boundary_is_flushed(
+        self, processor, small_windows, monkeypatch
+    ):
+        split = processor._extract_sentences
+        lengths = []
+
+        def recording(text, language):
+            lengths.append(len(text))
+            return split(text, language)
+
+        monkeypatch.setattr(processor, "_extract_sentences", recording)
+        words = "lorem ipsum dolor sit amet " * 400  # no sentence boundary anywhere
+        chunks = [words[i : i + 97] for i in range(0, len(words), 97)]
+        tail = "The regional transport network needs sustained investment over time."
+
+        streamed = list(processor.iter_sentences([*chunks, f". {tail}"], language="en"))
+
+        assert max(lengths) < 2 * 700 + 100
+        assert streamed[-1] == tail
+
+    def test_windows_cut_at_breaks_and_stay_bounded(self):
+        from modules.text_processor import _raw_windows
+
+        text = ("A paragraph line.\nAnother line.\n\n" * 200).strip()
+        chunks = [text[i : i + 50] for i in range(0, len(text), 50)]
+        windows = list(_raw_windows(chunks, 300))
+
+        assert "".join(windows) == text
+        assert all(len(w) < 300 + 50 for w in windows)
+        assert all(w.endswith("line.") for w in windows)
+
+    def test_distinct_counter_estimate(self):
+        from modules.text_processor import _DistinctCounter
+
+        counter = _DistinctCounter(k=256)
+        for i in range(100):
+            counter.add(f"word{i % 50}")
+        assert len(counter) == 50
+
+        for i in range(20000):
+            counter.add(f"term{i}")
+        assert len(counter) == pytest.approx(20050, rel=0.25)
+
+
+class TestRegexSegmenter:
+    def _split(self, language, text):
+        from modules.sentence_segmenter import sentence_segmenter
+
+        return sentence_segmenter(language).tokenize(text)
+
+    def test_abbreviations_and_initials_do_not_break(self):
+        text = "Mr. Smith met Dr. J. Doe in the U.S. last week. They talked, e.g. about fares."
+
+        assert self._split("en", text) == [
+            "Mr. Smith met Dr. J. Doe in the U.S. last week.",
+            "They talked, e.g. about fares.",
+        ]
+
+    def test_sentence_ending_in_no_or_est_still_breaks(self):
+        text = (
+            "The answer was no. Fares rose in the co. They cost $5 est. Lines No. 5 and "
+            "No. 7 reopen, est. 1890. Done."
+        )
+
+        assert self._split("en", text) == [
+            "The answer was no.",
+            "Fares rose in the co.",
+            "They cost $5 est.",
+            "Lines No. 5 and No. 7 reopen, est. 1890.",
+            "Done.",
+        ]
+
+    def test_terminators_quotes_and_lower_case_continuation(self):
+        text = 'Is it enough? "No." Critics disagree! "Why?" she asked... and left. Done.'
+
+        assert self._split("en", text) == [
+            "Is it enough?",
+            '"No."',
+            "Critics disagree!",
+            '"Why?" she asked... and left.',
+            "Done.",
+        ]
+
+    def test_per_language_tables(self):
+        assert self._split(
+            "de", "Am 3. Oktober kam er z.B. nach Berlin. Vgl. Abb. 12 oben. Ende."
+        ) == [
+            "Am 3. Oktober kam er z.B. nach Berlin.",
+            "Vgl. Abb. 12 oben.",
+            "Ende.",
+        ]
+        assert self._split("ru", "Он родился в 1990 г. в Москве. Т.е. давно. Проф. Иванов.") == [
+            "Он родился в 1990 г. в Москве.",
+            "Т.е. давно.",
+            "Проф. Иванов.",
+        ]
+
+    def test_cjk_terminators_need_no_whitespace(self):
+        assert self._split("zh", "调查结果公布了。网络需要投资！够吗？“不够。”他说") == [
+            "调查结果公布了。",
+            "网络需要投资！",
+            "够吗？",
+            "“不够。”",
+            "他说",
+        ]
+
+    def test_spans_exclude_surrounding_whitespace(self):
+        from modules.sentence_segmenter import sentence_segmenter
+
+        text = "  First one.\n  Second one.  "
+
+        assert list(sentence_segmenter("en").span_tokenize(text)) == [(2, 12), (15, 26)]
+
+    def test_processor_regex_mode(self, monkeypatch):
+        from modules import text_processor
+        from modules.text_processor import TextProcessor
+
+        def no_punkt(language):
+            raise AssertionError("punkt must not be used in regex mode")
+
+        monkeypatch.setattr(text_processor, "sentence_tokenizer", no_punkt)
+        sentences = TextProcessor(segmenter="regex")._extract_sentences(WRAPPED, "en")
+
+        assert list(sentences) == [" ".join(s.split()) for s in self._split("en", WRAPPED)]
+
+    def test_languages_without_punkt_model_use_regex(self, processor, monkeypatch):
+        from modules import text_processor
+
+        def no_punkt(language):
+            raise AssertionError("punkt must not be used for zh")
+
+        monkeypatch.setattr(text_processor, "sentence_tokenizer", no_punkt)
+
+        assert list(processor._extract_sentences("调查结果公布了。网络需要投资！", "zh")) == [
+            "调查结果公布了。",
+            "网络需要投资！",
+        ]
@@ -82,3 +82,466 @@ class TestWebScraperIntegration:
         scraper = WebScraper()
         with pytest.raises(Exception, match=r"(?i)(ssrf|blocked|private|local|forbidden|refused)"):
             scraper.scrape_article("http://169.254.169.254/latest/meta-data/")
+
+
+JSON_LD_BODY = " ".join(
+    f"Paragraph {i} explains how structured data lets publishers ship the full article text."
+    for i in range(20)
+)
+
+JSON_LD_HTML = f"""
+<html>
+<head>
+<title>Site name | Headline</title>
+<script type="application/ld+json">
+{{"@context": "https://schema.org", "@graph": [
+  {{"@type": "WebSite", "name": "Example"}},
+  {{"@type": "NewsArticle", "headline": "Structured Headline",
+    "author": [{{"@type": "Person", "name": "Ada Lovelace"}}],
+    "datePublished": "2025-01-02T10:00:00Z",
+    "articleBody": "{JSON_LD_BODY}"}}
+]}}
+</script>
+</head>
+<body><nav>Home About</nav><article><p>Teaser only.</p></article></body>
+</html>
+"""
+
+
+class TestStructuredDataFastPath:
+    def test_json_ld_body_skips_dom_cascade(self, monkeypatch):
+        from bs4 import BeautifulSoup
+
+        from modules.web_scraper import WebScraper
+
+        scraper = WebScraper()
+        monkeypatch.setattr(
+            scraper,
+            "_extract_semantic_content",
+            lambda soup: pytest.fail("DOM cascade should be skipped"),
+        )
+        result = scraper._extract_content(
+            BeautifulSoup(JSON_LD_HTML, "html.parser"), "https://example.com/a"
+        )
+
+        assert result["extraction_method"] == "structured_data_json_ld"
+        assert result["content"] == JSON_LD_BODY
+        assert result["title"] == "Structured Headline"
+        assert result["author"] == "Ada Lovelace"
+        assert result["publish_date"] == "2025-01-02T10:00:00Z"
+
+    def test_teaser_body_falls_back_to_dom_but_keeps_metadata(self):
+        from bs4 import BeautifulSoup
+
+        from modules.web_scraper import WebScraper
+
+        html = JSON_LD_HTML.replace(JSON_LD_BODY, "Short teaser.").replace(
+            "<p>Teaser only.</p>", f"<p>{SAMPLE_HTML}</p>"
+        )
+        result = WebScraper()._extract_content(
+            BeautifulSoup(html, "html.parser"), "https://example.com/a"
+        )
+
+        assert not result["extraction_method"].startswith("structured_data")
+        assert result["author"] == "Ada Lovelace"
+
+    def test_microdata_article_body(self):
+        from bs4 import BeautifulSoup
+
+        from modules.structured_data import extract_structured_data
+
+        html = (
+            '<div itemscope itemtype="https://schema.org/Article">'
+            '<h1 itemprop="headline">Micro headline</h1>'
+            '<div itemprop="articleBody"><p>First paragraph.</p><p>Second one.</p></div>'
+            "</div>"
+        )
+        data = extract_structured_data(BeautifulSoup(html, "html.parser"))
+
+        assert data["title"] == "Micro headline"
+        assert data["content"] == "First paragraph.\n\nSecond one."
+        assert data["source"] == "microdata"
+
+
+HEAVY_HTML = (
+    '<html><head><title>Heavy</title><link rel="amphtml" href="/news/story/amp">'
+    "<script>" + "x" * 200_000 + "</script></head><body><p>Heavy page body.</p></body></html>"
+)
+
+
+class TestLightVariant:
+    def test_find_variant_link_prefers_amp(self):
+        from modules.light_variant import find_variant_link
+
+        head = (
+            b'<head><link rel="alternate" media="print" href="/print/1">'
+            b"<link rel='amphtml' href='https://amp.example.com/news/1'></head>"
+        )
+        assert find_variant_link(head, "https://example.com/news/1") == (
+            "https://amp.example.com/news/1",
+            "amp",
+        )
+
+    def test_learned_rule_rewrites_other_articles(self):
+        from modules.light_variant import VariantRuleMap
+
+        rules = VariantRuleMap()
+        rules.learn("https://example.com/news/one", "https://example.com/news/one/amp", "amp")
+
+        assert rules.predict("https://example.com/news/two") == (
+            "https://example.com/news/two/amp",
+            "amp",
+        )
+        assert rules.predict("https://other.com/news/two") is None
+
+    def test_scrape_abandons_heavy_page_for_amp(self, monkeypatch):
+        import requests
+
+        from config import config
+        from modules import web_scraper
+        from modules.light_variant import VariantRuleMap
+
+        requested = []
+
+        class Response:
+            status_code = 200
+            headers = {"Content-Type": "text/html; charset=utf-8"}
+            encoding = "utf-8"
+
+            def __init__(self, url, body):
+                self.url = url
+                self._body = body.encode("utf-8")
+                self.closed = False
+
+            def raise_for_status(self):
+                pass
+
+            def iter_content(self, chunk_size=65536):
+                for i in range(0, len(self._body), chunk_size):
+                    yield self._body[i : i + chunk_size]
+
+            def close(self):
+                self.closed = True
+
+            @property
+            def text(self):
+                return self._content.decode("utf-8")
+
+            @property
+            def content(self):
+                return self._content
+
+        def fake_get(self, url, **kwargs):
+            requested.append(url)
+            body = HEAVY_HTML if url.endswith("/story") else SAMPLE_HTML
+            return Response(url, body)
+
+        monkeypatch.setattr(requests.Session, "get", fake_get)
+        monkeypatch.setattr(web_scraper, "_check_ssrf", lambda url: None)
+        monkeypatch.setattr(web_scraper, "variant_rules", VariantRuleMap())
+        monkeypatch.setattr(config.scraping, "prefer_light_variant", True)
+
+        scraper = web_scraper.WebScraper()
+        result = scraper.scrape_article("https://example.com/news/story")
+
+        assert requested == ["https://example.com/news/story", "https://example.com/news/story/amp"]
+        assert result["variant_url"] == "https://example.com/news/story/amp"
+        assert result["extraction_method"].endswith("+amp")
+        assert result["url"] == "https://example.com/news/story"
+
+        requested.clear()
+        scraper.scrape_article("https://example.com/news/other")
+        assert requested == ["https://example.com/news/other/amp"]
+
+    def test_refetch_after_unusable_variant_falls_back_to_wayback_on_403(self, monkeypatch):
+        import requests
+
+        from config import config
+        from modules import web_scraper
+        from modules.light_variant import VariantRuleMap
+
+        story = "https://example.com/news/story"
+        requested = []
+
+        class Response:
+            headers = {"Content-Type": "text/html; charset=utf-8"}
+            encoding = "utf-8"
+
+            def __init__(self, url, status_code, body=""):
+                self.url = url
+                self.status_code = status_code
+                self._body = body.encode("utf-8")
+
+            def raise_for_status(self):
+                if self.status_code >= 400:
+                    raise requests.HTTPError(f"{self.status_code}", response=self)
+
+            def iter_content(self, chunk_size=65536):
+                yield self._body
+
+            def close(self):
+                pass
+
+        def fake_get(self, url, **kwargs):
+            requested.append(url)
+            if url.endswith("/amp"):
+                return Response(url, 404)
+            # Heavy page with an AMP link first, blocked on the re-fetch
+            return Response(url, 200, HEAVY_HTML) if len(requested) == 1 else Response(url, 403)
+
+        monkeypatch.setattr(requests.Session, "get", fake_get)
+        monkeypatch.setattr(web_scraper, "_check_ssrf", lambda url: None)
+        monkeypatch.setattr(web_scraper, "variant_rules", VariantRuleMap())
+        monkeypatch.setattr(config.scraping, "prefer_light_variant", True)
+        scraper = web_scraper.WebScraper()
+        monkeypatch.setattr(scraper, "_scrape_via_wayback", lambda url: {"url": url, "via": "wb"})
+
+        result = scraper.scrape_article(story)
+
+        assert requested == [story, f"{story}/amp", story]
+        assert result == {"url": story, "via": "wb"}
+
+
+class TestPrestripHtml:
+    def test_removes_inline_blobs_but_keeps_json_ld(self):
+        from modules.web_scraper import _prestrip_html
+
+        raw = (
+            b"<html><head><STYLE>.a{}</STYLE>"
+            b'<script type="application/ld+json">{"@type": "NewsArticle"}</script>'
+            b"<script>var s = '<p>not text</p>';</script><!-- <script>x</script> --></head>"
+            b'<body><svg viewBox="0 0 1 1"><text>icon</text></svg><p>Body text.</p></body></html>'
+        )
+        stripped = _prestrip_html(raw, "utf-8")
+
+        assert b"ld+json" in stripped and b"NewsArticle" in stripped
+        for fragment in (b".a{}", b"not text", b"<!--", b"icon"):
+            assert fragment not in stripped
+        assert b"<p>Body text.</p>" in stripped
+
+    def test_custom_elements_are_not_stripped(self):
+        from modules.web_scraper import _prestrip_html
+
+        raw = (
+            b'<svg-icon name="menu"></svg-icon><script-loader src="a.js"></script-loader>'
+            b"<p>Kept text.</p><svg><text>icon</text></svg><script>x()</script>"
+        )
+        stripped = _prestrip_html(raw, "utf-8")
+
+        assert b"<p>Kept text.</p>" in stripped
+        assert b"<svg-icon" in stripped and b"<script-loader" in stripped
+        assert b"icon</text>" not in stripped and b"x()" not in stripped
+
+    def test_self_closing_tag_does_not_pair_with_later_close(self):
+        from modules.web_scraper import _prestrip_html
+
+        raw = b'<svg class="logo"/><p>Between the icons.</p><svg><text>icon</text></svg>'
+        stripped = _prestrip_html(raw, "utf-8")
+
+        assert stripped == b"<p>Between the icons.</p>"
+
+    def test_wide_encodings_are_left_untouched(self):
+        from modules.web_scraper import _prestrip_html
+
+        raw = "<script>x</script><p>hi</p>".encode("utf-16")
+        assert _prestrip_html(raw, "UTF-16") == raw
+
+
+def _page_html(body: str, links: str = "") -> str:
+    paragraph = f"<p>{body} " + "This page continues the long investigative report. " * 12 + "</p>"
+    return f"<html><head><title>Report</title></head><body><article>{paragraph}</article><nav>{links}</nav></body></html>"
+
+
+class TestPagination:
+    def test_find_pagination_links_orders_and_filters(self):
+        from bs4 import BeautifulSoup
+
+        from modules.pagination import find_pagination_links
+
+        html = (
+            '<link rel="next" href="/story?page=2">'
+            '<a href="/story?page=3">3</a><a href="/story?page=2">2</a>'
+            '<a href="/other?page=2">other</a><a href="https://evil.com/story?page=4">x</a>'
+            '<a href="/news/page/9">archive</a><a href="/story/123">related</a>'
+        )
+        links = find_pagination_links(
+            BeautifulSoup(html, "html.parser"), "https://example.com/story"
+        )
+
+        assert links == ["https://example.com/story?page=2", "https://example.com/story?page=3"]
+
+    def test_rel_next_to_adjacent_post_is_ignored(self):
+        from bs4 import BeautifulSoup
+
+        from modules.pagination import find_pagination_links, same_article
+
+        # WordPress-style: rel="next" on the next post, and on the post's own page 2
+        html = (
+            '<link rel="next" href="/2024/05/this-post/2/">'
+            '<a rel="next" href="/2024/05/next-post/">Next post</a>'
+        )
+        links = find_pagination_links(
+            BeautifulSoup(html, "html.parser"), "https://blog.example/2024/05/this-post/"
+        )
+
+        assert links == ["https://blog.example/2024/05/this-post/2/"]
+        # From page 2, page 3 is still the same article
+        assert same_article("https://example.com/story/p/3", "https://example.com/story/p/2")
+        assert not same_article("https://blog.example/about/", "https://blog.example/")
+
+    def test_trailing_article_id_is_not_a_page_root(self):
+        from modules.pagination import same_article
+
+        assert same_article("https://example.com/news/42/2", "https://example.com/news/42")
+        assert not same_article(
+            "https://example.com/news/other-story", "https://example.com/news/42"
+        )
+        assert not same_article("https://example.com/news/43", "https://example.com/news/42")
+
+    def test_single_post_with_next_post_link_is_not_stitched(self, monkeypatch):
+        import requests
+
+        from modules import web_scraper
+
+        post = "https://blog.example/2024/05/this-post/"
+        html = _page_html(
+            "This post stands alone.", '<a rel="next" href="/2024/05/next-post/">Next post</a>'
+        )
+        requested = []
+
+        class Response:
+            status_code = 200
+            headers = {"Content-Type": "text/html; charset=utf-8"}
+            encoding = "utf-8"
+
+            def __init__(self, url):
+                self.url = url
+                self.content = self._content = html.encode("utf-8")
+
+            def raise_for_status(self):
+                pass
+
+            def iter_content(self, chunk_size=65536):
+                yield self._content
+
+        def fake_get(self, url, **kwargs):
+            requested.append(url)
+            return Response(url)
+
+        monkeypatch.setattr(requests.Session, "get", fake_get)
+        monkeypatch.setattr(web_scraper, "_check_ssrf", lambda url: None)
+
+        result = web_scraper.WebScraper().scrape_article(post)
+
+        assert requested == [post]
+        assert "page_count" not in result
+
+    def test_structured_data_body_is_not_stitched(self, monkeypatch):
+        from modules.web_scraper import WebScraper
+
+        scraper = WebScraper()
+        monkeypatch.setattr(scraper, "_load_page", lambda *args: pytest.fail("page fetched"))
+        first = {
+            "content": "Full text of every page.",
+            "extraction_method": "structured_data_json_ld",
+        }
+
+        result = scraper._stitch_pages(
+            first, "https://example.com/story", ["https://example.com/story?page=2"], {}
+        )
+
+        assert result is first and "page_count" not in result
+
+    def test_page_body_already_in_first_page_is_dropped(self, monkeypatch):
+        from modules.web_scraper import WebScraper
+
+        url = "https://example.com/story"
+        bodies = {
+            f"{url}?page=2": "Page two\n  follows.",
+            f"{url}?page=3": "Page three ends.",
+        }
+        scraper = WebScraper()
+        monkeypatch.setattr(
+            scraper,
+            "_load_page",
+            lambda page_url, headers: {"content": bodies[page_url], "links": []},
+        )
+        first = {"content": "Page one opens. Page two follows.", "extraction_method": "trafilatura"}
+
+        result = scraper._stitch_pages(first, url, list(bodies), {})
+
+        assert result["page_urls"] == [url, f"{url}?page=3"]
+        assert result["content"].count("Page two") == 1
+
+    def test_page_cache_is_bounded(self, monkeypatch):
+        from config import config
+        from modules.web_scraper import WebScraper
+
+        monkeypatch.setattr(config.scraping, "page_cache_size", 2)
+        scraper = WebScraper()
+        for key in ("a", "b", "c"):
+            scraper._remember_page(key, {"content": key, "links": []})
+
+        assert list(scraper._page_cache) == ["b", "c"]
+
+    def test_pages_fetched_stitched_and_cached_per_page(self, monkeypatch, tmp_path):
+        import requests
+
+        from modules import web_scraper
+        from modules.cache import FilesystemCacheBackend
+
+        pages = {
+            "https://example.com/story": _page_html(
+                "Page one opens.", '<a href="?page=2">2</a><a href="?page=3">3</a>'
+            ),
+            "https://example.com/story?page=2": _page_html("Page two follows."),
+            "https://example.com/story?page=3": _page_html("Page three ends."),
+        }
+        requested = []
+
+        class Response:
+            status_code = 200
+            headers = {"Content-Type": "text/html; charset=utf-8"}
+            encoding = "utf-8"
+
+            def __init__(self, url):
+                self.url = url
+                self.content = self._content = pages[url].encode("utf-8")
+
+            def raise_for_status(self):
+                pass
+
+            def iter_content(self, chunk_size=65536):
+                yield self._content
+
+        def fake_get(self, url, **kwargs):
+            requested.append(url)
+            return Response(url)
+
+        monkeypatch.setattr(requests.Session, "get", fake_get)
+        monkeypatch.setattr(web_scraper, "_check_ssrf", lambda url: None)
+        backend = FilesystemCacheBackend(cache_dir=str(tmp_path))
+
+        result = web_scraper.WebScraper(cache_backend=backend).scrape_article(
+            "https://example.com/story"
+        )
+
+        content = result["content"]
+        assert result["page_count"] == 3
+        assert content.index("Page one") < content.index("Page two") < content.index("Page three")
+        assert sorted(requested) == sorted(pages)
+
+        # A new page appears: only page 1 (discovery root) and the new page are fetched
+        pages["https://example.com/story"] = _page_html(
+            "Page one opens.",
+            '<a href="?page=2">2</a><a href="?page=3">3</a><a href="?page=4">4</a>',
+        )
+        pages["https://example.com/story?page=4"] = _page_html("Page four appended.")
+        requested.clear()
+
+        result = web_scraper.WebScraper(cache_backend=backend).scrape_article(
+            "https://example.com/story"
+        )
+
+        assert result["page_count"] == 4
+        assert requested == ["https://example.com/story", "https://example.com/story?page=4"]